@@ -0,0 +1,6 @@
+"""Allow running the CLI with `python -m grove_cli`."""
+
+from . import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""AI agent execution and interactive agent selection."""
+
+import subprocess
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import typer
+
+from .config import AGENT_CONFIG
+from .tools import check_tool
+from .ui import console
+
+def select_agent_interactive() -> str:
+    """
+    Interactively select an AI agent from available options.
+
+    Returns:
+        Selected agent name
+    """
+    console.print("\n[bold cyan]Select AI Agent:[/bold cyan]")
+
+    # Get available agents (only claude for now)
+    available_agents = ["claude"]
+
+    if len(available_agents) == 1:
+        # Only one agent available, auto-select
+        agent = available_agents[0]
+        console.print(f"[dim]Auto-selecting {AGENT_CONFIG[agent]['name']}[/dim]")
+        return agent
+
+    # Display options
+    for idx, agent in enumerate(available_agents, 1):
+        agent_info = AGENT_CONFIG[agent]
+        console.print(f"  {idx}. {agent_info['name']}")
+
+    # Get user input
+    while True:
+        try:
+            choice = console.input("[cyan]Enter number (1-{}): [/cyan]".format(len(available_agents)))
+            choice_num = int(choice)
+            if 1 <= choice_num <= len(available_agents):
+                selected = available_agents[choice_num - 1]
+                console.print(f"[green]✓[/green] Selected {AGENT_CONFIG[selected]['name']}")
+                return selected
+            else:
+                console.print("[red]Invalid choice. Please try again.[/red]")
+        except (ValueError, KeyboardInterrupt):
+            console.print("\n[yellow]Selection cancelled[/yellow]")
+            raise typer.Exit(1)
+
+# Extra instructions appended to the implement prompt
+CLAUDE_IMPLEMENT_SUFFIX = """
+
+Spawn async subagent to monitor file changes and update documentation:
+
+Your task is to run in the background and monitor for file changes during implementation. When you detect changes:
+
+1. **For new files**:
+   - Generate documentation in `.grove/docs/` following the project structure
+   - Use the same format as existing docs (Purpose, Key Functions/Classes, Dependencies, Change History)
+   - Place docs in the correct subdirectory mirroring source structure
+
+2. **For modified files**:
+   - Append change history entry with timestamp and description
+   - Update the file documentation if significant changes occurred
+
+3. **For deleted files**:
+   - Append deletion note to the corresponding documentation
+
+Continue monitoring until the main implementation task completes, then notify completion.
+"""
+
+TASK_DOCS_IMPLEMENT_SUFFIX = """
+
+IMPORTANT - Documentation Update:
+
+After completing each task, update the documentation:
+
+1. List files you changed
+2. Update corresponding documentation in `.grove/docs/`:
+   - New files: Create new documentation
+   - Modified files: Append change entry to Change History section
+   - Deleted files: Add deletion note to documentation
+3. Proceed to next task
+"""
+
+# How each agent with CLI integration is invoked; the prompt is appended to argv
+AGENT_INVOCATIONS = {
+    "claude": {"tool": "claude", "argv": ["claude", "--print"], "label": "Claude Code", "implement_suffix": CLAUDE_IMPLEMENT_SUFFIX},
+    "codex": {"tool": "codex", "argv": ["codex", "run", "--command"], "label": "Codex", "implement_suffix": TASK_DOCS_IMPLEMENT_SUFFIX},
+    "gemini": {"tool": "gemini", "argv": ["gemini-cli", "execute"], "label": "Gemini CLI", "implement_suffix": TASK_DOCS_IMPLEMENT_SUFFIX},
+}
+
+class AgentExecutionError(RuntimeError):
+    """Agent CLI exited with an error; `stderr` holds its error output."""
+
+    def __init__(self, message: str, stderr: str = ""):
+        super().__init__(message)
+        self.stderr = stderr
+
+class AgentRun(NamedTuple):
+    """Outcome of running one slash command through an agent CLI."""
+
+    output_path: Path
+    stdout: str
+    stderr: str
+
+class AgentExecutor:
+    """Execute commands with specific AI agent."""
+
+    def __init__(self, agent_name: str, project_dir: Path):
+        """
+        Initialize AgentExecutor.
+
+        Args:
+            agent_name: Agent name (claude, codex, gemini, etc.)
+            project_dir: Project directory path
+        """
+        if agent_name not in AGENT_CONFIG:
+            raise ValueError(f"Unknown agent: {agent_name}")
+
+        self.agent = agent_name
+        self.config = AGENT_CONFIG[agent_name]
+        self.project_dir = project_dir
+
+    def build_prompt(self, command: str, prompt: str = "", template_content: Optional[str] = None) -> str:
+        """Build the slash-command prompt sent to the agent CLI."""
+        slash_command = f"/grove.{command}"
+
+        # Add template content if provided
+        if template_content:
+            slash_command += f"\n\nTemplate:\n{template_content}"
+
+        if prompt:
+            slash_command += f"\n\n{prompt}"
+
+        # Add documentation instructions for implement command
+        if command == "implement" and self.agent in AGENT_INVOCATIONS:
+            slash_command += AGENT_INVOCATIONS[self.agent]["implement_suffix"]
+
+        return slash_command
+
+    def run(self, command: str, prompt: str = "", template_content: Optional[str] = None) -> AgentRun:
+        """
+        Run agent command without printing anything.
+
+        The agent runs with the project directory as its working directory;
+        the caller's working directory is never changed, so several projects
+        can be driven from one interpreter.
+
+        Args:
+            command: Command name (constitution, specify, plan, etc.)
+            prompt: Additional prompt text
+            template_content: Template content to include in prompt (if enabled)
+
+        Returns:
+            AgentRun with the expected output path and the CLI's output
+
+        Raises:
+            RuntimeError: If the agent CLI is missing, fails, or has no CLI integration
+        """
+        if self.agent not in AGENT_INVOCATIONS:
+            raise RuntimeError(f"Generic execution for {self.agent} not fully implemented; run /grove.{command} manually")
+
+        invocation = AGENT_INVOCATIONS[self.agent]
+        if not check_tool(invocation["tool"]):
+            raise RuntimeError(f"{self.config['name']} is not installed. Install from: {self.config['install_url']}")
+
+        try:
+            result = subprocess.run(
+                [*invocation["argv"], self.build_prompt(command, prompt, template_content)],
+                cwd=self.project_dir,
+                check=True,
+                capture_output=True,
+                text=True
+            )
+        except subprocess.CalledProcessError as e:
+            raise AgentExecutionError(f"{invocation['label']} execution failed: {e}", e.stderr or "") from e
+
+        return AgentRun(self._get_output_path(command), result.stdout or "", result.stderr or "")
+
+    def execute(self, command: str, prompt: str = "", template_content: Optional[str] = None) -> Path:
+        """
+        Execute agent command and return output file path.
+
+        Args:
+            command: Command name (constitution, specify, plan, etc.)
+            prompt: Additional prompt text
+            template_content: Template content to include in prompt (if enabled)
+
+        Returns:
+            Path to generated output file
+
+        Raises:
+            RuntimeError: If execution fails
+        """
+        console.print(f"[cyan]Executing /{command} with {self.config['name']}...[/cyan]")
+
+        if self.agent not in AGENT_INVOCATIONS:
+            return self._execute_generic(command, prompt, template_content)
+
+        try:
+            run = self.run(command, prompt, template_content)
+        except AgentExecutionError as e:
+            console.print(f"[red]Error executing {AGENT_INVOCATIONS[self.agent]['label']}:[/red] {e.__cause__}")
+            if e.stderr and self.agent == "claude":
+                console.print(f"[dim]{e.stderr}[/dim]")
+            raise
+
+        console.print(f"[green]✓[/green] Command completed")
+
+        # Display Claude's output
+        if self.agent == "claude" and run.stdout:
+            console.print(f"\n[dim]{run.stdout}[/dim]")
+
+        return run.output_path
+
+    def _execute_generic(self, command: str, _prompt: str = "", _template_content: Optional[str] = None) -> Path:
+        """Generic execution for other agents (placeholder)."""
+        console.print(f"[yellow]Warning:[/yellow] Generic execution for {self.agent} not fully implemented")
+        console.print(f"[yellow]Please manually run:[/yellow] /grove.{command}")
+
+        # Return expected output path
+        return self._get_output_path(command)
+
+    def _get_output_path(self, command: str) -> Path:
+        """Get output path for command based on responsibility separation architecture."""
+        if command == "constitution":
+            return self.project_dir / ".claude" / "rules" / "constitution.md"
+        elif command in ["specify", "plan", "tasks"]:
+            # TODO: Determine feature-id from git branch or environment variable
+            feature_id = "current"
+            specs_dir = self.project_dir / ".grove" / "specs" / feature_id
+            return specs_dir / f"{command}.md"
+        elif command == "implement":
+            # implement doesn't generate a file, executes implementation
+            return self.project_dir
+        else:
+            return self.project_dir / f"{command}.md"
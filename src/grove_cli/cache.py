@@ -0,0 +1,577 @@
+"""Per-user caches for release template assets and release metadata.
+
+Template zips are stored once under the platformdirs cache directory
+(`$GROVE_CACHE_DIR` overrides it) and looked up by release tag, asset name and
+SHA-256, so initialising again from a release that was already downloaded
+transfers no asset bytes:
+
+    <cache>/assets/index.json          tag/asset -> sha256, size, last use
+    <cache>/assets/blobs/<sha256>      archive contents
+
+The cache is bounded by `$GROVE_CACHE_MAX_MB` (default 512); least recently
+used assets are evicted first.
+
+`releases/latest` responses are kept in `<cache>/releases.json` with their
+ETag, reused for `$GROVE_RELEASE_TTL` seconds (default 600) and then
+revalidated with `If-None-Match`.
+
+The last `X-RateLimit-*` values seen per host and token are kept in
+`<cache>/ratelimits.json` (see grove_cli.ratelimit).
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+CACHE_DIR_ENV = "GROVE_CACHE_DIR"
+CACHE_MAX_ENV = "GROVE_CACHE_MAX_MB"
+DEFAULT_MAX_MB = 512
+
+CACHE_ACTIONS = ["list", "warm", "prune"]
+
+# `grove mirror` serves this cache over HTTP (see grove_cli.mirror)
+MIRROR_ACTIONS = ["serve"]
+DEFAULT_MIRROR_PORT = 8787
+
+_PARTIAL_PREFIX = ".partial-"
+_LOCK_SUFFIX = ".lock"
+
+# Partial downloads touched more recently than this are kept by prune() so
+# that they can still be resumed
+_PARTIAL_MAX_AGE = 24 * 3600
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory ($GROVE_CACHE_DIR or the platformdirs default)."""
+    override = os.getenv(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("grove"))
+
+def default_max_bytes() -> int:
+    """Return the asset cache size limit from $GROVE_CACHE_MAX_MB."""
+    try:
+        megabytes = float(os.getenv(CACHE_MAX_ENV, DEFAULT_MAX_MB))
+    except ValueError:
+        megabytes = DEFAULT_MAX_MB
+    return int(megabytes * 1024 * 1024)
+
+# In-process half of `_file_lock`, one per lock file: flock() does not
+# exclude threads on every platform, and every `AssetCache()` instance must
+# share it
+_thread_locks: Dict[str, threading.Lock] = {}
+_thread_locks_guard = threading.Lock()
+
+def _thread_lock(path: Path) -> threading.Lock:
+    with _thread_locks_guard:
+        return _thread_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+def _lock_fd(fd: int, wait: bool) -> bool:
+    if os.name == "nt":
+        import msvcrt
+
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                if not wait:
+                    return False
+                time.sleep(0.05)
+    import fcntl
+
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | (0 if wait else fcntl.LOCK_NB))
+    except BlockingIOError:
+        return False
+    return True
+
+def _unlock_fd(fd: int) -> None:
+    if os.name == "nt":
+        import msvcrt
+
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+@contextmanager
+def _file_lock(path: Path, *, wait: bool = True, required: bool = True) -> Iterator[bool]:
+    """Hold an exclusive lock on the lock file `path` (created if missing) for the block.
+
+    Threads are excluded by an in-process lock per path, other processes by
+    flock (msvcrt.locking on Windows) on the file itself.
+
+    Args:
+        path: Lock file
+        wait: Block until the lock is free; otherwise yield False at once if it is taken
+        required: Raise if the lock file cannot be created; otherwise (a
+            read-only cache) only exclude other threads
+
+    Yields:
+        Whether the lock is held
+    """
+    thread_lock = _thread_lock(path)
+    if not thread_lock.acquire(blocking=wait):
+        yield False
+        return
+    try:
+        fd = _open_locked(path, wait=wait, required=required)
+    except BaseException:
+        thread_lock.release()
+        raise
+    if fd is False:
+        thread_lock.release()
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        if fd is not None:
+            try:
+                _unlock_fd(fd)
+            finally:
+                os.close(fd)
+        thread_lock.release()
+
+def _open_locked(path: Path, *, wait: bool, required: bool) -> int | bool | None:
+    """Open and lock `path`; return its descriptor, None if it cannot be created (and is not required) or False if taken."""
+    while True:
+        try:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            if required:
+                raise
+            return None
+        if not _lock_fd(fd, wait):
+            os.close(fd)
+            return False
+        # The holder we waited for may have deleted the lock file; then lock the current one
+        try:
+            if os.path.samestat(os.fstat(fd), os.stat(path)):
+                return fd
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+
+def write_atomic(path: Path, text: str) -> None:
+    """Replace `path` with `text` through a temporary file, so readers never see a partial write."""
+    import tempfile
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name.lstrip('.')}-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+@contextmanager
+def _locked_file(path: Path, lock_name: str) -> Iterator[None]:
+    """Hold `lock_name` next to `path` for a load -> modify -> save of it, across instances and processes."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        pass  # read-only cache: reads still work
+    with _file_lock(path.parent / lock_name, required=False):
+        yield
+
+def sha256_file(path: Path) -> str:
+    import hashlib
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CacheEntry(NamedTuple):
+    """One cached release asset."""
+
+    tag: str
+    name: str
+    sha256: str
+    size: int
+    last_used: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.tag}/{self.name}"
+
+
+class AssetCache:
+    """Size-bounded LRU store of release assets, addressed by content hash.
+
+    Several `tag/asset` keys may point at the same blob; a blob is deleted
+    only when no key references it any more.
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: Optional[int] = None):
+        """
+        Args:
+            root: Cache directory (default: `<user cache dir>/assets`)
+            max_bytes: Size limit (default: $GROVE_CACHE_MAX_MB)
+        """
+        self.root = Path(root) if root else default_cache_dir() / "assets"
+        self.max_bytes = default_max_bytes() if max_bytes is None else max_bytes
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / "index.json"
+
+    @property
+    def blobs_dir(self) -> Path:
+        return self.root / "blobs"
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.blobs_dir / sha256
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the index lock, shared by every instance and process using this cache directory.
+
+        Every load -> modify -> save of the index happens under it, so
+        concurrent `store()` calls (parallel downloads, parallel inits) cannot
+        drop each other's entries.
+        """
+        with _locked_file(self.index_path, ".index.lock"):
+            yield
+
+    def _load(self) -> Dict[str, CacheEntry]:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        entries = {}
+        for raw in data.get("entries", []):
+            try:
+                entry = CacheEntry(raw["tag"], raw["name"], raw["sha256"], int(raw["size"]), float(raw["last_used"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+            entries[entry.key] = entry
+        return entries
+
+    def _save(self, entries: Dict[str, CacheEntry]) -> None:
+        data = {"version": 1, "entries": [e._asdict() for e in sorted(entries.values(), key=lambda e: e.key)]}
+        write_atomic(self.index_path, json.dumps(data, indent=2))
+
+    @staticmethod
+    def _size(entries: Dict[str, CacheEntry]) -> int:
+        return sum({e.sha256: e.size for e in entries.values()}.values())
+
+    def entries(self) -> List[CacheEntry]:
+        """Cached assets, most recently used first."""
+        with self._locked():
+            entries = self._load()
+        return sorted(entries.values(), key=lambda e: e.last_used, reverse=True)
+
+    def total_size(self) -> int:
+        """Bytes used by cached blobs (shared blobs counted once)."""
+        with self._locked():
+            return self._size(self._load())
+
+    def lookup(self, tag: str, name: str, sha256: Optional[str] = None) -> Optional[Path]:
+        """Return the cached file for `tag`/`name`, or None on a miss.
+
+        Args:
+            tag: Release tag
+            name: Asset file name
+            sha256: Expected digest if the release publishes one; a cached
+                asset with a different digest is a miss
+
+        Returns:
+            Path of the cached blob (do not modify or delete it)
+        """
+        with self._locked():
+            entries = self._load()
+            entry = entries.get(f"{tag}/{name}")
+            if entry is None or (sha256 and entry.sha256 != sha256):
+                return None
+            path = self.blob_path(entry.sha256)
+            try:
+                if path.stat().st_size != entry.size:
+                    return None
+            except OSError:
+                return None
+            entries[entry.key] = entry._replace(last_used=time.time())
+            try:
+                self._save(entries)
+            except OSError:
+                pass  # a read-only cache is still usable
+        return path
+
+    def partial_path(self, key: str) -> Path:
+        """Return where to download `key` (e.g. "tag/asset") before `store()`.
+
+        The path is stable per key, so an interrupted download can be resumed
+        from the bytes already there. Only write to it inside
+        `partial_download()`, which makes sure nobody else does.
+        """
+        import hashlib
+
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        return self.blobs_dir / f"{_PARTIAL_PREFIX}{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}"
+
+    @staticmethod
+    def _partial_lock(partial: Path) -> Path:
+        return partial.with_name(partial.name + _LOCK_SUFFIX)
+
+    @contextmanager
+    def partial_download(self, key: str, *, wait: bool = True) -> Iterator[Optional[Path]]:
+        """Own the resume file of `key` for the block (download into it, then `store()` it).
+
+        Another thread or process downloading the same asset holds the lock
+        until it is done, so writes never interleave. After waiting, check
+        `lookup()` again: the other download has usually stored the asset.
+
+        Args:
+            key: Asset key, e.g. "tag/asset"
+            wait: Block while the asset is being downloaded elsewhere;
+                otherwise yield None at once
+
+        Yields:
+            `partial_path(key)`, or None if not waiting and the lock is taken
+
+        Raises:
+            OSError: If the cache directory is not writable
+        """
+        partial = self.partial_path(key)
+        lock = self._partial_lock(partial)
+        with _file_lock(lock, wait=wait) as held:
+            if not held:
+                yield None
+                return
+            try:
+                yield partial
+            finally:
+                if not partial.exists():
+                    # Stored or discarded; a waiter sees the lock file go and takes a new one
+                    lock.unlink(missing_ok=True)
+
+    def store(self, tag: str, name: str, source: Path, sha256: Optional[str] = None) -> Path:
+        """Move `source` into the cache under `tag`/`name` and evict down to the size limit.
+
+        Args:
+            tag: Release tag
+            name: Asset file name
+            source: Downloaded file; it is consumed (moved or deleted)
+            sha256: Digest of `source` if already computed while downloading
+
+        Returns:
+            Path of the cached blob
+        """
+        sha256 = sha256 or sha256_file(source)
+        size = source.stat().st_size
+        blob = self.blob_path(sha256)
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        if blob.exists():
+            source.unlink()
+        else:
+            import shutil
+
+            shutil.move(str(source), blob)
+
+        with self._locked():
+            entries = self._load()
+            entry = CacheEntry(tag, name, sha256, size, time.time())
+            entries[entry.key] = entry
+            self._evict(entries, self.max_bytes, keep=entry.key)
+            self._save(entries)
+        return blob
+
+    def _prune_partial(self, partial: Path) -> None:
+        """Delete a stale resume file and its lock file, unless a download is using them."""
+        try:
+            if partial.exists() and time.time() - partial.stat().st_mtime < _PARTIAL_MAX_AGE:
+                return
+        except OSError:
+            return
+        lock = self._partial_lock(partial)
+        with _file_lock(lock, wait=False) as held:
+            if held:
+                partial.unlink(missing_ok=True)
+                lock.unlink(missing_ok=True)
+
+    def _evict(self, entries: Dict[str, CacheEntry], max_bytes: int, keep: Optional[str] = None) -> List[CacheEntry]:
+        removed = []
+        for entry in sorted(entries.values(), key=lambda e: e.last_used):
+            if self._size(entries) <= max_bytes:
+                break
+            if entry.key == keep:
+                continue
+            del entries[entry.key]
+            removed.append(entry)
+            if not any(e.sha256 == entry.sha256 for e in entries.values()):
+                self.blob_path(entry.sha256).unlink(missing_ok=True)
+        return removed
+
+    def prune(self, max_bytes: Optional[int] = None, everything: bool = False) -> List[CacheEntry]:
+        """Evict down to `max_bytes` and delete orphaned blobs and partial downloads.
+
+        Args:
+            max_bytes: Target size (default: the cache's limit)
+            everything: Remove every cached asset
+
+        Returns:
+            Entries that were removed
+        """
+        limit = 0 if everything else (self.max_bytes if max_bytes is None else max_bytes)
+        with self._locked():
+            entries = self._load()
+            removed = [e for e in entries.values() if not self.blob_path(e.sha256).is_file()]
+            for entry in removed:
+                del entries[entry.key]
+            removed += self._evict(entries, limit)
+
+            referenced = {e.sha256 for e in entries.values()}
+            if self.blobs_dir.is_dir():
+                with os.scandir(self.blobs_dir) as it:
+                    blobs = sorted(it, key=lambda blob: blob.name)
+                for blob in blobs:
+                    if blob.name in referenced:
+                        continue
+                    if blob.name.startswith(_PARTIAL_PREFIX):
+                        if not blob.name.endswith(_LOCK_SUFFIX):
+                            self._prune_partial(Path(blob.path))
+                        elif not Path(blob.path[: -len(_LOCK_SUFFIX)]).exists():
+                            self._prune_partial(Path(blob.path[: -len(_LOCK_SUFFIX)]))
+                        continue
+                    Path(blob.path).unlink(missing_ok=True)
+            if entries or self.index_path.exists():
+                self._save(entries)
+        return removed
+
+# =============================================================================
+# Release metadata
+# =============================================================================
+
+RELEASE_TTL_ENV = "GROVE_RELEASE_TTL"
+DEFAULT_RELEASE_TTL = 600
+
+def default_release_ttl() -> float:
+    """Return how long cached release metadata is used without revalidation ($GROVE_RELEASE_TTL seconds)."""
+    try:
+        return max(0.0, float(os.getenv(RELEASE_TTL_ENV, DEFAULT_RELEASE_TTL)))
+    except ValueError:
+        return float(DEFAULT_RELEASE_TTL)
+
+
+class CachedRelease(NamedTuple):
+    """Release JSON as last returned by the API, with its validator."""
+
+    data: dict
+    etag: Optional[str]
+    fetched_at: float
+
+
+class ReleaseCache:
+    """Release metadata keyed by API URL, stored in `<cache>/releases.json`.
+
+    `fetched_at` is the last time the API confirmed the data (a 200 or a 304),
+    so revalidating with `If-None-Match` restarts the TTL.
+    """
+
+    def __init__(self, path: Optional[Path] = None, ttl: Optional[float] = None):
+        """
+        Args:
+            path: Cache file (default: `<user cache dir>/releases.json`)
+            ttl: Seconds before an entry needs revalidation (default: $GROVE_RELEASE_TTL or 600)
+        """
+        self.path = Path(path) if path else default_cache_dir() / "releases.json"
+        self.ttl = default_release_ttl() if ttl is None else ttl
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, url: str) -> Optional[CachedRelease]:
+        # Writers replace the file atomically, so reading needs no lock
+        raw = self._load().get(url)
+        try:
+            return CachedRelease(raw["data"], raw.get("etag"), float(raw["fetched_at"]))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def is_fresh(self, entry: CachedRelease) -> bool:
+        return time.time() - entry.fetched_at < self.ttl
+
+    def put(self, url: str, data: dict, etag: Optional[str]) -> None:
+        """Store a 200 response (or, with the cached data, record a 304)."""
+        with _locked_file(self.path, ".releases.lock"):
+            releases = self._load()
+            releases[url] = {"data": data, "etag": etag, "fetched_at": time.time()}
+            try:
+                write_atomic(self.path, json.dumps(releases))
+            except OSError:
+                pass  # caching is best effort
+
+# =============================================================================
+# Rate limits
+# =============================================================================
+
+
+class RateLimitState(NamedTuple):
+    """The last `X-RateLimit-*` values a server reported for one client identity."""
+
+    limit: int
+    remaining: int
+    reset: float    # epoch seconds when `remaining` goes back to `limit`
+    updated: float  # when these values were observed
+
+
+class RateLimitCache:
+    """Rate-limit state keyed by host and token, stored in `<cache>/ratelimits.json`.
+
+    Every grove process using the same cache directory (for example parallel
+    CI jobs on one runner) reads and updates the same entries, so each sees
+    the quota the others have used.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: Cache file (default: `<user cache dir>/ratelimits.json`)
+        """
+        self.path = Path(path) if path else default_cache_dir() / "ratelimits.json"
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, key: str) -> Optional[RateLimitState]:
+        raw = self._load().get(key)
+        try:
+            return RateLimitState(int(raw["limit"]), int(raw["remaining"]), float(raw["reset"]), float(raw["updated"]))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def put(self, key: str, state: RateLimitState) -> None:
+        # Locked across processes, so the newer-observation check below cannot race
+        with _locked_file(self.path, ".ratelimits.lock"):
+            entries = self._load()
+            current = entries.get(key)
+            # Keep whichever observation is newer (another process may have written since)
+            if isinstance(current, dict) and float(current.get("updated", 0)) > state.updated:
+                return
+            now = time.time()
+            entries = {k: v for k, v in entries.items() if isinstance(v, dict) and float(v.get("reset", 0)) > now}
+            entries[key] = state._asdict()
+            try:
+                write_atomic(self.path, json.dumps(entries))
+            except OSError:
+                pass  # caching is best effort
@@ -0,0 +1,5 @@
+"""Built-in `grove` subcommands.
+
+Each module defines one command function and is imported only when that
+command is invoked (see `grove_cli.registry`).
+"""
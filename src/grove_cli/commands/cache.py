@@ -0,0 +1,115 @@
+"""`grove cache` - inspect, fill and trim the per-user template asset cache."""
+
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+import typer
+
+from ..cache import CACHE_ACTIONS, AssetCache
+from ..config import SCRIPT_TYPE_CHOICES, SUPPORTED_AI_AGENTS
+from ..ui import console
+
+def _format_size(size: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+def _list(cache: AssetCache) -> None:
+    from rich.table import Table
+
+    entries = cache.entries()
+    if not entries:
+        console.print(f"[dim]Asset cache is empty ({cache.root})[/dim]")
+        return
+
+    table = Table(show_header=True, box=None, padding=(0, 2))
+    table.add_column("Release", style="cyan")
+    table.add_column("Asset", style="white")
+    table.add_column("SHA-256", style="dim")
+    table.add_column("Size", justify="right")
+    table.add_column("Last used", style="dim")
+    for entry in entries:
+        last_used = datetime.fromtimestamp(entry.last_used).strftime("%Y-%m-%d %H:%M")
+        table.add_row(entry.tag, entry.name, entry.sha256[:12], _format_size(entry.size), last_used)
+    console.print(table)
+    console.print()
+    console.print(f"[dim]{_format_size(cache.total_size())} of {_format_size(cache.max_bytes)} used in {cache.root}[/dim]")
+
+def _warm(agents: List[str], script_type: str, github_token: str, debug: bool) -> None:
+    from ..github import download_template_from_github
+
+    failed = []
+    with tempfile.TemporaryDirectory() as download_dir:
+        for agent in agents:
+            try:
+                _path, meta = download_template_from_github(
+                    agent,
+                    Path(download_dir),
+                    script_type=script_type,
+                    verbose=False,
+                    show_progress=True,
+                    debug=debug,
+                    github_token=github_token,
+                )
+            except typer.Exit:
+                failed.append(agent)
+                continue
+            state = "already cached" if meta["cache_hit"] else "downloaded"
+            console.print(f"[green]✓[/green] {agent}: {meta['filename']} ({meta['release']}, {state})")
+    if failed:
+        console.print(f"[red]Error:[/red] Could not cache templates for: {', '.join(failed)}")
+        raise typer.Exit(1)
+
+def _prune(cache: AssetCache, max_size: float, everything: bool) -> None:
+    max_bytes = None if max_size is None else int(max_size * 1024 * 1024)
+    removed = cache.prune(max_bytes=max_bytes, everything=everything)
+    for entry in removed:
+        console.print(f"[dim]Removed {entry.key} ({_format_size(entry.size)})[/dim]")
+    console.print(f"[green]✓[/green] Pruned {len(removed)} asset(s); {_format_size(cache.total_size())} in use")
+
+def cache(
+    action: str = typer.Argument("list", help=f"Action: {', '.join(CACHE_ACTIONS)}"),
+    ai: List[str] = typer.Option(None, "--ai", help="Agent(s) to warm (repeatable, default: all supported agents)"),
+    script_type: str = typer.Option(None, "--script", help="Script type to warm: sh or ps"),
+    max_size: float = typer.Option(None, "--max-size", help="Prune down to this many MB (default: $GROVE_CACHE_MAX_MB or 512)"),
+    everything: bool = typer.Option(False, "--all", help="Prune every cached asset"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network failures"),
+):
+    """
+    Manage the per-user cache of release template archives.
+
+    `grove init` stores every template zip it downloads here and reuses it
+    when the same release is requested again.
+
+    Examples:
+        grove cache list
+        grove cache warm --ai claude --ai codex
+        grove cache prune --max-size 100
+        grove cache prune --all
+    """
+    if action not in CACHE_ACTIONS:
+        console.print(f"[red]Error:[/red] Unknown action '{action}'. Choose from: {', '.join(CACHE_ACTIONS)}")
+        raise typer.Exit(1)
+
+    asset_cache = AssetCache()
+    if action == "list":
+        _list(asset_cache)
+    elif action == "warm":
+        agents = ai or SUPPORTED_AI_AGENTS
+        unknown = [agent for agent in agents if agent not in SUPPORTED_AI_AGENTS]
+        if unknown:
+            console.print(f"[red]Error:[/red] Invalid AI assistant '{unknown[0]}'. Choose from: {', '.join(SUPPORTED_AI_AGENTS)}")
+            raise typer.Exit(1)
+        script_type = script_type or ("ps" if os.name == "nt" else "sh")
+        if script_type not in SCRIPT_TYPE_CHOICES:
+            console.print(f"[red]Error:[/red] Invalid script type '{script_type}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES.keys())}")
+            raise typer.Exit(1)
+        _warm(agents, script_type, github_token, debug)
+    else:
+        _prune(asset_cache, max_size, everything)
@@ -0,0 +1,48 @@
+"""`grove completion` - generate a static shell completion script."""
+
+from pathlib import Path
+
+import typer
+
+from ..completion import SUPPORTED_SHELLS, completion_install_path, detect_shell, render_completion, write_completion_index
+from ..ui import console
+
+def completion(
+    shell: str = typer.Argument(None, help="Shell to generate completion for: bash, zsh or fish (default: $SHELL)"),
+    install: bool = typer.Option(False, "--install", help="Write the script to the shell's per-user completion directory"),
+):
+    """
+    Generate a static shell completion script.
+
+    The script contains every command, option, agent, language and script type,
+    so completion never starts Python. Project-specific values (such as
+    `grove sync --src`) come from `.grove/completion-index`, refreshed here and
+    on every `grove sync`.
+
+    Examples:
+        grove completion bash > ~/.local/share/bash-completion/completions/grove
+        grove completion --install
+        grove completion zsh --install
+    """
+    from .. import __version__
+
+    shell = shell or detect_shell()
+    if shell not in SUPPORTED_SHELLS:
+        console.print(f"[red]Error:[/red] Unsupported or undetected shell '{shell or ''}'. Choose from: {', '.join(SUPPORTED_SHELLS)}")
+        raise typer.Exit(1)
+
+    script = render_completion(shell, __version__)
+    write_completion_index(Path.cwd())
+
+    if not install:
+        typer.echo(script, nl=False)
+        return
+
+    target = completion_install_path(shell)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(script, encoding="utf-8")
+    console.print(f"[green]✓[/green] {shell} completion installed to {target}")
+    if shell == "zsh":
+        console.print(f"[dim]Make sure {target.parent} is on your fpath, e.g. add to ~/.zshrc:[/dim]")
+        console.print("[cyan]fpath=(~/.zfunc $fpath); autoload -Uz compinit && compinit[/cyan]")
+    console.print("[dim]Open a new shell to start using it.[/dim]")
@@ -0,0 +1,485 @@
+"""`grove init` - create a new Grove project from the latest template."""
+
+import os
+import shlex
+import sys
+import threading
+from concurrent.futures import as_completed, wait
+from pathlib import Path
+from typing import List
+
+import typer
+from rich.panel import Panel
+
+from ..config import AGENT_CONFIG, LANGUAGE_NAMES, SCRIPT_TYPE_CHOICES, SUPPORTED_AI_AGENTS, SUPPORTED_LANGUAGES, save_project_config, set_lang, t
+from ..github import TemplatePrefetch, start_template_downloads
+from ..install import (
+    TemplateSelection,
+    cleanup_language_templates,
+    download_and_extract_template,
+    ensure_agent_installed,
+    ensure_executable_scripts,
+    install_common_templates,
+    install_offline_template,
+    offline_template_root,
+    verify_scripts_enabled,
+)
+from ..session import get_session
+from ..tools import check_tool, init_git_repo, is_git_repo
+from ..ui import StepTracker, console, select_with_arrows, show_banner
+
+def init(
+    project_name: str = typer.Argument(None, help="Name for your new project directory (optional if using --here, or use '.' for current directory)"),
+    ai: List[str] = typer.Option(None, "--ai", help="AI agents to support (can specify multiple): claude, codex"),
+    lang: str = typer.Option(None, "--lang", help="Language for templates and messages: ja (Japanese) or en (English)"),
+    script_type: str = typer.Option(None, "--script", help="Script type to use: sh or ps"),
+    ignore_agent_tools: bool = typer.Option(False, "--ignore-agent-tools", help="Skip checks for AI agent tools like Claude Code"),
+    no_git: bool = typer.Option(False, "--no-git", help="Skip git repository initialization"),
+    here: bool = typer.Option(False, "--here", help="Initialize project in the current directory instead of creating a new one"),
+    force: bool = typer.Option(False, "--force", help="Force merge/overwrite when using --here (skip confirmation)"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network and extraction failures"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    offline: bool = typer.Option(False, "--offline", help="Build the project from the installed templates without contacting GitHub"),
+):
+    """
+    Initialize a new Grove project from the latest template.
+    
+    This command will:
+    1. Check that required tools are installed (git is optional)
+    2. Let you choose your AI assistant
+    3. Download the appropriate template from GitHub
+    4. Extract the template to a new project directory or current directory
+    5. Initialize a fresh git repository (if not --no-git and no existing repo)
+    6. Optionally set up AI assistant commands
+
+    With --offline, or when GitHub cannot be reached, the template is built
+    from the templates installed with grove-cli instead of being downloaded.
+    
+    Examples:
+        specify init my-project
+        specify init my-project --ai claude
+        specify init my-project --ai copilot --no-git
+        specify init --ignore-agent-tools my-project
+        specify init . --ai claude         # Initialize in current directory
+        specify init .                     # Initialize in current directory (interactive AI selection)
+        specify init --here --ai claude    # Alternative syntax for current directory
+        specify init --here --ai codex
+        specify init --here --ai codebuddy
+        specify init --here
+        specify init --here --force  # Skip confirmation when current directory not empty
+        specify init my-project --ai claude --offline
+    """
+    # Language selection
+    if lang:
+        # Validate language option
+        if lang not in SUPPORTED_LANGUAGES:
+            set_lang("en")  # Set English temporarily for error message
+            console.print(f"[red]{t('error_unsupported_language')}:[/red] {lang}")
+            console.print(f"[dim]{t('supported_languages')}: {', '.join(SUPPORTED_LANGUAGES)}[/dim]")
+            raise typer.Exit(1)
+        selected_lang = lang
+    else:
+        # Interactive language selection
+        console.print("\n[cyan]Select language / 言語を選択してください:[/cyan]")
+        options = [
+            "[1] English",
+            "[2] 日本語 (Japanese)",
+        ]
+        for option in options:
+            console.print(f"  {option}")
+
+        choice = typer.prompt("Enter choice", type=int, default=1)
+        selected_lang = "en" if choice == 1 else "ja"
+
+    # Set language for this session
+    set_lang(selected_lang)
+
+    console.print(f"[cyan]{t('selected_language')}:[/cyan] {LANGUAGE_NAMES[selected_lang]}\n")
+
+    show_banner()
+
+    if project_name == ".":
+        here = True
+        project_name = None  # Clear project_name to use existing validation logic
+
+    if here and project_name:
+        console.print("[red]Error:[/red] Cannot specify both project name and --here flag")
+        raise typer.Exit(1)
+
+    if not here and not project_name:
+        console.print(f"[red]{t('error_must_specify_project')}[/red]")
+        raise typer.Exit(1)
+
+    if here:
+        project_name = Path.cwd().name
+        project_path = Path.cwd()
+
+        existing_items = list(project_path.iterdir())
+        if existing_items:
+            console.print(f"[yellow]{t('warning_not_empty')} ({len(existing_items)} {t('items_found')})[/yellow]")
+            console.print(f"[yellow]{t('template_merge_warning')}[/yellow]")
+            if force:
+                console.print(f"[cyan]{t('force_skipping_confirmation')}[/cyan]")
+            else:
+                response = typer.confirm(t('confirm_continue'))
+                if not response:
+                    console.print(f"[yellow]{t('operation_cancelled')}[/yellow]")
+                    raise typer.Exit(0)
+    else:
+        project_path = Path(project_name).resolve()
+        if project_path.exists():
+            error_panel = Panel(
+                f"Directory '[cyan]{project_name}[/cyan]' already exists\n"
+                "Please choose a different project name or remove the existing directory.",
+                title="[red]Directory Conflict[/red]",
+                border_style="red",
+                padding=(1, 2)
+            )
+            console.print()
+            console.print(error_panel)
+            raise typer.Exit(1)
+
+    current_dir = Path.cwd()
+
+    setup_lines = [
+        "[cyan]Grove Project Setup[/cyan]",
+        "",
+        f"{'Project':<15} [green]{project_path.name}[/green]",
+        f"{'Working Path':<15} [dim]{current_dir}[/dim]",
+    ]
+
+    if not here:
+        setup_lines.append(f"{'Target Path':<15} [dim]{project_path}[/dim]")
+
+    console.print(Panel("\n".join(setup_lines), border_style="cyan", padding=(1, 2)))
+
+    should_init_git = False
+    if not no_git:
+        should_init_git = check_tool("git")
+        if not should_init_git:
+            console.print("[yellow]Git not found - will skip repository initialization[/yellow]")
+
+    # Validate AI agents (support only claude and codex) and script type
+    for agent in ai or []:
+        if agent not in SUPPORTED_AI_AGENTS:
+            console.print(f"[red]Error:[/red] Unsupported AI agent: {agent}")
+            console.print(f"[dim]Supported agents: {', '.join(SUPPORTED_AI_AGENTS)}[/dim]")
+            raise typer.Exit(1)
+    if script_type and script_type not in SCRIPT_TYPE_CHOICES:
+        console.print(f"[red]Error:[/red] Invalid script type '{script_type}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES.keys())}")
+        raise typer.Exit(1)
+
+    # Look up the release and fetch the likely templates while the prompts
+    # below wait for input; the real downloads reuse or cancel this work.
+    # Started only now, so an invalid invocation never reaches GitHub
+    prefetch = None
+    if not offline:
+        prefetch = TemplatePrefetch(
+            ai or SUPPORTED_AI_AGENTS,
+            script_type or ("ps" if os.name == "nt" else "sh"),
+            client=get_session(verify=not skip_tls, github_token=github_token).client,
+            github_token=github_token,
+        )
+
+    if ai:
+        # Remove duplicates while preserving order
+        selected_ai_agents = list(dict.fromkeys(ai))
+    else:
+        # Interactive selection
+        ai_choices = {
+            "claude": "Claude Code",
+            "codex": "OpenAI Codex",
+            "both": "Both (Claude Code + Codex)"
+        }
+        selected_choice = select_with_arrows(
+            ai_choices,
+            "Choose your AI agent(s):",
+            "claude"
+        )
+        if selected_choice == "both":
+            selected_ai_agents = ["claude", "codex"]
+        else:
+            selected_ai_agents = [selected_choice]
+
+    # Note: Claude Code and Codex don't require CLI tool checks
+    # Configuration files will be installed regardless of whether the tools are present
+
+    if script_type:
+        selected_script = script_type
+    else:
+        default_script = "ps" if os.name == "nt" else "sh"
+
+        if sys.stdin.isatty():
+            selected_script = select_with_arrows(SCRIPT_TYPE_CHOICES, "Choose script type (or press Enter)", default_script)
+        else:
+            selected_script = default_script
+
+    console.print(f"[cyan]{t('selected_ai')}:[/cyan] {', '.join(selected_ai_agents)}")
+    console.print(f"[cyan]{t('selected_script')}:[/cyan] {selected_script}")
+
+    tracker = StepTracker(t('tracker_title'))
+
+    sys._specify_tracker_active = True
+
+    tracker.add("precheck", t('tracker_precheck'))
+    tracker.complete("precheck", "ok")
+    tracker.add("ai-select", t('tracker_ai_select'))
+    tracker.complete("ai-select", f"{', '.join(selected_ai_agents)}")
+    tracker.add("script-select", t('tracker_script_select'))
+    tracker.complete("script-select", selected_script)
+    for key, label_key in [
+        ("fetch", "tracker_fetch"),
+        ("download", "tracker_download"),
+        ("extract", "tracker_extract"),
+        ("zip-list", "tracker_archive"),
+        ("extracted-summary", "tracker_extract_summary"),
+        ("chmod", "tracker_chmod"),
+        ("cleanup", "tracker_cleanup"),
+        ("git", "tracker_git_init"),
+        ("final", "tracker_finalize")
+    ]:
+        tracker.add(key, t(label_key))
+
+    # Track git error message outside Live context so it persists
+    git_error_message = None
+    agent_lines = []
+
+    from rich.live import Live
+
+    from ..staging import ProjectStage
+
+    # Everything is built in a staging directory and moved into place at the
+    # end, so a failed or interrupted init leaves the target untouched
+    stage = ProjectStage(project_path, here=here)
+    staged_path = stage.path
+
+    with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
+        tracker.attach_refresh(lambda: live.update(tracker.render()))
+        try:
+            session = get_session(verify=not skip_tls, github_token=github_token)
+            downloads = {}
+            cancel_downloads = threading.Event()
+            offline_reason = "--offline" if offline else None
+
+            if not offline:
+                # Start every agent's template download at once (one metadata request);
+                # the rest keep downloading while the base template is set up
+                downloads = start_template_downloads(selected_ai_agents, Path.cwd(), script_type=selected_script, client=session.client, debug=debug, github_token=github_token, prefetch=prefetch, cancel=cancel_downloads)
+
+                # Download base template from GitHub
+                # Use first selected AI agent for template download (base template)
+                import httpx
+
+                try:
+                    downloads[selected_ai_agents[0]].result()
+                except (httpx.TransportError, typer.Exit):
+                    # A failed download prints its error and raises typer.Exit.
+                    # Only this falls back: extraction and disk errors are real failures
+                    if offline_template_root() is not None:
+                        offline_reason = "GitHub unreachable, using installed templates"
+                if not offline_reason:
+                    # Re-raises the download error itself when there is no fallback
+                    download_and_extract_template(staged_path, selected_ai_agents[0], selected_script, here, verbose=False, tracker=tracker, client=session.client, debug=debug, github_token=github_token, archive=downloads[selected_ai_agents[0]], selection=TemplateSelection(selected_lang, selected_script, selected_ai_agents))
+
+            if offline_reason:
+                if prefetch is not None:
+                    prefetch.cancel()
+                # Stop the other agents' downloads before building from the
+                # installed templates, so none is left writing into the cache
+                cancel_downloads.set()
+                wait(downloads.values())
+                # Every selected agent is built at once from the share directory
+                install_offline_template(staged_path, selected_ai_agents, selected_script, here, tracker=tracker, reason=offline_reason, language=selected_lang)
+
+            # Cleanup language-specific template directories
+            cleanup_language_templates(staged_path, selected_lang, tracker=tracker)
+
+            # Install language-specific templates (.grove/ directory structure)
+            install_common_templates(staged_path, selected_lang, selected_script, tracker=tracker)
+
+            if verify_scripts_enabled():
+                ensure_executable_scripts(staged_path, tracker=tracker)
+            else:
+                tracker.skip("chmod", "set while writing")
+
+            # Save project configuration
+            save_project_config(staged_path, {"language": selected_lang})
+
+            # Install configuration files for each selected AI agent
+            if offline_reason:
+                for agent_name in selected_ai_agents:
+                    agent_lines.append(f"[green]✓[/green] {AGENT_CONFIG[agent_name]['name']} configuration installed from local templates")
+            else:
+                from ..upgrade import init_selections, record_install
+
+                base_selection, *agent_selections = init_selections(selected_ai_agents, selected_script, selected_lang)
+                agent_selections = dict(zip(selected_ai_agents[1:], agent_selections))
+                # (archive, selection) in the order init extracted them
+                extracted = [(downloads[selected_ai_agents[0]], base_selection)]
+
+                # Extract each agent's template as soon as its download finishes
+                agent_downloads = {future: agent_name for agent_name, future in downloads.items()}
+                for future in as_completed(agent_downloads):
+                    agent_name = agent_downloads[future]
+                    # The base template's archive was already extracted (and possibly removed)
+                    archive = future if agent_name != selected_ai_agents[0] else None
+                    # Agents the project already has are left alone (--here)
+                    if ensure_agent_installed(agent_name, staged_path, client=session.client, archive=archive, script_type=selected_script, existing_dir=project_path) and archive is not None:
+                        extracted.append((future, agent_selections[agent_name]))
+                    agent_lines.append(f"[green]✓[/green] {AGENT_CONFIG[agent_name]['name']} configuration downloaded from GitHub")
+
+                # Record what init wrote from the release, so `grove upgrade` can
+                # tell upstream changes from local edits
+                archives = [(future.result()[0], selection) for future, selection in extracted]
+                try:
+                    record_install(
+                        staged_path,
+                        [(zip_path, selection) for zip_path, selection in archives if zip_path.is_file()],
+                        release=downloads[selected_ai_agents[0]].result()[1]["release"],
+                        agents=selected_ai_agents,
+                        script_type=selected_script,
+                        language=selected_lang,
+                    )
+                except Exception as e:
+                    agent_lines.append(f"[yellow]Warning:[/yellow] Could not record the install manifest: {e}")
+
+            tracker.add("commit", "Move project into place")
+            tracker.start("commit")
+            committed = stage.commit()
+            if here:
+                tracker.complete("commit", f"{committed.written} written, {committed.unchanged} unchanged")
+            else:
+                tracker.complete("commit", f"{committed.written} files")
+
+            if not no_git:
+                tracker.start("git")
+                if is_git_repo(project_path):
+                    tracker.complete("git", "existing repo detected")
+                elif should_init_git:
+                    success, error_msg = init_git_repo(project_path, quiet=True)
+                    if success:
+                        tracker.complete("git", "initialized")
+                    else:
+                        tracker.error("git", "init failed")
+                        git_error_message = error_msg
+                else:
+                    tracker.skip("git", "git not available")
+            else:
+                tracker.skip("git", "--no-git flag")
+
+            tracker.complete("final", "project ready")
+        except Exception as e:
+            tracker.error("final", str(e))
+            console.print(Panel(f"Initialization failed: {e}", title="Failure", border_style="red"))
+            if debug:
+                _env_pairs = [
+                    ("Python", sys.version.split()[0]),
+                    ("Platform", sys.platform),
+                    ("CWD", str(Path.cwd())),
+                ]
+                _label_width = max(len(k) for k, _ in _env_pairs)
+                env_lines = [f"{k.ljust(_label_width)} → [bright_black]{v}[/bright_black]" for k, v in _env_pairs]
+                console.print(Panel("\n".join(env_lines), title="Debug Environment", border_style="magenta"))
+            raise typer.Exit(1)
+        finally:
+            # No-op once committed; otherwise nothing reached the target
+            stage.discard()
+
+    console.print(tracker.render())
+    console.print(f"\n[bold green]{t('project_ready')}[/bold green]")
+
+    console.print()
+    for line in agent_lines:
+        console.print(line)
+
+    if debug and session.timings:
+        timing_lines = [
+            f"{r.method} {r.url} → {r.status} [bright_black]{r.http_version}, {r.seconds * 1000:.0f} ms[/bright_black]"
+            for r in session.timings
+        ]
+        console.print(Panel("\n".join(timing_lines), title="HTTP Requests", border_style="magenta"))
+
+    # Show git error details if initialization failed
+    if git_error_message:
+        console.print()
+        git_error_panel = Panel(
+            f"[yellow]Warning:[/yellow] Git repository initialization failed\n\n"
+            f"{git_error_message}\n\n"
+            f"[dim]You can initialize git manually later with:[/dim]\n"
+            f"[cyan]cd {project_path if not here else '.'}[/cyan]\n"
+            f"[cyan]git init[/cyan]\n"
+            f"[cyan]git add .[/cyan]\n"
+            f"[cyan]git commit -m \"Initial commit\"[/cyan]",
+            title="[red]Git Initialization Failed[/red]",
+            border_style="red",
+            padding=(1, 2)
+        )
+        console.print(git_error_panel)
+
+    # Agent folder security notice
+    agent_folders = []
+    if "claude" in selected_ai_agents:
+        agent_folders.append(".claude/")
+    if "codex" in selected_ai_agents:
+        agent_folders.append(".codex/")
+
+    if agent_folders:
+        folders_str = ", ".join(f"[cyan]{folder}[/cyan]" for folder in agent_folders)
+        message = t('agent_folder_security_message').format(folder=folders_str)
+        security_notice = Panel(
+            message,
+            title=f"[yellow]{t('agent_folder_security')}[/yellow]",
+            border_style="yellow",
+            padding=(1, 2)
+        )
+        console.print()
+        console.print(security_notice)
+
+    steps_lines = []
+    if not here:
+        go_to_folder_msg = f"プロジェクトフォルダーに移動: [cyan]cd {project_name}[/cyan]" if selected_lang == "ja" else f"Go to the project folder: [cyan]cd {project_name}[/cyan]"
+        steps_lines.append(f"1. {go_to_folder_msg}")
+        step_num = 2
+    else:
+        steps_lines.append(f"1. {t('next_steps_already_in_dir')}")
+        step_num = 2
+
+    # Add Codex-specific setup step if needed
+    if "codex" in selected_ai_agents:
+        codex_path = project_path / ".codex"
+        quoted_path = shlex.quote(str(codex_path))
+        if os.name == "nt":  # Windows
+            cmd = f"setx CODEX_HOME {quoted_path}"
+        else:  # Unix-like systems
+            cmd = f"export CODEX_HOME={quoted_path}"
+
+        set_env_msg = f"{step_num}. Codex実行前に [cyan]CODEX_HOME[/cyan] 環境変数を設定: [cyan]{cmd}[/cyan]" if selected_lang == "ja" else f"{step_num}. Set [cyan]CODEX_HOME[/cyan] environment variable before running Codex: [cyan]{cmd}[/cyan]"
+        steps_lines.append(set_env_msg)
+        step_num += 1
+
+    steps_lines.append(f"{step_num}. {t('next_steps_start_using')}")
+
+    steps_lines.append(f"   {step_num}.1 [cyan]/grove.constitution[/] - {t('next_steps_constitution')}")
+    steps_lines.append(f"   {step_num}.2 [cyan]/grove.specify[/] - {t('next_steps_specify')}")
+    steps_lines.append(f"   {step_num}.3 [cyan]/grove.design[/] - {t('next_steps_design')}")
+    steps_lines.append(f"   {step_num}.4 [cyan]/grove.plan[/] - {t('next_steps_plan')}")
+    steps_lines.append(f"   {step_num}.5 [cyan]/grove.tasks[/] - {t('next_steps_tasks')}")
+    steps_lines.append(f"   {step_num}.6 [cyan]/grove.implement[/] - {t('next_steps_implement')}")
+
+    steps_panel = Panel("\n".join(steps_lines), title=t('next_steps'), border_style="cyan", padding=(1,2))
+    console.print()
+    console.print(steps_panel)
+
+    enhancement_lines = [
+        f"{t('enhancement_commands_desc')}",
+        "",
+        f"○ [cyan]/grove.clarify[/] [bright_black](optional)[/bright_black] - {t('enhancement_clarify')}",
+        f"○ [cyan]/grove.analyze[/] [bright_black](optional)[/bright_black] - {t('enhancement_analyze')}",
+        f"○ [cyan]/grove.checklist[/] [bright_black](optional)[/bright_black] - {t('enhancement_checklist')}",
+        f"○ [cyan]/grove.review[/] [bright_black](optional)[/bright_black] - {t('enhancement_review')}",
+        f"○ [cyan]/grove.fix[/] [bright_black](optional)[/bright_black] - {t('enhancement_fix')}"
+    ]
+    enhancements_panel = Panel("\n".join(enhancement_lines), title=t('enhancement_commands'), border_style="cyan", padding=(1,2))
+    console.print()
+    console.print(enhancements_panel)
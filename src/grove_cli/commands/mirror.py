@@ -0,0 +1,47 @@
+"""`grove mirror` - serve the template asset cache to other machines."""
+
+import typer
+
+from ..cache import DEFAULT_MIRROR_PORT, MIRROR_ACTIONS
+from ..ui import console
+
+def mirror(
+    mirror_action: str = typer.Argument("serve", metavar="ACTION", help=f"Action: {', '.join(MIRROR_ACTIONS)}"),
+    host: str = typer.Option("127.0.0.1", "--host", help="Address to listen on (0.0.0.0 for every interface)"),
+    port: int = typer.Option(DEFAULT_MIRROR_PORT, "--port", help="Port to listen on"),
+    offline: bool = typer.Option(False, "--offline", help="Serve only release information and assets that are already cached"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Do not log requests"),
+):
+    """
+    Serve cached release templates over HTTP so a fleet shares one cache.
+
+    Point clients at the mirror with GROVE_RELEASE_SOURCE. Assets that are
+    not cached yet are downloaded once, on first request, unless --offline.
+
+    Examples:
+        grove mirror serve --host 0.0.0.0 --port 8787
+        GROVE_RELEASE_SOURCE=http://mirror.lan:8787 grove init my-project --ai claude
+    """
+    if mirror_action not in MIRROR_ACTIONS:
+        console.print(f"[red]Error:[/red] Unknown action '{mirror_action}'. Choose from: {', '.join(MIRROR_ACTIONS)}")
+        raise typer.Exit(1)
+
+    from ..mirror import MirrorServer
+
+    log = None if quiet else (lambda line: console.print(f"[dim]{line}[/dim]", highlight=False))
+    try:
+        server = MirrorServer((host, port), offline=offline, github_token=github_token, log=log)
+    except OSError as e:
+        console.print(f"[red]Error:[/red] Cannot listen on {host}:{port}: {e}")
+        raise typer.Exit(1)
+
+    cached = len(server.cache.entries())
+    console.print(f"[green]✓[/green] Serving {cached} cached asset(s) on [cyan]http://{host}:{port}[/cyan]" + (" (offline)" if offline else "") + " [dim](Ctrl+C to stop)[/dim]")
+    console.print(f"[dim]Clients: GROVE_RELEASE_SOURCE=http://<this host>:{port} grove init ...[/dim]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n[dim]Mirror stopped[/dim]")
+    finally:
+        server.server_close()
@@ -0,0 +1,87 @@
+"""`grove serve` / `grove call` - warm daemon on a Unix socket and its command-line client."""
+
+import json
+from pathlib import Path
+from typing import List
+
+import typer
+
+from ..daemon import OPERATIONS, default_socket_path, request
+from ..ui import console
+
+def serve(
+    socket_path: Path = typer.Option(None, "--socket", help="Socket path (default: $GROVE_SOCKET or the per-user runtime directory)"),
+):
+    """
+    Run a long-lived daemon that keeps project state warm.
+
+    Project config, parsed templates, the docs index and the HTTP session stay
+    loaded between requests. Clients talk to it with `grove call` (or
+    `grove_cli.daemon.request` from Python); both fall back to running the
+    request in-process when no daemon is listening.
+
+    Examples:
+        grove serve &
+        grove call paths --format env
+        grove call sync src=src auto=true
+    """
+    from ..daemon import serve as run_server
+
+    def ready(path: Path) -> None:
+        console.print(f"[green]✓[/green] grove daemon listening on [cyan]{path}[/cyan] [dim](Ctrl+C to stop)[/dim]")
+
+    try:
+        run_server(socket_path, on_ready=ready)
+    except KeyboardInterrupt:
+        console.print("\n[dim]grove daemon stopped[/dim]")
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+def _parse_value(value: str):
+    lowered = value.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    return value
+
+def call(
+    op: str = typer.Argument(..., help=f"Operation: {', '.join(OPERATIONS)} or shutdown"),
+    params: List[str] = typer.Argument(None, help="Parameters as key=value (project_dir defaults to the current directory)"),
+    output_format: str = typer.Option("json", "--format", help="Output format: json or env (KEY='value' lines, for `eval` in shell scripts)"),
+    socket_path: Path = typer.Option(None, "--socket", help="Socket path (default: $GROVE_SOCKET or the per-user runtime directory)"),
+    no_fallback: bool = typer.Option(False, "--no-fallback", help="Fail instead of running in-process when no daemon is listening"),
+):
+    """
+    Send one request to `grove serve`, or run it in-process if no daemon is up.
+
+    Examples:
+        grove call ping
+        grove call template command=spec
+        eval "$(grove call paths --format env)"
+    """
+    args = {}
+    for item in params or []:
+        key, sep, value = item.partition("=")
+        if not sep:
+            console.print(f"[red]Error:[/red] Expected key=value, got '{item}'")
+            raise typer.Exit(2)
+        args[key] = _parse_value(value)
+    args.setdefault("project_dir", str(Path.cwd()))
+
+    try:
+        response = request(op, args, socket_path=socket_path or default_socket_path(), fallback=not no_fallback)
+    except ConnectionError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if not response.get("ok"):
+        console.print(f"[red]Error:[/red] {response.get('error')}")
+        raise typer.Exit(1)
+
+    result = response.get("result")
+    if output_format == "env" and isinstance(result, dict):
+        for key, value in result.items():
+            text = str(value).replace("'", "'\\''")
+            typer.echo(f"{key}='{text}'")
+    else:
+        typer.echo(json.dumps(result, indent=2, ensure_ascii=False))
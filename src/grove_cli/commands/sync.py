@@ -0,0 +1,73 @@
+"""`grove sync` - generate hierarchical documentation under `.grove/docs/`."""
+
+import os
+from pathlib import Path
+
+import typer
+
+from ..completion import write_completion_index
+from ..docs import detect_source_directory, sync_directory_docs
+from ..ui import console
+
+def sync(
+    project_dir: Path = typer.Option(None, "--dir", help="Project directory (default: current)"),
+    src: str = typer.Option(None, "--src", help="Source directory (default: auto-detect)"),
+    auto: bool = typer.Option(False, "--auto", help="Auto-generate/overwrite all docs"),
+    jobs: int = typer.Option(None, "--jobs", "-j", min=1, help="Directories to document in parallel (default: $GROVE_SYNC_JOBS or the CPU count)"),
+):
+    """
+    Sync project documentation to .grove/docs/
+
+    Automatically generates hierarchical documentation for your source code.
+    Each directory gets index.md (structure), README.md (overview), and {filename}.md (details).
+
+    Examples:
+        grove sync
+        grove sync --src src
+        grove sync --auto
+        grove sync --jobs 8
+    """
+    if project_dir is None:
+        project_dir = Path.cwd()
+
+    # Claude Code environment detection (environment variable only, no --ai parameter)
+    if os.getenv("CLAUDE_CODE_VERSION") is not None:
+        console.print("[cyan]Claude Code detected[/cyan]")
+        console.print("[yellow]Execute: /grove.sync[/yellow]")
+        console.print("[dim]This will use the sync-knowledge skill[/dim]")
+        return
+
+    console.print("[cyan]Syncing project documentation...[/cyan]\n")
+
+    # Detect or use specified source directory
+    if src:
+        src_dir = project_dir / src
+        if not src_dir.exists():
+            console.print(f"[red]Error:[/red] Source directory '{src}' not found")
+            raise typer.Exit(1)
+    else:
+        src_dir = detect_source_directory(project_dir)
+        if src_dir is None:
+            console.print("[yellow]Warning:[/yellow] Could not auto-detect source directory")
+            console.print("[dim]Specify with --src, or use one of: src, app, lib, pkg, source, code, core[/dim]")
+            raise typer.Exit(1)
+
+    console.print(f"  Source directory: {src_dir.relative_to(project_dir)}")
+
+    # Create documentation directory
+    docs_dir = project_dir / ".grove" / "docs" / src_dir.name
+    console.print(f"  Documentation output: {docs_dir.relative_to(project_dir)}\n")
+
+    # Sync documentation
+    try:
+        count = sync_directory_docs(src_dir, docs_dir, auto, jobs=jobs)
+        console.print(f"\n[green]✓[/green] Documentation synced successfully")
+        console.print(f"  Generated/updated {count} file(s)")
+        console.print(f"  Output: {docs_dir.relative_to(project_dir)}")
+
+        # Keep `grove sync --src` shell completion in step with the project layout
+        write_completion_index(project_dir)
+
+    except Exception as e:
+        console.print(f"[red]Error syncing documentation:[/red] {e}")
+        raise typer.Exit(1)
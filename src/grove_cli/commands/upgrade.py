@@ -0,0 +1,117 @@
+"""`grove upgrade` - bring an existing project's template files up to the latest release."""
+
+import tempfile
+from pathlib import Path
+from typing import List
+
+import typer
+from rich.panel import Panel
+
+from ..config import AGENT_CONFIG, SCRIPT_TYPE_CHOICES, SUPPORTED_AI_AGENTS, get_project_language
+from ..ui import console
+
+def _detect_install(project_dir: Path, ai: List[str], script_type: str):
+    from ..upgrade import InstallManifest
+
+    agents = ai or [agent for agent in SUPPORTED_AI_AGENTS if (project_dir / AGENT_CONFIG[agent]["folder"]).is_dir()] or ["claude"]
+    scripts = project_dir / ".grove" / "scripts"
+    if not script_type:
+        script_type = "ps" if (scripts / "powershell").is_dir() and not (scripts / "bash").is_dir() else "sh"
+    return InstallManifest("", agents, script_type, get_project_language(project_dir), {})
+
+def _print_paths(title: str, paths: List[str], style: str) -> None:
+    if paths:
+        console.print(f"[{style}]{title} ({len(paths)}):[/{style}]")
+        for path in paths:
+            console.print(f"  {path}")
+
+def upgrade(
+    ai: List[str] = typer.Option(None, "--ai", help="Agent template(s) to upgrade (default: those recorded at init)"),
+    script_type: str = typer.Option(None, "--script", help="Script type: sh or ps (default: the one recorded at init)"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would change without writing anything"),
+    force: bool = typer.Option(False, "--force", help="Overwrite locally modified files that also changed upstream"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network failures"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+):
+    """
+    Upgrade the current project's template files to the latest release.
+
+    Compares the release with the install manifest recorded by `grove init`
+    (.grove/memory/install-manifest.json) and writes only files that changed
+    upstream and were not modified locally. Files changed on both sides are
+    reported as conflicts and left alone unless --force.
+
+    Examples:
+        grove upgrade --dry-run
+        grove upgrade
+        grove upgrade --force
+    """
+    from ..github import start_template_downloads
+    from ..install import ensure_executable_scripts, verify_scripts_enabled
+    from ..session import get_session
+    from ..upgrade import apply_upgrade, init_selections, load_install_manifest, plan_upgrade, release_manifest, save_install_manifest, upgraded_manifest
+
+    project_dir = Path.cwd()
+    if not (project_dir / ".grove").is_dir():
+        console.print("[red]Error:[/red] Not a Grove project (no .grove/ directory); run `grove init --here` first")
+        raise typer.Exit(1)
+    for agent in ai or []:
+        if agent not in SUPPORTED_AI_AGENTS:
+            console.print(f"[red]Error:[/red] Unsupported AI agent: {agent}")
+            console.print(f"[dim]Supported agents: {', '.join(SUPPORTED_AI_AGENTS)}[/dim]")
+            raise typer.Exit(1)
+    if script_type and script_type not in SCRIPT_TYPE_CHOICES:
+        console.print(f"[red]Error:[/red] Invalid script type '{script_type}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES.keys())}")
+        raise typer.Exit(1)
+
+    recorded = load_install_manifest(project_dir)
+    if recorded is None:
+        recorded = _detect_install(project_dir, ai, script_type)
+        console.print("[yellow]No install manifest found; template files that differ from the latest release are reported as conflicts[/yellow]")
+    else:
+        recorded = recorded._replace(agents=list(dict.fromkeys(ai)) if ai else recorded.agents, script_type=script_type or recorded.script_type)
+
+    session = get_session(verify=not skip_tls, github_token=github_token)
+    with tempfile.TemporaryDirectory() as download_dir:
+        downloads = start_template_downloads(recorded.agents, Path(download_dir), script_type=recorded.script_type, client=session.client, debug=debug, github_token=github_token)
+        # Each failed download has already printed its error and raises typer.Exit
+        results = [downloads[agent].result() for agent in recorded.agents]
+        release = results[0][1]["release"]
+
+        selections = init_selections(recorded.agents, recorded.script_type, recorded.language)
+        upstream, sources = release_manifest([(zip_path, selection) for (zip_path, _meta), selection in zip(results, selections)])
+        plan = plan_upgrade(project_dir, recorded.files, upstream)
+        changed = plan.add + plan.update + plan.remove
+
+        console.print(f"[cyan]{recorded.release or 'unknown'}[/cyan] → [cyan]{release}[/cyan] "
+                      f"[dim]({', '.join(recorded.agents)}, {recorded.script_type}, {recorded.language})[/dim]")
+        _print_paths("Add", plan.add, "green")
+        _print_paths("Update", plan.update, "green")
+        _print_paths("Remove", plan.remove, "yellow")
+        _print_paths("Conflicts (changed upstream and locally)" + (", overwriting" if force else ""), plan.conflicts, "red")
+        _print_paths("Kept (removed upstream but modified locally)", plan.kept, "yellow")
+
+        if not (changed or plan.conflicts or plan.current) and recorded.release == release:
+            console.print(f"[green]✓[/green] Already up to date ({plan.unchanged} template files unchanged)")
+            return
+        if dry_run:
+            console.print(f"[dim]Dry run: {len(changed)} change(s), {len(plan.conflicts)} conflict(s), {plan.unchanged} unchanged[/dim]")
+            return
+
+        written = apply_upgrade(project_dir, plan, sources, force=force)
+        save_install_manifest(project_dir, upgraded_manifest(recorded, upstream, plan, release=release, force=force))
+
+    if written and verify_scripts_enabled():
+        ensure_executable_scripts(project_dir)
+    console.print(f"[green]✓[/green] Upgraded to {release}: {len(written)} written, {len(plan.remove)} removed, {plan.unchanged} unchanged")
+    if plan.conflicts and not force:
+        console.print(Panel(
+            "These files changed upstream but were modified locally, so they were left as they are:\n\n"
+            + "\n".join(f"  {path}" for path in plan.conflicts)
+            + "\n\nMerge the changes by hand, or run [cyan]grove upgrade --force[/cyan] to take the release's version.",
+            title="[yellow]Conflicts[/yellow]",
+            border_style="yellow",
+            padding=(1, 2),
+        ))
+        raise typer.Exit(1)
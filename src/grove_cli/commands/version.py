@@ -0,0 +1,83 @@
+"""`grove version` - show CLI, template and platform information."""
+
+from datetime import datetime
+from pathlib import Path
+
+from rich.panel import Panel
+
+from ..github import fetch_latest_release, get_http_client, get_release_source
+from ..ui import console, show_banner
+
+def version():
+    """Display version and system information."""
+    import platform
+    import importlib.metadata
+    
+    show_banner()
+    
+    # Get CLI version from package metadata
+    cli_version = "unknown"
+    try:
+        cli_version = importlib.metadata.version("specify-cli")
+    except Exception:
+        # Fallback: try reading from pyproject.toml if running from source
+        try:
+            import tomllib
+            pyproject_path = Path(__file__).parents[3] / "pyproject.toml"
+            if pyproject_path.exists():
+                with open(pyproject_path, "rb") as f:
+                    data = tomllib.load(f)
+                    cli_version = data.get("project", {}).get("version", "unknown")
+        except Exception:
+            pass
+    
+    # Fetch latest template release version (cached, revalidated with If-None-Match)
+    template_version = "unknown"
+    release_date = "unknown"
+    
+    try:
+        release_data, release_source = fetch_latest_release(get_http_client(), timeout=10)
+        template_version = release_data.get("tag_name", "unknown")
+        # Remove 'v' prefix if present
+        if template_version.startswith("v"):
+            template_version = template_version[1:]
+        if release_source == "stale":
+            template_version += " (cached, GitHub unreachable)"
+        release_date = release_data.get("published_at", "unknown")
+        if release_date != "unknown":
+            # Format the date nicely
+            try:
+                dt = datetime.fromisoformat(release_date.replace('Z', '+00:00'))
+                release_date = dt.strftime("%Y-%m-%d")
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+    from rich.table import Table
+
+    info_table = Table(show_header=False, box=None, padding=(0, 2))
+    info_table.add_column("Key", style="cyan", justify="right")
+    info_table.add_column("Value", style="white")
+
+    info_table.add_row("CLI Version", cli_version)
+    info_table.add_row("Template Version", template_version)
+    info_table.add_row("Released", release_date)
+    release_source = get_release_source()
+    if not release_source.is_default:
+        info_table.add_row("Release Source", release_source.location)
+    info_table.add_row("", "")
+    info_table.add_row("Python", platform.python_version())
+    info_table.add_row("Platform", platform.system())
+    info_table.add_row("Architecture", platform.machine())
+    info_table.add_row("OS Version", platform.version())
+
+    panel = Panel(
+        info_table,
+        title="[bold cyan]Grove CLI Information[/bold cyan]",
+        border_style="cyan",
+        padding=(1, 2)
+    )
+
+    console.print(panel)
+    console.print()
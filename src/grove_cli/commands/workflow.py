@@ -0,0 +1,96 @@
+"""`grove workflow` - run the full SDD workflow with one agent."""
+
+from pathlib import Path
+
+import typer
+from rich.panel import Panel
+
+from ..agents import AgentExecutor, select_agent_interactive
+from ..config import AGENT_CONFIG
+from ..docs import record_implementation_changes
+from ..install import ensure_agent_installed
+from ..templates import load_template_if_enabled
+from ..ui import console
+
+def workflow(
+    prompt: str = typer.Argument(..., help="Feature description"),
+    ai: str = typer.Option(None, "--ai", help="AI agent to use for all steps"),
+    project_dir: Path = typer.Option(None, "--dir", help="Project directory"),
+):
+    """
+    Execute complete SDD workflow: constitution → specify → design → plan → tasks → implement
+
+    Examples:
+        grove workflow "Add user authentication" --ai claude
+        grove workflow "Add dark mode"
+    """
+    if project_dir is None:
+        project_dir = Path.cwd()
+
+    # Select agent
+    if ai:
+        selected_agent = ai
+    else:
+        selected_agent = select_agent_interactive()
+
+    ensure_agent_installed(selected_agent, project_dir)
+
+    console.print(Panel(
+        f"[bold cyan]Starting SDD Workflow[/bold cyan]\n\n"
+        f"Feature: {prompt}\n"
+        f"Agent: {AGENT_CONFIG[selected_agent]['name']}\n"
+        f"Project: {project_dir}",
+        title="Workflow Execution",
+        border_style="cyan"
+    ))
+
+    # Step 1: Constitution (if not exists)
+    console.print("\n[bold cyan]Step 1: Constitution[/bold cyan]")
+    constitution_path = project_dir / ".claude" / "rules" / "constitution.md"
+    if not constitution_path.exists():
+        console.print("[cyan]Creating constitution...[/cyan]")
+        template_content = load_template_if_enabled("constitution", project_dir)
+        executor = AgentExecutor(selected_agent, project_dir)
+        executor.execute("constitution", template_content=template_content)
+        console.print("[green]✓[/green] Constitution created")
+    else:
+        console.print("[dim]Constitution already exists, skipping...[/dim]")
+
+    # Step 2: Specify
+    console.print("\n[bold cyan]Step 2: Specification[/bold cyan]")
+    template_content = load_template_if_enabled("specify", project_dir)
+    executor = AgentExecutor(selected_agent, project_dir)
+    executor.execute("specify", prompt, template_content=template_content)
+    console.print("[green]✓[/green] Specification created")
+
+    # Step 3: Design
+    console.print("\n[bold cyan]Step 3: Design[/bold cyan]")
+    template_content = load_template_if_enabled("design", project_dir)
+    executor.execute("design", template_content=template_content)
+    console.print("[green]✓[/green] Design-creator skill created")
+
+    # Step 4: Plan
+    console.print("\n[bold cyan]Step 4: Implementation Plan[/bold cyan]")
+    template_content = load_template_if_enabled("plan", project_dir)
+    executor.execute("plan", template_content=template_content)
+    console.print("[green]✓[/green] Plan created")
+
+    # Step 5: Tasks
+    console.print("\n[bold cyan]Step 5: Task Breakdown[/bold cyan]")
+    template_content = load_template_if_enabled("tasks", project_dir)
+    executor.execute("tasks", template_content=template_content)
+    console.print("[green]✓[/green] Tasks created")
+
+    # Step 6: Implement
+    console.print("\n[bold cyan]Step 6: Implementation[/bold cyan]")
+    executor.execute("implement")
+
+    # Record implementation changes
+    console.print("\n[cyan]Recording implementation changes...[/cyan]")
+    updated_count = record_implementation_changes(project_dir)
+    if updated_count > 0:
+        console.print(f"[green]✓[/green] Updated {updated_count} documentation file(s)")
+    else:
+        console.print("[dim]No documentation updates needed[/dim]")
+
+    console.print("\n[bold green]✓ Workflow completed successfully![/bold green]")
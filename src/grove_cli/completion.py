@@ -0,0 +1,404 @@
+"""Static shell completion.
+
+`grove completion` renders a self-contained completion script for bash, zsh
+or fish. Commands, options and fixed value lists (agents, languages, script
+types) are baked into the script when it is generated, so pressing TAB never
+starts Python. Values that depend on the project (`grove sync --src`) are read
+by the shell from a small index file, `.grove/completion-index`, which
+`grove sync` and `grove completion` keep up to date.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from .cache import CACHE_ACTIONS, MIRROR_ACTIONS
+from .config import SCRIPT_TYPE_CHOICES, SUPPORTED_AI_AGENTS, SUPPORTED_LANGUAGES
+
+SUPPORTED_SHELLS = ["bash", "zsh", "fish"]
+
+COMPLETION_INDEX = Path(".grove") / "completion-index"
+
+# Directory names never offered as `--src` candidates
+INDEX_SKIP_DIRS = {"node_modules", "__pycache__", "venv", "env", "dist", "build"}
+
+# Fixed value lists, keyed by the Typer parameter name
+VALUE_CHOICES: Dict[str, List[str]] = {
+    "ai": SUPPORTED_AI_AGENTS,
+    "lang": SUPPORTED_LANGUAGES,
+    "script_type": list(SCRIPT_TYPE_CHOICES),
+    "shell": SUPPORTED_SHELLS,
+    "action": CACHE_ACTIONS,
+    "mirror_action": MIRROR_ACTIONS,
+}
+
+# Parameters completed from `.grove/completion-index` (param name -> index kind)
+INDEX_VALUES: Dict[str, str] = {
+    "src": "src",
+}
+
+# Parameters completed with directory names
+DIRECTORY_PARAMS = {"project_dir", "project_name"}
+
+
+class OptionSpec(NamedTuple):
+    """One completable parameter of a command."""
+
+    opts: List[str]
+    help: str
+    takes_value: bool
+    choices: List[str]
+    index: Optional[str]
+    directory: bool
+    multiple: bool = False
+
+
+class CommandCompletion(NamedTuple):
+    """Everything the shell needs to know about a subcommand."""
+
+    name: str
+    help: str
+    options: List[OptionSpec]
+    argument: Optional[OptionSpec]
+
+
+# =============================================================================
+# Completion index
+# =============================================================================
+
+def write_completion_index(project_dir: Path) -> Optional[Path]:
+    """Record project-dependent completion values in `.grove/completion-index`.
+
+    Only projects that already have a `.grove/` directory get an index. The
+    file is rewritten only when its content changes.
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        Path to the index file, or None if `project_dir` is not a Grove project
+    """
+    if not (project_dir / ".grove").is_dir():
+        return None
+
+    sources = []
+    try:
+        with os.scandir(project_dir) as it:
+            for entry in it:
+                if entry.name.startswith(".") or entry.name in INDEX_SKIP_DIRS:
+                    continue
+                if entry.is_dir():
+                    sources.append(entry.name)
+    except OSError:
+        return None
+
+    content = "".join(f"src\t{name}\n" for name in sorted(sources))
+    index_path = project_dir / COMPLETION_INDEX
+    try:
+        if index_path.read_text(encoding="utf-8") == content:
+            return index_path
+    except OSError:
+        pass
+    index_path.write_text(content, encoding="utf-8")
+    return index_path
+
+# =============================================================================
+# Command model
+# =============================================================================
+
+def _option_spec(param) -> OptionSpec:
+    name = param.name or ""
+    is_flag = bool(getattr(param, "is_flag", False))
+    choices = VALUE_CHOICES.get(name) or list(getattr(param.type, "choices", None) or [])
+    return OptionSpec(
+        opts=list(param.opts) + list(getattr(param, "secondary_opts", [])),
+        help=(getattr(param, "help", None) or "").strip(),
+        takes_value=not is_flag,
+        choices=[str(c) for c in choices],
+        index=INDEX_VALUES.get(name),
+        directory=name in DIRECTORY_PARAMS,
+        multiple=bool(getattr(param, "multiple", False)),
+    )
+
+
+def collect_commands() -> List[CommandCompletion]:
+    """Load every registered command and describe its parameters.
+
+    This imports all command modules (built-in and plugins); it runs once,
+    when the completion script is generated.
+    """
+    from .registry import BUILTIN_COMMANDS, load_command, plugin_commands
+
+    commands = []
+    for name, spec in [*BUILTIN_COMMANDS.items(), *plugin_commands().items()]:
+        try:
+            command = load_command(name, spec)
+        except Exception:
+            # A broken plugin must not prevent completion for everything else
+            continue
+        options = []
+        argument = None
+        for param in command.params:
+            if getattr(param, "param_type_name", "") == "argument":
+                if argument is None:
+                    argument = _option_spec(param)
+                continue
+            if getattr(param, "hidden", False):
+                continue
+            options.append(_option_spec(param))
+        options.append(OptionSpec(["--help"], "Show this message and exit.", False, [], None, False))
+        help_text = (command.short_help or command.help or spec.short_help or "").strip().splitlines()
+        commands.append(CommandCompletion(name, help_text[0] if help_text else "", options, argument))
+    return commands
+
+# =============================================================================
+# Script rendering
+# =============================================================================
+
+def _words(values: List[str]) -> str:
+    return " ".join(values)
+
+
+def _sq(text: str) -> str:
+    """Quote `text` for use inside single quotes in any POSIX-like shell."""
+    return text.replace("'", "'\\''")
+
+
+def render_bash(commands: List[CommandCompletion], version: str) -> str:
+    """Render a bash completion script (also usable from zsh via bashcompinit)."""
+    lines = [
+        f"# grove shell completion for bash (generated by grove {version}; re-run `grove completion --install` after upgrading)",
+        "",
+        "_grove_index() {",
+        "    local kind=\"$1\" dir=\"$PWD\" k v",
+        "    while [[ -n \"$dir\" ]]; do",
+        "        if [[ -f \"$dir/.grove/completion-index\" ]]; then",
+        "            while IFS=$'\\t' read -r k v; do",
+        "                [[ \"$k\" == \"$kind\" && \"$v\" == \"$cur\"* ]] && COMPREPLY+=(\"$v\")",
+        "            done < \"$dir/.grove/completion-index\"",
+        "            return",
+        "        fi",
+        "        dir=\"${dir%/*}\"",
+        "    done",
+        "}",
+        "",
+        "_grove() {",
+        "    local cur prev cmd i",
+        "    COMPREPLY=()",
+        "    cur=\"${COMP_WORDS[COMP_CWORD]}\"",
+        "    prev=\"${COMP_WORDS[COMP_CWORD-1]}\"",
+        "    cmd=\"\"",
+        "    for ((i = 1; i < COMP_CWORD; i++)); do",
+        "        case \"${COMP_WORDS[i]}\" in",
+        "            -*) ;;",
+        "            *) cmd=\"${COMP_WORDS[i]}\"; break ;;",
+        "        esac",
+        "    done",
+        "",
+        "    if [[ -z \"$cmd\" ]]; then",
+        f"        COMPREPLY=($(compgen -W \"{_words([c.name for c in commands] + ['--help'])}\" -- \"$cur\"))",
+        "        return",
+        "    fi",
+        "",
+        "    case \"$cmd:$prev\" in",
+    ]
+    for command in commands:
+        for option in command.options:
+            if not option.takes_value:
+                continue
+            pattern = "|".join(f"{command.name}:{opt}" for opt in option.opts)
+            if option.choices:
+                action = f"COMPREPLY=($(compgen -W \"{_words(option.choices)}\" -- \"$cur\"))"
+            elif option.index:
+                action = f"_grove_index {option.index}"
+            elif option.directory:
+                action = "COMPREPLY=($(compgen -d -- \"$cur\"))"
+            else:
+                action = ":"
+            lines.append(f"        {pattern}) {action}; return ;;")
+    lines += [
+        "    esac",
+        "",
+        "    case \"$cmd\" in",
+    ]
+    for command in commands:
+        opts = [opt for option in command.options for opt in option.opts]
+        lines.append(f"        {command.name})")
+        lines.append("            if [[ \"$cur\" == -* ]]; then")
+        lines.append(f"                COMPREPLY=($(compgen -W \"{_words(opts)}\" -- \"$cur\"))")
+        arg = command.argument
+        if arg is not None and arg.choices:
+            lines.append("            else")
+            lines.append(f"                COMPREPLY=($(compgen -W \"{_words(arg.choices)}\" -- \"$cur\"))")
+        elif arg is not None and arg.directory:
+            lines.append("            else")
+            lines.append("                COMPREPLY=($(compgen -d -- \"$cur\"))")
+        lines.append("            fi")
+        lines.append("            ;;")
+    lines += [
+        "    esac",
+        "}",
+        "",
+        "complete -o default -F _grove grove",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _zsh_desc(text: str) -> str:
+    return _sq(text.replace("\\", "\\\\").replace("[", "\\[").replace("]", "\\]"))
+
+
+def render_zsh(commands: List[CommandCompletion], version: str) -> str:
+    """Render a native zsh completion function (`_grove`)."""
+    lines = [
+        "#compdef grove",
+        f"# grove shell completion for zsh (generated by grove {version}; re-run `grove completion --install` after upgrading)",
+        "",
+        "_grove_index() {",
+        "    local kind=$1 dir=$PWD line",
+        "    local -a values",
+        "    while [[ -n $dir ]]; do",
+        "        if [[ -f $dir/.grove/completion-index ]]; then",
+        "            for line in ${(f)\"$(<$dir/.grove/completion-index)\"}; do",
+        "                [[ ${line%%$'\\t'*} == $kind ]] && values+=(${line#*$'\\t'})",
+        "            done",
+        "            break",
+        "        fi",
+        "        dir=${dir%/*}",
+        "    done",
+        "    compadd -a values",
+        "}",
+        "",
+        "_grove() {",
+        "    local -a commands",
+        "    commands=(",
+    ]
+    for command in commands:
+        lines.append(f"        '{_sq(command.name)}:{_zsh_desc(command.help)}'")
+    lines += [
+        "    )",
+        "",
+        "    if (( CURRENT == 2 )); then",
+        "        _describe 'command' commands",
+        "        return",
+        "    fi",
+        "",
+        "    local cmd=${words[2]}",
+        "    shift words",
+        "    (( CURRENT-- ))",
+        "    case $cmd in",
+    ]
+    for command in commands:
+        specs = []
+        for option in command.options:
+            desc = _zsh_desc(option.help)
+            for opt in option.opts:
+                spec = f"'{'*' if option.multiple else ''}{opt}[{desc}]"
+                if option.takes_value:
+                    if option.choices:
+                        spec += f":value:({_words(option.choices)})"
+                    elif option.index:
+                        spec += f":value:_grove_index {option.index}"
+                    elif option.directory:
+                        spec += ":directory:_files -/"
+                    else:
+                        spec += ":value: "
+                specs.append(spec + "'")
+        arg = command.argument
+        if arg is not None:
+            if arg.choices:
+                specs.append(f"'1:argument:({_words(arg.choices)})'")
+            elif arg.directory:
+                specs.append("'1:directory:_files -/'")
+            else:
+                specs.append("'1:argument: '")
+        lines.append(f"        {command.name})")
+        lines.append("            _arguments \\")
+        for spec in specs[:-1]:
+            lines.append(f"                {spec} \\")
+        lines.append(f"                {specs[-1]}")
+        lines.append("            ;;")
+    lines += [
+        "    esac",
+        "}",
+        "",
+        "if [[ $zsh_eval_context[-1] == loadautofunc ]]; then",
+        "    _grove \"$@\"",
+        "else",
+        "    compdef _grove grove",
+        "fi",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def render_fish(commands: List[CommandCompletion], version: str) -> str:
+    """Render a fish completion script."""
+    lines = [
+        f"# grove shell completion for fish (generated by grove {version}; re-run `grove completion --install` after upgrading)",
+        "",
+        "function __grove_index",
+        "    set -l dir $PWD",
+        "    while test -n \"$dir\"",
+        "        if test -f \"$dir/.grove/completion-index\"",
+        "            string replace -r -f -- \"^$argv[1]\\t\" '' < \"$dir/.grove/completion-index\"",
+        "            return",
+        "        end",
+        "        set dir (string replace -r '/[^/]*$' '' -- $dir)",
+        "    end",
+        "end",
+        "",
+        "complete -c grove -f",
+    ]
+    for command in commands:
+        lines.append(f"complete -c grove -n __fish_use_subcommand -a {command.name} -d '{_sq(command.help)}'")
+    for command in commands:
+        cond = f"-n '__fish_seen_subcommand_from {command.name}'"
+        for option in command.options:
+            flags = " ".join(f"-l {opt[2:]}" if opt.startswith("--") else f"-s {opt[1:]}" for opt in option.opts)
+            entry = f"complete -c grove {cond} {flags} -d '{_sq(option.help)}'"
+            if option.takes_value:
+                if option.choices:
+                    entry += f" -xa '{_words(option.choices)}'"
+                elif option.index:
+                    entry += f" -xa '(__grove_index {option.index})'"
+                elif option.directory:
+                    entry += " -xa '(__fish_complete_directories)'"
+                else:
+                    entry += " -x"
+            lines.append(entry)
+        arg = command.argument
+        if arg is not None and arg.choices:
+            lines.append(f"complete -c grove {cond} -a '{_words(arg.choices)}'")
+        elif arg is not None and arg.directory:
+            lines.append(f"complete -c grove {cond} -a '(__fish_complete_directories)'")
+    return "\n".join(lines) + "\n"
+
+
+RENDERERS = {
+    "bash": render_bash,
+    "zsh": render_zsh,
+    "fish": render_fish,
+}
+
+
+def render_completion(shell: str, version: str) -> str:
+    """Generate the static completion script for `shell`."""
+    return RENDERERS[shell](collect_commands(), version)
+
+
+def completion_install_path(shell: str) -> Path:
+    """Return the per-user location each shell loads completions from."""
+    home = Path.home()
+    if shell == "bash":
+        data_home = Path(os.getenv("XDG_DATA_HOME") or home / ".local" / "share")
+        return data_home / "bash-completion" / "completions" / "grove"
+    if shell == "zsh":
+        return home / ".zfunc" / "_grove"
+    config_home = Path(os.getenv("XDG_CONFIG_HOME") or home / ".config")
+    return config_home / "fish" / "completions" / "grove.fish"
+
+
+def detect_shell() -> Optional[str]:
+    """Guess the user's shell from $SHELL."""
+    name = Path(os.getenv("SHELL", "")).name
+    return name if name in SUPPORTED_SHELLS else None
@@ -0,0 +1,344 @@
+"""Static configuration: supported agents, languages, I18N strings and project config."""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+# =============================================================================
+# AI Agent Support
+# =============================================================================
+
+SUPPORTED_AI_AGENTS = ["claude", "codex"]
+
+# =============================================================================
+# Language Support (ja, en)
+# =============================================================================
+
+SUPPORTED_LANGUAGES = ["ja", "en"]
+
+LANGUAGE_NAMES = {
+    "ja": "日本語 (Japanese)",
+    "en": "English",
+}
+
+# Global language setting (default to English for compatibility with grove)
+_current_lang = "en"
+
+def get_lang() -> str:
+    """Get current language setting."""
+    return _current_lang
+
+def set_lang(lang: str) -> None:
+    """Set current language."""
+    global _current_lang
+    if lang in SUPPORTED_LANGUAGES:
+        _current_lang = lang
+
+# Internationalization dictionary
+I18N = {
+    "ja": {
+        "tagline": "Grove - 仕様駆動開発ツールキット",
+        "banner_subtitle": "拡張版 - 多言語対応",
+        "help_usage": "'grove --help' で使用方法を表示",
+        # init command messages
+        "selected_language": "選択された言語",
+        "selected_ai": "選択されたAIアシスタント",
+        "selected_script": "選択されたスクリプトタイプ",
+        "warning_not_empty": "警告: カレントディレクトリは空ではありません",
+        "items_found": "個のアイテムが存在します",
+        "template_merge_warning": "テンプレートファイルは既存のコンテンツとマージされ、既存のファイルを上書きする可能性があります",
+        "force_skipping_confirmation": "--force が指定されました: 確認をスキップしてマージを続行します",
+        "confirm_continue": "続行しますか?",
+        "operation_cancelled": "操作がキャンセルされました",
+        "error_unsupported_language": "エラー: サポートされていない言語",
+        "supported_languages": "サポート対象",
+        "error_must_specify_project": "エラー: プロジェクト名を指定するか、カレントディレクトリには '.' を使用するか、--here フラグを使用してください",
+        # Project setup messages
+        "project_ready": "プロジェクトの準備が完了しました。",
+        "agent_folder_security": "エージェントフォルダーのセキュリティ",
+        "agent_folder_security_message": "一部のエージェントは、プロジェクト内のエージェントフォルダーに認証情報、認証トークン、またはその他の識別情報や個人的な成果物を保存する場合があります。\n誤って認証情報が漏洩するのを防ぐため、{folder}（またはその一部）を.gitignoreに追加することを検討してください。",
+        "next_steps": "次のステップ",
+        "next_steps_already_in_dir": "すでにプロジェクトディレクトリにいます！",
+        "next_steps_start_using": "AIエージェントでスラッシュコマンドを使い始める：",
+        "next_steps_constitution": "プロジェクトの原則を確立",
+        "next_steps_specify": "ベースライン仕様を作成",
+        "next_steps_design": "デザイン仕様を作成（オプション）",
+        "next_steps_plan": "実装計画を作成",
+        "next_steps_tasks": "実行可能なタスクを生成",
+        "next_steps_implement": "実装を実行",
+        "enhancement_commands": "拡張コマンド",
+        "enhancement_commands_desc": "仕様に使用できるオプションのコマンド（品質と信頼性を向上）",
+        "enhancement_clarify": "計画前に曖昧な領域をデリスクするための構造化された質問（使用する場合は /grove.plan の前に実行）",
+        "enhancement_analyze": "成果物間の整合性と一貫性レポート（/grove.tasks の後、/grove.implement の前）",
+        "enhancement_checklist": "要件の完全性、明確性、一貫性を検証する品質チェックリストを生成（/grove.plan の後）",
+        "enhancement_review": "実装の品質検証とクロスレビューを実行（/grove.implement の後）",
+        "enhancement_fix": "クロスレビューで検出された問題を修正（/grove.review の後）",
+        # StepTracker labels
+        "tracker_title": "Grove プロジェクトを初期化",
+        "tracker_precheck": "必要なツールをチェック",
+        "tracker_ai_select": "AIアシスタントを選択",
+        "tracker_script_select": "スクリプトタイプを選択",
+        "tracker_fetch": "最新リリースを取得",
+        "tracker_download": "テンプレートをダウンロード",
+        "tracker_extract": "テンプレートを展開",
+        "tracker_archive": "アーカイブ内容",
+        "tracker_extract_summary": "展開サマリー",
+        "tracker_chmod": "スクリプトに実行権限を設定",
+        "tracker_cleanup": "クリーンアップ",
+        "tracker_git_init": "Gitリポジトリを初期化",
+        "tracker_finalize": "最終処理",
+        "tracker_install_templates": "言語固有のテンプレートをインストール",
+    },
+    "en": {
+        "tagline": "Grove - Spec-Driven Development Toolkit",
+        "banner_subtitle": "Extended version with multi-language support",
+        "help_usage": "Run 'grove --help' for usage information",
+        # init command messages
+        "selected_language": "Selected language",
+        "selected_ai": "Selected AI assistant",
+        "selected_script": "Selected script type",
+        "warning_not_empty": "Warning: Current directory is not empty",
+        "items_found": "items",
+        "template_merge_warning": "Template files will be merged with existing content and may overwrite existing files",
+        "force_skipping_confirmation": "--force supplied: skipping confirmation and proceeding with merge",
+        "confirm_continue": "Do you want to continue?",
+        "operation_cancelled": "Operation cancelled",
+        "error_unsupported_language": "Error: Unsupported language",
+        "supported_languages": "Supported",
+        "error_must_specify_project": "Error: Must specify either a project name, use '.' for current directory, or use --here flag",
+        # Project setup messages
+        "project_ready": "Project ready.",
+        "agent_folder_security": "Agent Folder Security",
+        "agent_folder_security_message": "Some agents may store credentials, auth tokens, or other identifying and private artifacts in the agent folder within your project.\nConsider adding {folder} (or parts of it) to .gitignore to prevent accidental credential leakage.",
+        "next_steps": "Next Steps",
+        "next_steps_already_in_dir": "You're already in the project directory!",
+        "next_steps_start_using": "Start using slash commands with your AI agent:",
+        "next_steps_constitution": "Establish project principles",
+        "next_steps_specify": "Create baseline specification",
+        "next_steps_design": "Create design specification (optional)",
+        "next_steps_plan": "Create implementation plan",
+        "next_steps_tasks": "Generate actionable tasks",
+        "next_steps_implement": "Execute implementation",
+        "enhancement_commands": "Enhancement Commands",
+        "enhancement_commands_desc": "Optional commands that you can use for your specs (improve quality & confidence)",
+        "enhancement_clarify": "Ask structured questions to de-risk ambiguous areas before planning (run before /grove.plan if used)",
+        "enhancement_analyze": "Cross-artifact consistency & alignment report (after /grove.tasks, before /grove.implement)",
+        "enhancement_checklist": "Generate quality checklists to validate requirements completeness, clarity, and consistency (after /grove.plan)",
+        "enhancement_review": "Execute quality verification and cross-review of implementation (after /grove.implement)",
+        "enhancement_fix": "Fix issues detected in cross-review (after /grove.review)",
+        # StepTracker labels
+        "tracker_title": "Initialize Grove Project",
+        "tracker_precheck": "Check required tools",
+        "tracker_ai_select": "Select AI assistant",
+        "tracker_script_select": "Select script type",
+        "tracker_fetch": "Fetch latest release",
+        "tracker_download": "Download template",
+        "tracker_extract": "Extract template",
+        "tracker_archive": "Archive contents",
+        "tracker_extract_summary": "Extraction summary",
+        "tracker_chmod": "Set script permissions recursively",
+        "tracker_cleanup": "Cleanup",
+        "tracker_git_init": "Initialize git repository",
+        "tracker_finalize": "Finalize",
+        "tracker_install_templates": "Installing language-specific templates",
+    },
+}
+
+
+def t(key: str) -> str:
+    """Get translated string for current language."""
+    return I18N.get(_current_lang, I18N["en"]).get(key, key)
+
+# =============================================================================
+# Project Configuration Management
+# =============================================================================
+
+def load_project_config(project_dir: Path) -> dict:
+    """Load project configuration from .grove/memory/config.json
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        Configuration dictionary (returns default if file doesn't exist)
+    """
+    config_file = project_dir / ".grove" / "memory" / "config.json"
+    if config_file.exists():
+        return json.loads(config_file.read_text())
+    return {"language": "en", "version": "0.2.0"}
+
+def save_project_config(project_dir: Path, config: dict) -> None:
+    """Save project configuration to .grove/memory/config.json
+
+    Args:
+        project_dir: Project root directory
+        config: Configuration dictionary to save
+    """
+    config_dir = project_dir / ".grove" / "memory"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    config_file = config_dir / "config.json"
+    config["version"] = "0.2.0"
+    if "created_at" not in config:
+        config["created_at"] = datetime.now(timezone.utc).isoformat()
+    config_file.write_text(json.dumps(config, indent=2, ensure_ascii=False))
+
+def get_project_language(project_dir: Path) -> str:
+    """Get language setting from project config
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        Language code ("ja" or "en")
+    """
+    config = load_project_config(project_dir)
+    return config.get("language", "en")
+
+def is_claude_code_environment(ai_param: str = None) -> bool:
+    """
+    Detect Claude Code environment.
+
+    Detection method:
+    1. Check --ai parameter (if ai_param is None or "claude" → Claude Code)
+    2. (Optional) Check CLAUDE_CODE_VERSION environment variable
+
+    Args:
+        ai_param: AI agent parameter from command line
+
+    Returns:
+        True if Claude Code environment detected, False otherwise
+    """
+    # --ai parameter check
+    if ai_param is None or ai_param == "claude":
+        return True
+
+    # Environment variable check (optional)
+    has_env_var = os.getenv("CLAUDE_CODE_VERSION") is not None
+
+    return has_env_var
+
+# =============================================================================
+# Agent Configuration
+# =============================================================================
+
+# Agent configuration with name, folder, install URL, and CLI tool requirement
+AGENT_CONFIG = {
+    "copilot": {
+        "name": "GitHub Copilot",
+        "folder": ".github/",
+        "install_url": None,  # IDE-based, no CLI check needed
+        "requires_cli": False,
+    },
+    "claude": {
+        "name": "Claude Code",
+        "folder": ".claude/",
+        "install_url": "https://docs.anthropic.com/en/docs/claude-code/setup",
+        "requires_cli": True,
+    },
+    "gemini": {
+        "name": "Gemini CLI",
+        "folder": ".gemini/",
+        "install_url": "https://github.com/google-gemini/gemini-cli",
+        "requires_cli": True,
+    },
+    "cursor-agent": {
+        "name": "Cursor",
+        "folder": ".cursor/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+    },
+    "qwen": {
+        "name": "Qwen Code",
+        "folder": ".qwen/",
+        "install_url": "https://github.com/QwenLM/qwen-code",
+        "requires_cli": True,
+    },
+    "opencode": {
+        "name": "opencode",
+        "folder": ".opencode/",
+        "install_url": "https://opencode.ai",
+        "requires_cli": True,
+    },
+    "codex": {
+        "name": "Codex CLI",
+        "folder": ".codex/",
+        "install_url": "https://github.com/openai/codex",
+        "requires_cli": True,
+    },
+    "windsurf": {
+        "name": "Windsurf",
+        "folder": ".windsurf/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+    },
+    "kilocode": {
+        "name": "Kilo Code",
+        "folder": ".kilocode/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+    },
+    "auggie": {
+        "name": "Auggie CLI",
+        "folder": ".augment/",
+        "install_url": "https://docs.augmentcode.com/cli/setup-auggie/install-auggie-cli",
+        "requires_cli": True,
+    },
+    "codebuddy": {
+        "name": "CodeBuddy",
+        "folder": ".codebuddy/",
+        "install_url": "https://www.codebuddy.ai/cli",
+        "requires_cli": True,
+    },
+    "qoder": {
+        "name": "Qoder CLI",
+        "folder": ".qoder/",
+        "install_url": "https://qoder.com/cli",
+        "requires_cli": True,
+    },
+    "roo": {
+        "name": "Roo Code",
+        "folder": ".roo/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+    },
+    "q": {
+        "name": "Amazon Q Developer CLI",
+        "folder": ".amazonq/",
+        "install_url": "https://aws.amazon.com/developer/learning/q-developer-cli/",
+        "requires_cli": True,
+    },
+    "amp": {
+        "name": "Amp",
+        "folder": ".agents/",
+        "install_url": "https://ampcode.com/manual#install",
+        "requires_cli": True,
+    },
+    "shai": {
+        "name": "SHAI",
+        "folder": ".shai/",
+        "install_url": "https://github.com/ovh/shai",
+        "requires_cli": True,
+    },
+    "bob": {
+        "name": "IBM Bob",
+        "folder": ".bob/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+    },
+}
+
+SCRIPT_TYPE_CHOICES = {"sh": "POSIX Shell (bash/zsh)", "ps": "PowerShell"}
+
+CLAUDE_LOCAL_PATH = Path.home() / ".claude" / "local" / "claude"
+
+BANNER = """
+ ██████╗ ██████╗  ██████╗ ██╗   ██╗███████╗
+██╔════╝ ██╔══██╗██╔═══██╗██║   ██║██╔════╝
+██║  ███╗██████╔╝██║   ██║██║   ██║█████╗
+██║   ██║██╔══██╗██║   ██║╚██╗ ██╔╝██╔══╝
+╚██████╔╝██║  ██║╚██████╔╝ ╚████╔╝ ███████╗
+ ╚═════╝ ╚═╝  ╚═╝ ╚═════╝   ╚═══╝  ╚══════╝
+"""
+
+TAGLINE = "Grove - Spec-Driven Development Toolkit"
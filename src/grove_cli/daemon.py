@@ -0,0 +1,216 @@
+"""`grove serve` daemon and its client shim.
+
+The daemon listens on a Unix domain socket and answers newline-delimited JSON
+requests:
+
+    {"op": "sync", "params": {"project_dir": "/path/to/project"}}
+    -> {"ok": true, "result": {"count": 12, ...}}
+
+It keeps project config, parsed templates, the `.grove/docs` index and the
+HTTP session warm between requests. `request()` talks to a running daemon and
+falls back to running the same handler in-process when none is listening, so
+callers never need to know whether `grove serve` is up.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from .project import GroveProject, GroveState, shared_state
+
+SOCKET_ENV = "GROVE_SOCKET"
+
+# Time to wait for a daemon reply before giving up on the socket
+CLIENT_TIMEOUT = 300.0
+
+def default_socket_path() -> Path:
+    """Return the daemon socket path ($GROVE_SOCKET or the per-user runtime directory)."""
+    override = os.getenv(SOCKET_ENV)
+    if override:
+        return Path(override)
+    from platformdirs import user_runtime_dir
+
+    return Path(user_runtime_dir("grove")) / "grove.sock"
+
+# =============================================================================
+# Operations
+# =============================================================================
+
+def _project(state: GroveState, params: dict) -> GroveProject:
+    return GroveProject(params.get("project_dir") or os.getcwd(), state)
+
+def _int_param(params: dict, key: str) -> Optional[int]:
+    # `grove call` passes every value other than true/false as a string
+    value = params.get(key)
+    if value is None:
+        return None
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        number = 0
+    if isinstance(value, bool) or number < 1:
+        raise ValueError(f"{key} must be a positive integer, got {value!r}")
+    return number
+
+def _op_ping(state: GroveState, params: dict) -> dict:
+    from . import __version__
+
+    return {"pid": os.getpid(), "version": __version__, "uptime": round(time.time() - state.started, 3)}
+
+def _op_config(state: GroveState, params: dict) -> dict:
+    return _project(state, params).config
+
+def _op_paths(state: GroveState, params: dict) -> dict:
+    return _project(state, params).feature_paths()
+
+def _op_templates_root(state: GroveState, params: dict) -> str:
+    return str(state.templates_root())
+
+def _op_template(state: GroveState, params: dict) -> Optional[str]:
+    return _project(state, params).template(params["command"])
+
+def _op_docs(state: GroveState, params: dict) -> list:
+    return _project(state, params).docs(refresh=bool(params.get("refresh")))
+
+def _op_sync(state: GroveState, params: dict) -> dict:
+    result = _project(state, params).sync_docs(params.get("src"), bool(params.get("auto")), _int_param(params, "jobs"))
+    return {"count": result.count, "src": str(result.src_dir), "docs": str(result.docs_dir), "warnings": result.warnings}
+
+def _op_record(state: GroveState, params: dict) -> dict:
+    return {"count": _project(state, params).record_changes()}
+
+OPERATIONS: Dict[str, Callable[[GroveState, dict], Any]] = {
+    "ping": _op_ping,
+    "config": _op_config,
+    "paths": _op_paths,
+    "templates_root": _op_templates_root,
+    "template": _op_template,
+    "docs": _op_docs,
+    "sync": _op_sync,
+    "record": _op_record,
+}
+
+def dispatch(state: GroveState, op: str, params: Optional[dict] = None) -> dict:
+    """Run one operation and wrap the outcome in the wire response format."""
+    handler = OPERATIONS.get(op)
+    if handler is None:
+        return {"ok": False, "error": f"Unknown operation '{op}'. Available: {', '.join(OPERATIONS)}"}
+    try:
+        return {"ok": True, "result": handler(state, params or {})}
+    except Exception as e:
+        return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+# =============================================================================
+# Server
+# =============================================================================
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+                op, params = message.get("op", ""), message.get("params") or {}
+            except (ValueError, AttributeError) as e:
+                response = {"ok": False, "error": f"Malformed request: {e}"}
+            else:
+                if op == "shutdown":
+                    response = {"ok": True, "result": None}
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                else:
+                    response = dispatch(self.server.state, op, params)
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+class GroveServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path):
+        self.state = GroveState()
+        super().__init__(str(socket_path), _RequestHandler)
+
+def serve(socket_path: Optional[Path] = None, on_ready: Optional[Callable[[Path], None]] = None) -> None:
+    """Serve requests on `socket_path` until interrupted or sent `shutdown`.
+
+    Raises:
+        RuntimeError: If Unix domain sockets are unavailable or a daemon is already listening
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("grove serve requires Unix domain socket support")
+
+    socket_path = socket_path or default_socket_path()
+    socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    if socket_path.exists():
+        if _connect(socket_path) is not None:
+            raise RuntimeError(f"A grove daemon is already listening on {socket_path}")
+        socket_path.unlink()  # stale socket from a crashed daemon
+
+    server = GroveServer(socket_path)
+    try:
+        os.chmod(socket_path, 0o600)
+        # Warm the HTTP session and templates root before the first request
+        from .github import get_http_client
+
+        get_http_client()
+        try:
+            server.state.templates_root()
+        except RuntimeError:
+            pass
+        if on_ready:
+            on_ready(socket_path)
+        server.serve_forever()
+    finally:
+        server.server_close()
+        try:
+            socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+# =============================================================================
+# Client shim
+# =============================================================================
+
+def _connect(socket_path: Path) -> Optional[socket.socket]:
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+def request(op: str, params: Optional[dict] = None, *, socket_path: Optional[Path] = None, fallback: bool = True) -> dict:
+    """Send one request to the daemon, or run it in-process when no daemon is listening.
+
+    Returns:
+        Response dict with `ok` and `result` or `error`; `served_by` is
+        "daemon" or "local"
+
+    Raises:
+        ConnectionError: If no daemon is listening and `fallback` is False
+    """
+    sock = _connect(socket_path or default_socket_path())
+    if sock is not None:
+        with sock:
+            sock.settimeout(CLIENT_TIMEOUT)
+            sock.sendall(json.dumps({"op": op, "params": params or {}}).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        if line:
+            response = json.loads(line)
+            response["served_by"] = "daemon"
+            return response
+
+    if not fallback:
+        raise ConnectionError("No grove daemon is listening")
+    response = dispatch(shared_state(), op, params)
+    response["served_by"] = "local"
+    return response
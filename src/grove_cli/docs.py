@@ -0,0 +1,575 @@
+"""Documentation management: `.grove/docs` generation and change history."""
+
+import json
+import os
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .ui import console
+from .walk import DirListing, scan_dir
+
+# Directories left out of the generated documentation
+EXCLUDED_DIRS = ["node_modules", "__pycache__", "venv", "env", "dist", "build"]
+
+# Incremental sync state, kept in .grove/docs/ (see sync_directory_docs)
+SYNC_INDEX_NAME = ".sync-index"
+SYNC_INDEX_VERSION = 1
+
+SYNC_JOBS_ENV = "GROVE_SYNC_JOBS"
+
+# Window within which a directory's mtime may not yet reflect every change
+_RACY_NS = 2 * 1_000_000_000
+
+def detect_source_directory(project_dir: Path) -> Optional[Path]:
+    """
+    Auto-detect source directory in project.
+
+    Args:
+        project_dir: Project directory path
+
+    Returns:
+        Path to source directory, or None if not found
+    """
+    # Common source directory names (priority order)
+    candidates = ["src", "app", "lib", "pkg", "source", "code", "core"]
+
+    try:
+        listing = scan_dir(project_dir, follow_symlinks=True)
+    except OSError:
+        return None
+    subdirs = {entry.name for entry in listing.dirs}
+    for candidate in candidates:
+        if candidate in subdirs:
+            return project_dir / candidate
+
+    return None
+
+def generate_index_md(dir_path: Path, relative_to: Path, listing: Optional[DirListing] = None) -> str:
+    """
+    Generate index.md content with directory structure and file list.
+
+    Args:
+        dir_path: Directory to document
+        relative_to: Base directory for relative paths
+        listing: `dir_path` as already listed by `scan_dir` (listed here if omitted)
+
+    Returns:
+        Markdown content for index.md
+    """
+    rel_path = dir_path.relative_to(relative_to)
+    content = f"# Index: {rel_path}\n\n"
+    content += "## Directory Structure\n\n```\n"
+
+    try:
+        if listing is None:
+            listing = scan_dir(dir_path, follow_symlinks=True)
+    except PermissionError:
+        content += "(Permission denied)\n```\n\n## Files\n\n(Permission denied)\n"
+        return content
+
+    # List files and directories
+    for entry in listing.entries:
+        if entry.name.startswith("."):
+            continue
+        if entry.name in EXCLUDED_DIRS:
+            continue
+
+        prefix = "📁 " if entry.is_dir() else "📄 "
+        content += f"{prefix}{entry.name}\n"
+
+    content += "```\n\n"
+    content += "## Files\n\n"
+
+    # List file documentation links
+    for entry in listing.entries:
+        if entry.is_file() and not entry.name.startswith("."):
+            stem = Path(entry.name).stem
+            content += f"- [{entry.name}](./{stem}.md)\n"
+
+    return content
+
+def generate_readme_md(dir_path: Path, relative_to: Path) -> str:
+    """
+    Generate README.md content with detailed specification template.
+
+    Args:
+        dir_path: Directory to document
+        relative_to: Base directory for relative paths
+
+    Returns:
+        Markdown content for README.md
+    """
+    rel_path = dir_path.relative_to(relative_to)
+    content = f"# {rel_path}\n\n"
+    content += "## Purpose\n\n"
+    content += "[Describe the purpose of this directory]\n\n"
+    content += "## Architecture\n\n"
+    content += "[Describe the architecture and design patterns used]\n\n"
+    content += "## Key Components\n\n"
+    content += "[List and describe key components]\n\n"
+    content += "## Dependencies\n\n"
+    content += "[List dependencies and their purposes]\n\n"
+    return content
+
+def generate_file_md(file_path: Path, relative_to: Path) -> str:
+    """
+    Generate {filename}.md content for individual file documentation.
+
+    Args:
+        file_path: File to document
+        relative_to: Base directory for relative paths
+
+    Returns:
+        Markdown content for file documentation
+    """
+    rel_path = file_path.relative_to(relative_to)
+    content = f"# {file_path.name}\n\n"
+    content += f"**Path**: `{rel_path}`\n\n"
+    content += "## Purpose\n\n"
+    content += "[Describe the purpose of this file]\n\n"
+    content += "## Key Functions/Classes\n\n"
+    content += "[List and describe key functions or classes]\n\n"
+    content += "## Dependencies\n\n"
+    content += "[List dependencies]\n\n"
+    content += "## Change History\n\n"
+    content += f"### {datetime.now().strftime('%Y-%m-%d')}: Initial documentation\n\n"
+    content += "- Created documentation\n\n"
+    return content
+
+def load_sync_index(path: Path) -> dict:
+    """Return the sync index at `path` (see `sync_directory_docs`), or an empty one."""
+    try:
+        index = json.loads(path.read_text(encoding="utf-8"))
+        if index.get("version") == SYNC_INDEX_VERSION and isinstance(index.get("trees"), dict):
+            return index
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"version": SYNC_INDEX_VERSION, "trees": {}}
+
+def save_sync_index(path: Path, index: dict) -> None:
+    from .cache import write_atomic
+
+    # dumps() uses the C encoder; dump() would stream through the Python one
+    write_atomic(path, json.dumps(index, separators=(",", ":")))
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def _write_doc(path: Path, content: str) -> int:
+    from .materialize import write_if_changed
+
+    return int(write_if_changed(content.encode("utf-8"), path))
+
+def _sync_listing(src: Path, docs: Path, old: Optional[dict], auto: bool, on_warning: Callable[[str], None]) -> Tuple[dict, int]:
+    """Regenerate the docs of one directory whose listing (or docs) changed.
+
+    Returns:
+        Tuple of (entries for the index, number of files written)
+    """
+    from .cache import sha256_file
+
+    written = 0
+    docs.mkdir(parents=True, exist_ok=True)
+
+    # The one listing of this directory serves index.md and the file docs
+    try:
+        listing = scan_dir(src, follow_symlinks=True)
+    except PermissionError:
+        listing = None
+
+    index_path = docs / "index.md"
+    if auto or not index_path.exists():
+        written += _write_doc(index_path, generate_index_md(src, src.parent, listing))
+    readme_path = docs / "README.md"
+    if auto or not readme_path.exists():
+        written += _write_doc(readme_path, generate_readme_md(src, src.parent))
+
+    # Hashes are only trusted from runs that regenerated the docs (--auto)
+    previous = old["entries"] if old is not None and old["auto"] else {}
+    entries: Dict[str, Optional[list]] = {}
+    if listing is None:
+        on_warning(f"Permission denied for {src}")
+        return entries, written
+
+    for entry in listing.entries:
+        if entry.name.startswith(".") or entry.name in EXCLUDED_DIRS:
+            continue
+        if entry.is_file():
+            st = entry.stat()
+            record = [st.st_size, st.st_mtime_ns, None]
+            prev = previous.get(entry.name)
+            if prev and prev[:2] == record[:2]:
+                record[2] = prev[2]
+            doc_path = docs / f"{Path(entry.name).stem}.md"
+            if auto:
+                if record[2] is None:
+                    record[2] = sha256_file(Path(entry.path))
+                if not prev or prev[2] != record[2] or not doc_path.exists():
+                    written += _write_doc(doc_path, generate_file_md(Path(entry.path), src.parent))
+            elif not doc_path.exists():
+                written += _write_doc(doc_path, generate_file_md(Path(entry.path), src.parent))
+            entries[entry.name] = record
+        elif entry.is_dir():
+            # Created now so that this directory's docs mtime stays put
+            (docs / entry.name).mkdir(exist_ok=True)
+            entries[entry.name] = None
+    return entries, written
+
+def _refresh_files(src: Path, docs: Path, entries: dict) -> int:
+    """Regenerate the docs of files whose content changed in a directory whose listing did not (--auto)."""
+    from .cache import sha256_file
+
+    written = 0
+    base = os.fspath(src)
+    for name, record in entries.items():
+        if record is None:
+            continue
+        try:
+            st = os.stat(os.path.join(base, name))
+        except OSError:
+            continue
+        if [st.st_size, st.st_mtime_ns] == record[:2]:
+            continue
+        digest = sha256_file(src / name)
+        if digest != record[2]:
+            written += _write_doc(docs / f"{Path(name).stem}.md", generate_file_md(src / name, src.parent))
+        entries[name] = [st.st_size, st.st_mtime_ns, digest]
+    return written
+
+def _refresh_outputs(src: Path, docs: Path, entries: dict, old_outputs: dict, racy_after: int) -> Tuple[dict, int]:
+    """Regenerate the docs of one directory that were edited or removed since the last --auto run.
+
+    Every generated doc's size and mtime is recorded, so a doc edited by
+    hand is overwritten by the next `--auto` run even when its source did
+    not change.
+
+    Returns:
+        Tuple of (size and mtime of every doc, for the index; number of files written)
+    """
+    # doc name -> source file it documents (None for the directory docs)
+    sources: Dict[str, Optional[str]] = {"index.md": None, "README.md": None}
+    for name, record in entries.items():
+        if record is not None:
+            # Same order as _sync_listing, so the last file with a stem owns its doc
+            sources[f"{os.path.splitext(name)[0]}.md"] = name
+
+    outputs: Dict[str, Optional[list]] = {}
+    written = 0
+    base = os.fspath(docs)
+    for doc_name, source in sources.items():
+        doc_path = os.path.join(base, doc_name)
+        try:
+            st = os.stat(doc_path)
+            current = [st.st_size, st.st_mtime_ns]
+        except OSError:
+            current = None
+        if current is None or current != old_outputs.get(doc_name):
+            if source is not None:
+                content = generate_file_md(src / source, src.parent)
+            elif doc_name == "index.md":
+                content = generate_index_md(src, src.parent)
+            else:
+                content = generate_readme_md(src, src.parent)
+            written += _write_doc(Path(doc_path), content)
+            st = os.stat(doc_path)
+            current = [st.st_size, st.st_mtime_ns]
+        # An edit within the same mtime tick would go unnoticed, so compare the content next time
+        outputs[doc_name] = current if current[1] < racy_after else None
+    return outputs, written
+
+def default_sync_jobs() -> int:
+    """Return the number of directories `grove sync` documents at once ($GROVE_SYNC_JOBS, default: the CPU count)."""
+    try:
+        jobs = int(os.getenv(SYNC_JOBS_ENV, "0"))
+    except ValueError:
+        jobs = 0
+    return jobs if jobs > 0 else os.cpu_count() or 1
+
+def sync_directory_docs(src_dir: Path, docs_dir: Path, auto: bool = False, on_warning: Optional[Callable[[str], None]] = None, *, index_path: Optional[Path] = None, jobs: Optional[int] = None) -> int:
+    """
+    Sync documentation for a directory tree, incrementally.
+
+    The sync index (`index_path`, default `.sync-index` next to `docs_dir`,
+    i.e. `.grove/docs/.sync-index`) records every source directory's mtime
+    and entries, with each file's size, mtime and (from --auto runs)
+    SHA-256, and the size and mtime of every doc an --auto run generated.
+    A directory whose listing and docs directory are unchanged since the
+    last run is not listed again; with `auto`, only the docs of files whose
+    content changed, and docs edited or removed since, are regenerated
+    there, so every doc still ends up as generated. Docs are written only
+    when their content differs.
+
+    Directories are processed by `jobs` worker threads (most of the work is
+    directory listing, stat and write system calls, which run in parallel).
+    Results are merged in depth-first order, so the docs, the index and the
+    warnings are the same for any number of jobs.
+
+    Args:
+        src_dir: Source directory to document
+        docs_dir: Documentation output directory
+        auto: If True, overwrite existing files
+        on_warning: Called with each warning message (default: print to console)
+        index_path: Sync index file (default: `docs_dir.parent / ".sync-index"`)
+        jobs: Directories processed at once (default: `default_sync_jobs()`; 1 is serial)
+
+    Returns:
+        Number of files generated
+    """
+    if on_warning is None:
+        on_warning = lambda message: console.print(f"[yellow]Warning:[/yellow] {message}")
+    if index_path is None:
+        index_path = docs_dir.parent / SYNC_INDEX_NAME
+
+    index = load_sync_index(index_path)
+    source = str(src_dir.resolve())
+    tree = index["trees"].get(docs_dir.name)
+    old_dirs = tree["dirs"] if tree and tree.get("src") == source else {}
+    # A directory changed this recently may change again within the same
+    # mtime tick, so it is listed again next time
+    racy_after = time.time_ns() - _RACY_NS
+
+    docs_dir.mkdir(parents=True, exist_ok=True)
+
+    def visit(relative: str) -> Optional[Tuple[dict, int, List[str]]]:
+        src, docs = src_dir / relative, docs_dir / relative
+        mtime = _mtime_ns(src)
+        if mtime is None:
+            return None
+        warnings: List[str] = []
+        written = 0
+        old = old_dirs.get(relative)
+        unchanged = old is not None and old["mtime"] == mtime and old["docs_mtime"] == _mtime_ns(docs) and (old["auto"] or not auto)
+        if unchanged:
+            entries = dict(old["entries"])
+            if auto:
+                written = _refresh_files(src, docs, entries)
+        else:
+            entries, written = _sync_listing(src, docs, old, auto, warnings.append)
+        # Recorded by --auto runs only; a run without --auto keeps them for the next one
+        outputs = old.get("outputs", {}) if old is not None and old["auto"] else {}
+        if auto:
+            outputs, refreshed = _refresh_outputs(src, docs, entries, outputs, racy_after)
+            written += refreshed
+        elif not unchanged:
+            outputs = {}
+        record = {
+            "mtime": mtime if mtime < racy_after else None,
+            "docs_mtime": _mtime_ns(docs),
+            "auto": auto or (unchanged and old["auto"]),
+            "entries": entries,
+            "outputs": outputs,
+        }
+        return record, written, warnings
+
+    def subdirs(relative: str, result) -> List[str]:
+        if result is None:
+            return []
+        names = [name for name, entry in result[0]["entries"].items() if entry is None]
+        return [f"{relative}/{name}" if relative else name for name in names]
+
+    if jobs is None:
+        jobs = default_sync_jobs()
+    results = {}
+    if jobs <= 1:
+        pending = [""]
+        while pending:
+            relative = pending.pop()
+            results[relative] = visit(relative)
+            pending.extend(reversed(subdirs(relative, results[relative])))
+    else:
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        # Each directory is one task; its subdirectories are queued as soon
+        # as its listing is known, so the tree is walked once
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="grove-sync") as pool:
+            futures = {pool.submit(visit, ""): ""}
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    relative = futures.pop(future)
+                    results[relative] = future.result()
+                    for child in subdirs(relative, results[relative]):
+                        futures[pool.submit(visit, child)] = child
+
+    # Merge in depth-first order, whatever order the tasks finished in
+    count = 0
+    dirs: Dict[str, dict] = {}
+    for relative in sorted(results, key=lambda relative: relative.split("/")):
+        if results[relative] is None:
+            continue
+        record, written, warnings = results[relative]
+        dirs[relative] = record
+        count += written
+        for message in warnings:
+            on_warning(message)
+
+    if dirs != old_dirs:
+        index["trees"][docs_dir.name] = {"src": source, "dirs": dirs}
+        save_sync_index(index_path, index)
+    return count
+
+def get_changed_files(project_dir: Path) -> list[str]:
+    """
+    Get list of changed files using git diff.
+
+    Args:
+        project_dir: Project directory path
+
+    Returns:
+        List of changed file paths relative to project directory
+    """
+    try:
+        # Get git diff for staged and unstaged changes
+        result = subprocess.run(
+            ["git", "diff", "--name-only", "HEAD"],
+            cwd=project_dir,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        changed_files = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+        return changed_files
+
+    except subprocess.CalledProcessError:
+        # Not a git repository or no changes
+        return []
+
+def find_doc_file(file_path: Path, docs_dir: Path) -> Optional[Path]:
+    """
+    Find corresponding documentation file for a source file.
+
+    Args:
+        file_path: Source file path (relative to project root)
+        docs_dir: Documentation directory (.grove/docs/)
+
+    Returns:
+        Path to documentation file, or None if not found
+    """
+    # Extract relative path components
+    parts = file_path.parts
+
+    # Skip initial directories until we find src, app, lib, etc.
+    src_index = -1
+    for i, part in enumerate(parts):
+        if part in ["src", "app", "lib", "pkg", "source", "code", "core"]:
+            src_index = i
+            break
+
+    if src_index == -1:
+        return None
+
+    # Construct documentation path
+    # docs_dir / src / ... / {filename}.md
+    src_name = parts[src_index]
+    relative_parts = parts[src_index + 1:]
+
+    if len(relative_parts) == 0:
+        return None
+
+    # Build path to documentation file
+    doc_path = docs_dir / src_name
+    for part in relative_parts[:-1]:
+        doc_path = doc_path / part
+
+    # Get filename without extension
+    filename = relative_parts[-1]
+    stem = Path(filename).stem
+    doc_path = doc_path / f"{stem}.md"
+
+    return doc_path if doc_path.exists() else None
+
+def append_change_history(doc_file: Path, message: str, timestamp: datetime) -> None:
+    """
+    Append change history to documentation file.
+
+    Args:
+        doc_file: Documentation file path
+        message: Change message
+        timestamp: Change timestamp
+    """
+    # Read existing content
+    content = doc_file.read_text(encoding="utf-8")
+
+    # Check if "## Change History" section exists
+    if "## Change History" not in content:
+        # Add Change History section before the end
+        content += f"\n## Change History\n\n"
+
+    # Format new entry
+    date_str = timestamp.strftime("%Y-%m-%d")
+    entry = f"### {date_str}: Implementation update\n\n- {message}\n\n"
+
+    # Insert after "## Change History" header
+    lines = content.splitlines(keepends=True)
+    new_lines = []
+    inserted = False
+
+    for i, line in enumerate(lines):
+        new_lines.append(line)
+        if "## Change History" in line and not inserted:
+            # Skip empty lines after header
+            j = i + 1
+            while j < len(lines) and lines[j].strip() == "":
+                new_lines.append(lines[j])
+                j += 1
+
+            # Insert new entry
+            new_lines.append(entry)
+            inserted = True
+
+            # Add remaining lines
+            new_lines.extend(lines[j:])
+            break
+
+    # Write updated content
+    doc_file.write_text("".join(new_lines), encoding="utf-8")
+
+def record_implementation_changes(project_dir: Path) -> int:
+    """
+    Record implementation changes to documentation files.
+
+    Args:
+        project_dir: Project directory path
+
+    Returns:
+        Number of documentation files updated
+    """
+    # Get changed files
+    changed_files = get_changed_files(project_dir)
+    if not changed_files:
+        return 0
+
+    docs_dir = project_dir / ".grove" / "docs"
+    if not docs_dir.exists():
+        return 0
+
+    count = 0
+    timestamp = datetime.now()
+    today_str = timestamp.strftime("%Y-%m-%d")
+
+    for file_str in changed_files:
+        file_path = Path(file_str)
+
+        # Find corresponding documentation file
+        doc_file = find_doc_file(file_path, docs_dir)
+        if doc_file:
+            # Check if documentation already has today's update
+            if doc_file.exists():
+                content = doc_file.read_text(encoding="utf-8")
+                if f"### {today_str}:" in content:
+                    # Already updated today, skip
+                    continue
+
+            # Append change history only if not updated today
+            message = f"Updated {file_path.name}"
+            append_change_history(doc_file, message, timestamp)
+            count += 1
+
+    return count
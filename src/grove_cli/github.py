@@ -0,0 +1,784 @@
+"""GitHub release access: auth headers, rate-limit reporting and cached asset download.
+
+Releases come from the GitHub API unless `$GROVE_RELEASE_SOURCE` names
+another source: the base URL of a GitHub-compatible API or a `grove mirror
+serve` instance, or a local directory laid out like one:
+
+    <dir>/releases/latest                       release JSON
+    <dir>/releases/download/<tag>/<asset>       asset files
+"""
+
+import hashlib
+import math
+import os
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Tuple
+
+import typer
+from rich.panel import Panel
+
+from .session import GITHUB_HOSTS, get_session
+from .ui import console
+
+if TYPE_CHECKING:
+    import threading
+    from concurrent.futures import Future
+
+    import httpx
+
+REPO_OWNER = "cardene777"
+REPO_NAME = "grove"
+GITHUB_API_BASE = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}"
+LATEST_RELEASE_URL = f"{GITHUB_API_BASE}/releases/latest"
+
+RELEASE_SOURCE_ENV = "GROVE_RELEASE_SOURCE"
+
+def get_http_client() -> "httpx.Client":
+    """Return the pooled HTTP client of the shared (TLS-verifying) GitHub session."""
+    return get_session().client
+
+# =============================================================================
+# Release Source
+# =============================================================================
+
+class ReleaseSource(NamedTuple):
+    """Where `releases/latest` and its assets come from."""
+
+    location: str  # API/mirror base URL or local directory
+
+    @property
+    def is_local(self) -> bool:
+        return not self.location.startswith(("http://", "https://"))
+
+    @property
+    def is_default(self) -> bool:
+        return self.location == GITHUB_API_BASE
+
+    @property
+    def latest_url(self) -> str:
+        if self.is_local:
+            return str(Path(self.location) / "releases" / "latest")
+        return f"{self.location.rstrip('/')}/releases/latest"
+
+    def local_asset(self, tag: str, asset: dict) -> Path | None:
+        """Return the file for `asset` in a local directory source, if there is one."""
+        if not self.is_local:
+            return None
+        root = Path(self.location)
+        candidate = root / "releases" / "download" / tag / asset["name"]
+        if candidate.is_file():
+            return candidate
+        url = asset.get("browser_download_url") or ""
+        if url and not url.startswith(("http://", "https://")):
+            return root / url
+        return None
+
+def get_release_source() -> ReleaseSource:
+    """Return the configured release source ($GROVE_RELEASE_SOURCE, default the GitHub API)."""
+    value = os.getenv(RELEASE_SOURCE_ENV, "").strip()
+    if value.startswith("file://"):
+        from urllib.parse import urlparse
+        from urllib.request import url2pathname
+
+        value = url2pathname(urlparse(value).path)
+    return ReleaseSource(value or GITHUB_API_BASE)
+
+# =============================================================================
+# GitHub API Helper Functions
+# =============================================================================
+
+def _github_token(cli_token: str | None = None) -> str | None:
+    """Return sanitized GitHub token (cli arg takes precedence) or None."""
+    return ((cli_token or os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN") or "").strip()) or None
+
+def _github_auth_headers(cli_token: str | None = None) -> dict:
+    """Return Authorization header dict only when a non-empty token exists."""
+    token = _github_token(cli_token)
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+def _auth_headers_for(url: str, cli_token: str | None = None) -> dict:
+    """Like `_github_auth_headers`, but empty unless `url` is on a GitHub host (never leak the token to a mirror)."""
+    from urllib.parse import urlparse
+
+    return _github_auth_headers(cli_token) if urlparse(url).hostname in GITHUB_HOSTS else {}
+
+def _parse_rate_limit_headers(headers: "httpx.Headers") -> dict:
+    """Extract and parse GitHub rate-limit headers."""
+    info = {}
+    
+    # Standard GitHub rate-limit headers
+    if "X-RateLimit-Limit" in headers:
+        info["limit"] = headers.get("X-RateLimit-Limit")
+    if "X-RateLimit-Remaining" in headers:
+        info["remaining"] = headers.get("X-RateLimit-Remaining")
+    if "X-RateLimit-Reset" in headers:
+        reset_epoch = int(headers.get("X-RateLimit-Reset", "0"))
+        if reset_epoch:
+            reset_time = datetime.fromtimestamp(reset_epoch, tz=timezone.utc)
+            info["reset_epoch"] = reset_epoch
+            info["reset_time"] = reset_time
+            info["reset_local"] = reset_time.astimezone()
+    
+    # Retry-After header (seconds or HTTP-date)
+    if "Retry-After" in headers:
+        retry_after = headers.get("Retry-After")
+        try:
+            info["retry_after_seconds"] = int(retry_after)
+        except ValueError:
+            from .ratelimit import parse_retry_after
+
+            seconds = parse_retry_after(retry_after)
+            if seconds is None:
+                info["retry_after"] = retry_after
+            else:
+                info["retry_after_seconds"] = math.ceil(seconds)
+    
+    return info
+
+def _format_rate_limit_error(status_code: int, headers: "httpx.Headers", url: str) -> str:
+    """Format a user-friendly error message with rate-limit information."""
+    from .ratelimit import THROTTLED_HEADER
+
+    rate_info = _parse_rate_limit_headers(headers)
+    
+    if THROTTLED_HEADER in headers:
+        lines = [f"Did not request {url}: the GitHub rate limit for this token is used up until the reset below"]
+    else:
+        lines = [f"GitHub API returned status {status_code} for {url}"]
+    lines.append("")
+    
+    if rate_info:
+        lines.append("[bold]Rate Limit Information:[/bold]")
+        if "limit" in rate_info:
+            lines.append(f"  • Rate Limit: {rate_info['limit']} requests/hour")
+        if "remaining" in rate_info:
+            lines.append(f"  • Remaining: {rate_info['remaining']}")
+        if "reset_local" in rate_info:
+            reset_str = rate_info["reset_local"].strftime("%Y-%m-%d %H:%M:%S %Z")
+            lines.append(f"  • Resets at: {reset_str}")
+        if "retry_after_seconds" in rate_info:
+            lines.append(f"  • Retry after: {rate_info['retry_after_seconds']} seconds")
+        lines.append("")
+    
+    # Add troubleshooting guidance
+    lines.append("[bold]Troubleshooting Tips:[/bold]")
+    lines.append("  • If you're on a shared CI or corporate environment, you may be rate-limited.")
+    lines.append("  • Consider using a GitHub token via --github-token or the GH_TOKEN/GITHUB_TOKEN")
+    lines.append("    environment variable to increase rate limits.")
+    lines.append("  • Authenticated requests have a limit of 5,000/hour vs 60/hour for unauthenticated.")
+    
+    return "\n".join(lines)
+
+# Statuses for which cached metadata is served instead of failing
+_STALE_OK_STATUSES = {403, 429, 500, 502, 503, 504}
+
+def fetch_latest_release(client: "httpx.Client" = None, *, github_token: str = None, timeout: float = 30, debug: bool = False) -> Tuple[dict, str]:
+    """Return the latest release JSON, using the per-user release metadata cache.
+
+    The release is read from `get_release_source()`; a local directory source is
+    read directly and never cached. Fresh cache entries are returned without a request. Older ones are
+    revalidated with `If-None-Match`; a 304 costs no rate limit. If the API
+    cannot be reached (network error, rate limit, server error) a cached copy
+    of any age is returned instead.
+
+    Returns:
+        Tuple of (release data, source), where source is "cache", "not-modified",
+        "network", "stale" or "local"
+
+    Raises:
+        RuntimeError: If the request fails and nothing is cached
+    """
+    import httpx
+
+    from .cache import ReleaseCache
+
+    source = get_release_source()
+    latest_url = source.latest_url
+    if source.is_local:
+        import json
+
+        try:
+            return json.loads(Path(latest_url).read_text(encoding="utf-8")), "local"
+        except (OSError, ValueError) as e:
+            raise RuntimeError(f"Could not read release information from {latest_url}: {e}")
+
+    if client is None:
+        client = get_http_client()
+    cache = ReleaseCache()
+    cached = cache.get(latest_url)
+    if cached is not None and cache.is_fresh(cached):
+        return cached.data, "cache"
+
+    headers = _auth_headers_for(latest_url, github_token)
+    if cached is not None and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    try:
+        response = client.get(latest_url, timeout=timeout, follow_redirects=True, headers=headers)
+    except httpx.HTTPError as e:
+        if cached is not None:
+            return cached.data, "stale"
+        raise RuntimeError(f"Could not reach {latest_url}: {e}")
+
+    status = response.status_code
+    if status == 304 and cached is not None:
+        cache.put(latest_url, cached.data, cached.etag)
+        return cached.data, "not-modified"
+    if status != 200:
+        if cached is not None and status in _STALE_OK_STATUSES:
+            return cached.data, "stale"
+        # Format detailed error message with rate-limit info
+        error_msg = _format_rate_limit_error(status, response.headers, latest_url)
+        if debug:
+            error_msg += f"\n\n[dim]Response body (truncated 500):[/dim]\n{response.text[:500]}"
+        raise RuntimeError(error_msg)
+    try:
+        release_data = response.json()
+    except ValueError as je:
+        raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
+    cache.put(latest_url, release_data, response.headers.get("ETag"))
+    return release_data, "network"
+
+def _asset_sha256(asset: dict) -> str | None:
+    """Return the SHA-256 GitHub publishes for a release asset (`digest: "sha256:..."`), if any."""
+    algorithm, _, value = (asset.get("digest") or "").partition(":")
+    return value.lower() if algorithm == "sha256" and value else None
+
+def _fetch_release_or_exit(client: "httpx.Client", *, verbose: bool, debug: bool, github_token: str) -> Tuple[dict, str]:
+    if verbose:
+        console.print("[cyan]Fetching latest release information...[/cyan]")
+
+    try:
+        release_data, release_source = fetch_latest_release(client, github_token=github_token, debug=debug)
+        if release_source == "stale" and verbose:
+            console.print("[yellow]GitHub API unreachable; using cached release information[/yellow]")
+    except Exception as e:
+        console.print(f"[red]Error fetching release information[/red]")
+        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+        raise typer.Exit(1)
+    return release_data, release_source
+
+# =============================================================================
+# Resumable asset download
+# =============================================================================
+
+# Seconds to wait before each retry of a failed download
+DOWNLOAD_RETRY_DELAYS = (1, 2, 4, 8)
+
+# Longer Retry-After values fail the download instead of waiting
+MAX_RETRY_AFTER = 60
+
+# Bytes written, hashed and reported per batch; the batch grows with throughput
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 4 * 1024 * 1024
+CHUNK_TARGET_SECONDS = 0.25
+
+# Minimum seconds between progress bar updates
+PROGRESS_INTERVAL = 0.1
+
+# Release assets listing "<sha256>  <asset name>" lines, checked when GitHub publishes no digest
+CHECKSUM_MANIFEST_NAMES = ("SHA256SUMS", "SHA256SUMS.txt", "sha256sums.txt", "checksums.txt")
+
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class _RetryableDownloadError(Exception):
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class _DownloadCancelled(Exception):
+    pass
+
+def _manifest_sha256(release_data: dict, filename: str, client: "httpx.Client", github_token: str = None) -> str | None:
+    """Look up `filename` in the release's checksum manifest, if it publishes one."""
+    import httpx
+
+    manifest = next((a for a in release_data.get("assets", []) if a.get("name") in CHECKSUM_MANIFEST_NAMES), None)
+    if manifest is None:
+        return None
+    try:
+        url = manifest["browser_download_url"]
+        response = client.get(url, timeout=30, follow_redirects=True, headers=_auth_headers_for(url, github_token))
+    except httpx.HTTPError:
+        return None
+    if response.status_code != 200:
+        return None
+    for line in response.text.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[1].lstrip("*") == filename:
+            return parts[0].lower()
+    return None
+
+def _download_attempt(client: "httpx.Client", url: str, path: Path, *, total_size: int, headers: dict, debug: bool, report) -> str:
+    offset = path.stat().st_size if path.exists() else 0
+    if total_size and offset > total_size:
+        offset = 0
+
+    digest = hashlib.sha256()
+    if offset:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(MAX_CHUNK_SIZE), b""):
+                digest.update(block)
+        if offset == total_size:
+            report(offset)
+            return digest.hexdigest()
+
+    # Ranges refer to the stored bytes, so ask for them unencoded
+    request_headers = {**headers, "Accept-Encoding": "identity"}
+    if offset:
+        request_headers["Range"] = f"bytes={offset}-"
+
+    with client.stream("GET", url, timeout=60, follow_redirects=True, headers=request_headers) as response:
+        status = response.status_code
+        if status == 206 and offset and response.headers.get("Content-Range", "").startswith(f"bytes {offset}-"):
+            mode = "ab"
+        elif status == 200:
+            offset, mode = 0, "wb"
+            digest = hashlib.sha256()
+        elif status == 416:
+            path.unlink(missing_ok=True)
+            raise _RetryableDownloadError("Server rejected the resume range; restarting download", retry_after=0)
+        elif status in _RETRY_STATUSES:
+            retry_after = _parse_rate_limit_headers(response.headers).get("retry_after_seconds")
+            raise _RetryableDownloadError(f"HTTP {status} from {url}", retry_after)
+        else:
+            # Handle rate-limiting on download as well
+            error_msg = _format_rate_limit_error(status, response.headers, url)
+            if debug:
+                error_msg += f"\n\n[dim]Response body (truncated 400):[/dim]\n{response.read()[:400].decode('utf-8', 'replace')}"
+            raise RuntimeError(error_msg)
+
+        report(offset)
+        chunk_size = MIN_CHUNK_SIZE
+        buffer = bytearray()
+        batch_started = time.monotonic()
+        with open(path, mode) as f:
+            try:
+                for data in response.iter_bytes():
+                    buffer += data
+                    if len(buffer) < chunk_size:
+                        report(offset)  # throttled; lets a cancel stop a slow stream
+                        continue
+                    f.write(buffer)
+                    digest.update(buffer)
+                    offset += len(buffer)
+                    elapsed = max(time.monotonic() - batch_started, 1e-3)
+                    chunk_size = min(MAX_CHUNK_SIZE, max(MIN_CHUNK_SIZE, int(len(buffer) / elapsed * CHUNK_TARGET_SECONDS)))
+                    buffer.clear()
+                    batch_started = time.monotonic()
+                    report(offset)
+            finally:
+                # Keep every byte received, even when the connection drops mid-batch
+                if buffer:
+                    f.write(buffer)
+                    digest.update(buffer)
+                    offset += len(buffer)
+        report(offset, force=True)
+    if total_size and offset != total_size:
+        raise _RetryableDownloadError(f"Connection closed after {offset:,} of {total_size:,} bytes")
+    return digest.hexdigest()
+
+def _download_resumable(client: "httpx.Client", url: str, path: Path, *, total_size: int = 0, headers: dict | None = None, show_progress: bool = True, debug: bool = False, cancel: "threading.Event" = None) -> str:
+    """Download `url` to `path`, resuming from the bytes already in `path`.
+
+    Network errors, throttling and server errors are retried with backoff
+    (`DOWNLOAD_RETRY_DELAYS`, or the server's Retry-After); each retry asks for
+    the missing bytes with an HTTP Range request. `path` is left in place on
+    failure so a later call can resume. Setting `cancel` stops the download
+    as soon as the next bytes arrive, keeping them (raising `_DownloadCancelled`).
+
+    Returns:
+        SHA-256 hex digest of the complete file
+
+    Raises:
+        RuntimeError: If the server refuses the download or retries run out
+    """
+    import httpx
+
+    headers = headers or {}
+    progress = task = None
+    if show_progress and total_size:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            console=console,
+        )
+        task = progress.add_task("Downloading...", total=total_size)
+
+    last_report = 0.0
+
+    def report(completed: int, force: bool = False) -> None:
+        nonlocal last_report
+        if cancel is not None and cancel.is_set():
+            raise _DownloadCancelled(f"Download of {url} cancelled")
+        now = time.monotonic()
+        if progress is not None and (force or now - last_report >= PROGRESS_INTERVAL):
+            progress.update(task, completed=completed)
+            last_report = now
+
+    if progress is not None:
+        progress.start()
+    try:
+        attempt = 0
+        while True:
+            try:
+                return _download_attempt(client, url, path, total_size=total_size, headers=headers, debug=debug, report=report)
+            except (httpx.TransportError, _RetryableDownloadError) as e:
+                retry_after = getattr(e, "retry_after", None)
+                if attempt == len(DOWNLOAD_RETRY_DELAYS) or (retry_after or 0) > MAX_RETRY_AFTER:
+                    raise RuntimeError(f"Download failed after {attempt + 1} attempt(s): {e}") from e
+                delay = DOWNLOAD_RETRY_DELAYS[attempt] if retry_after is None else retry_after
+                if debug:
+                    console.print(f"[yellow]{e}; retrying in {delay}s[/yellow]")
+                if cancel is not None:
+                    if cancel.wait(delay):
+                        raise _DownloadCancelled(f"Download of {url} cancelled")
+                else:
+                    time.sleep(delay)
+                attempt += 1
+    finally:
+        if progress is not None:
+            progress.stop()
+
+def _template_asset_pattern(ai_assistant: str, script_type: str) -> str:
+    return f"grove-template-{ai_assistant}-{script_type}"
+
+def _find_template_asset(release_data: dict, ai_assistant: str, script_type: str) -> dict | None:
+    """Return the release asset holding the `ai_assistant`/`script_type` template zip, if any."""
+    pattern = _template_asset_pattern(ai_assistant, script_type)
+    return next(
+        (asset for asset in release_data.get("assets", []) if pattern in asset["name"] and asset["name"].endswith(".zip")),
+        None,
+    )
+
+def download_template_from_github(ai_assistant: str, download_dir: Path, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: "httpx.Client" = None, debug: bool = False, github_token: str = None, use_cache: bool = True, release: Tuple[dict, str] = None, cancel: "threading.Event" = None) -> Tuple[Path, dict]:
+    """Download the template asset for `ai_assistant` from the latest release.
+
+    With `use_cache` the asset is served from, or downloaded into, the per-user
+    asset cache; the returned path then lives in the cache and
+    `metadata["cached"]` is True, so callers must not delete it. Otherwise the
+    zip is written to `download_dir`. Assets of a local directory release
+    source are used in place (also marked cached).
+
+    Args:
+        release: Result of `fetch_latest_release()` if the caller already has it
+        cancel: Set to stop the download as soon as the next bytes arrive; it then
+            raises `_DownloadCancelled` without printing anything
+
+    Returns:
+        Tuple of (zip path, metadata dict)
+    """
+    if client is None:
+        client = get_http_client()
+
+    if release is None:
+        release = _fetch_release_or_exit(client, verbose=verbose, debug=debug, github_token=github_token)
+    release_data, release_source = release
+
+    assets = release_data.get("assets", [])
+    pattern = _template_asset_pattern(ai_assistant, script_type)
+    asset = _find_template_asset(release_data, ai_assistant, script_type)
+
+    if asset is None:
+        console.print(f"[red]No matching release asset found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])")
+        asset_names = [a.get('name', '?') for a in assets]
+        console.print(Panel("\n".join(asset_names) or "(no assets)", title="Available Assets", border_style="yellow"))
+        raise typer.Exit(1)
+
+    download_url = asset["browser_download_url"]
+    filename = asset["name"]
+    file_size = asset["size"]
+    tag = release_data["tag_name"]
+    expected_sha256 = _asset_sha256(asset)
+
+    if verbose:
+        console.print(f"[cyan]Found template:[/cyan] {filename}")
+        console.print(f"[cyan]Size:[/cyan] {file_size:,} bytes")
+        console.print(f"[cyan]Release:[/cyan] {tag}")
+
+    metadata = {
+        "filename": filename,
+        "size": file_size,
+        "release": tag,
+        "asset_url": download_url,
+        "sha256": expected_sha256,
+        "release_source": release_source,
+        "cached": False,
+        "cache_hit": False,
+    }
+
+    local_path = get_release_source().local_asset(tag, asset)
+    if local_path is not None:
+        # Local directory source: use the file in place (callers must not delete it)
+        from .cache import sha256_file
+
+        try:
+            sha256 = sha256_file(local_path)
+        except OSError as e:
+            console.print(f"[red]Error reading template[/red]")
+            console.print(Panel(str(e), title="Release Source Error", border_style="red"))
+            raise typer.Exit(1)
+        if expected_sha256 and sha256 != expected_sha256:
+            console.print(f"[red]Error reading template[/red]")
+            console.print(Panel(f"Checksum mismatch for {local_path}: expected sha256 {expected_sha256}, got {sha256}", title="Release Source Error", border_style="red"))
+            raise typer.Exit(1)
+        if verbose:
+            console.print(f"[cyan]Using template from[/cyan] {local_path}")
+        metadata.update(asset_url=str(local_path), sha256=sha256, cached=True)
+        return local_path, metadata
+
+    def cache_hit(cached_path: Path) -> Tuple[Path, dict]:
+        if verbose:
+            console.print(f"[cyan]Using cached template[/cyan] [dim](sha256 {cached_path.name[:12]})[/dim]")
+        metadata.update(sha256=cached_path.name, cached=True, cache_hit=True)
+        return cached_path, metadata
+
+    cache = None
+    if use_cache:
+        from .cache import AssetCache
+
+        cache = AssetCache()
+        cached_path = cache.lookup(tag, filename, expected_sha256)
+        if cached_path is not None:
+            return cache_hit(cached_path)
+
+    with ExitStack() as stack:
+        if cache is not None:
+            key = f"{tag}/{filename}"
+            try:
+                # Stable per asset, so an interrupted download resumes on the next run
+                zip_path = stack.enter_context(cache.partial_download(key, wait=False))
+                if zip_path is None:
+                    if verbose:
+                        console.print(f"[cyan]Waiting for another download of {filename}...[/cyan]")
+                    zip_path = stack.enter_context(cache.partial_download(key))
+                    cached_path = cache.lookup(tag, filename, expected_sha256)
+                    if cached_path is not None:
+                        return cache_hit(cached_path)
+            except OSError:
+                cache = None  # unwritable cache directory; download next to the project instead
+        if cache is None:
+            zip_path = download_dir / filename
+
+        if verbose:
+            console.print(f"[cyan]Downloading template...[/cyan]")
+
+        try:
+            if expected_sha256 is None:
+                expected_sha256 = _manifest_sha256(release_data, filename, client, github_token)
+            if zip_path.exists() and zip_path.stat().st_size and verbose:
+                console.print(f"[cyan]Resuming from {zip_path.stat().st_size:,} bytes[/cyan]")
+            sha256 = _download_resumable(
+                client,
+                download_url,
+                zip_path,
+                total_size=file_size,
+                headers=_auth_headers_for(download_url, github_token),
+                show_progress=show_progress,
+                debug=debug,
+                cancel=cancel,
+            )
+            if expected_sha256 and sha256 != expected_sha256:
+                zip_path.unlink(missing_ok=True)  # corrupt; do not resume from it
+                raise RuntimeError(f"Checksum mismatch for {filename}: expected sha256 {expected_sha256}, got {sha256}")
+            if cache is not None:
+                zip_path = cache.store(tag, filename, zip_path, sha256)
+        except _DownloadCancelled:
+            if cache is None:
+                zip_path.unlink(missing_ok=True)
+            raise
+        except Exception as e:
+            console.print(f"[red]Error downloading template[/red]")
+            detail = str(e)
+            if cache is None and zip_path.exists():
+                zip_path.unlink()
+            console.print(Panel(detail, title="Download Error", border_style="red"))
+            raise typer.Exit(1)
+    if verbose:
+        console.print(f"Downloaded: {filename}")
+    metadata.update(sha256=sha256, cached=cache is not None)
+    return zip_path, metadata
+
+class TemplatePrefetch:
+    """Release metadata and likely template assets fetched into the caches ahead of need.
+
+    `grove init` starts one before its interactive prompts so that the network
+    work overlaps with the user's think time. Nothing is printed and failures
+    are ignored: `start_template_downloads(prefetch=...)` cancels what the
+    final selection does not need, waits for what it does and then downloads
+    as usual, so prefetched assets are cache hits and errors are reported there.
+    """
+
+    def __init__(self, agents: List[str], script_type: str, *, client: "httpx.Client" = None, github_token: str = None):
+        """
+        Args:
+            agents: Agents whose templates are likely to be selected
+            script_type: Likely script type (sh or ps)
+            client: HTTP client to use (default: the shared session's)
+            github_token: GitHub token for API requests
+        """
+        self._client = client or get_http_client()
+        self._github_token = github_token
+        self._release = self._background(fetch_latest_release, self._client, github_token=github_token)
+        self._cancel: Dict[Tuple[str, str], "threading.Event"] = {}
+        self._assets: Dict[Tuple[str, str], "Future[Path | None]"] = {}
+        for agent in dict.fromkeys(agents):
+            self.prefetch(agent, script_type)
+
+    @staticmethod
+    def _background(fn, *args, **kwargs) -> "Future":
+        import threading
+        from concurrent.futures import Future
+
+        future = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+        # Daemon thread: an init that exits early never waits for a prefetch,
+        # and an interrupted download resumes from its partial file next time
+        threading.Thread(target=run, name="grove-prefetch", daemon=True).start()
+        return future
+
+    def prefetch(self, agent: str, script_type: str) -> None:
+        """Start fetching the `agent`/`script_type` template into the asset cache (once)."""
+        import threading
+
+        key = (agent, script_type)
+        if key not in self._assets:
+            self._cancel[key] = threading.Event()
+            self._assets[key] = self._background(self._fetch_asset, agent, script_type, self._cancel[key])
+
+    def _fetch_asset(self, agent: str, script_type: str, cancel: "threading.Event") -> Path | None:
+        from .cache import AssetCache
+
+        release_data, _ = self._release.result()
+        asset = _find_template_asset(release_data, agent, script_type)
+        tag = release_data.get("tag_name")
+        if asset is None or not tag or get_release_source().local_asset(tag, asset) is not None:
+            return None
+
+        cache = AssetCache()
+        expected = _asset_sha256(asset)
+        cached = cache.lookup(tag, asset["name"], expected)
+        if cached is not None:
+            return cached
+        if expected is None:
+            expected = _manifest_sha256(release_data, asset["name"], self._client, self._github_token)
+        url = asset["browser_download_url"]
+        with cache.partial_download(f"{tag}/{asset['name']}", wait=False) as partial:
+            if partial is None:
+                return None  # another process is downloading it; init waits for that
+            sha256 = _download_resumable(
+                self._client,
+                url,
+                partial,
+                total_size=asset.get("size") or 0,
+                headers=_auth_headers_for(url, self._github_token),
+                show_progress=False,
+                cancel=cancel,
+            )
+            if expected and sha256 != expected:
+                partial.unlink(missing_ok=True)
+                return None
+            return cache.store(tag, asset["name"], partial, sha256)
+
+    def release_result(self) -> Tuple[dict, str] | None:
+        """Wait for the metadata request; return its `fetch_latest_release()` result, or None if it failed."""
+        try:
+            return self._release.result()
+        except Exception:
+            return None
+
+    def redirect(self, agents: List[str], script_type: str) -> None:
+        """Cancel prefetches outside the final selection and start any it is missing."""
+        wanted = {(agent, script_type) for agent in agents}
+        for key, cancel in self._cancel.items():
+            if key not in wanted:
+                cancel.set()
+        for agent, script in sorted(wanted):
+            self.prefetch(agent, script)
+
+    def wait(self, agent: str, script_type: str) -> None:
+        """Block until the prefetch of `agent`/`script_type` (if any) has finished or failed."""
+        from concurrent.futures import wait
+
+        future = self._assets.get((agent, script_type))
+        if future is not None:
+            wait([future])
+
+    def cancel(self) -> None:
+        """Stop every prefetch download as soon as its next bytes arrive."""
+        for cancel in self._cancel.values():
+            cancel.set()
+
+def start_template_downloads(agents: List[str], download_dir: Path, *, script_type: str = "sh", client: "httpx.Client" = None, debug: bool = False, github_token: str = None, prefetch: TemplatePrefetch = None, cancel: "threading.Event" = None) -> Dict[str, "Future[Tuple[Path, dict]]"]:
+    """Download the template assets for several agents concurrently.
+
+    Release metadata is fetched once and shared by all downloads, which run
+    on the shared (thread-safe, pooled) HTTP client. Each future resolves to
+    the same `(zip path, metadata)` as `download_template_from_github`, or
+    raises `typer.Exit` after printing the error.
+
+    Args:
+        agents: Agent names; duplicates are downloaded once
+        prefetch: Prefetch started before the selection was known; its
+            release metadata and finished downloads are reused
+        cancel: Set to stop every download as soon as its next bytes arrive (its
+            future then raises `_DownloadCancelled`)
+
+    Returns:
+        Dict of agent name -> future, in the order given
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if client is None:
+        client = get_http_client()
+    agents = list(dict.fromkeys(agents))
+    if prefetch is not None:
+        prefetch.redirect(agents, script_type)
+
+    def fetch_release() -> Tuple[dict, str]:
+        if prefetch is not None:
+            result = prefetch.release_result()
+            if result is not None:
+                return result
+        return _fetch_release_or_exit(client, verbose=False, debug=debug, github_token=github_token)
+
+    # One worker for the metadata request plus one per asset, so a download
+    # waiting for the metadata never starves it of a thread
+    executor = ThreadPoolExecutor(max_workers=len(agents) + 1, thread_name_prefix="grove-download")
+    release = executor.submit(fetch_release)
+
+    def download(agent: str) -> Tuple[Path, dict]:
+        if prefetch is not None:
+            # Same asset: let the prefetch finish rather than download it twice
+            prefetch.wait(agent, script_type)
+        if cancel is not None and cancel.is_set():
+            raise _DownloadCancelled(f"Download of the {agent} template cancelled")
+        return download_template_from_github(
+            agent,
+            download_dir,
+            script_type=script_type,
+            verbose=False,
+            show_progress=False,
+            client=client,
+            debug=debug,
+            github_token=github_token,
+            release=release.result(),
+            cancel=cancel,
+        )
+
+    futures = {agent: executor.submit(download, agent) for agent in agents}
+    executor.shutdown(wait=False)
+    return futures
@@ -0,0 +1,952 @@
+"""Project materialisation: template download/extraction and local template installation."""
+
+import json
+import os
+import re
+import shutil
+import zipfile
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Tuple
+
+import typer
+from rich.panel import Panel
+
+from .config import AGENT_CONFIG, SUPPORTED_LANGUAGES, get_project_language
+from .github import download_template_from_github, get_http_client
+from .materialize import (
+    FileJob,
+    MaterializeError,
+    copy_job,
+    dir_files_jobs,
+    file_matches_crc,
+    materialize,
+    same_file,
+    tree_jobs,
+    unlink_shared,
+    write_if_changed,
+)
+from .templates import get_share_root, get_templates_root
+from .ui import StepTracker, console
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    import httpx
+
+# Template files that exist once per language (templates/{lang}/); init moves
+# the selected language's copies up into .grove/templates/
+LANGUAGE_TEMPLATE_FILES = [
+    "constitution-template.md",
+    "spec-template.md",
+]
+
+# =============================================================================
+# Agent Installation Helper Functions
+# =============================================================================
+
+def install_agent_config(ai: str, project_dir: Path) -> None:
+    """Install agent configuration file (CLAUDE.md or AGENTS.md)
+
+    Args:
+        ai: Agent name (claude, gemini, copilot, etc.)
+        project_dir: Project root directory
+    """
+    templates_root = get_templates_root()
+    agent_config = AGENT_CONFIG[ai]
+
+    # Determine source template (new paths)
+    if ai == "claude":
+        source_file = templates_root / "agents" / "claude" / "CLAUDE.md"
+        dest_file = project_dir / agent_config["folder"] / "CLAUDE.md"
+    else:
+        source_file = templates_root / "agents" / "AGENTS.md"
+        dest_file = project_dir / agent_config["folder"] / "AGENTS.md"
+
+    if not source_file.exists():
+        return
+
+    # Copy to destination
+    materialize([copy_job(source_file, dest_file)])
+
+def claude_asset_jobs(claude_templates: Path, project_dir: Path) -> List[FileJob]:
+    """Jobs copying CLAUDE.md, subagents and rules from templates/agents/claude/ into a project."""
+    jobs = []
+    claude_md_src = claude_templates / "CLAUDE.md"
+    if claude_md_src.exists():
+        jobs.append(copy_job(claude_md_src, project_dir / "CLAUDE.md"))
+    claude_dir = project_dir / ".claude"
+    jobs += dir_files_jobs(claude_templates / "agents", claude_dir / "agents")
+    jobs += dir_files_jobs(claude_templates / "rules", claude_dir / "rules")
+    return jobs
+
+def copy_claude_assets(claude_templates: Path, project_dir: Path) -> Tuple[int, int]:
+    """Copy CLAUDE.md, subagents and rules from templates/agents/claude/ into a project
+
+    Args:
+        claude_templates: The templates/agents/claude/ directory
+        project_dir: Project root directory
+
+    Returns:
+        Tuple of (subagent files, rule files) installed
+    """
+    jobs = claude_asset_jobs(claude_templates, project_dir)
+    materialize(jobs)
+    files = [job.dest.parent.name for job in jobs if job.write is not None]
+    return files.count("agents"), files.count("rules")
+
+def install_claude_code_templates(project_dir: Path) -> None:
+    """Install Claude Code templates (commands, skills, agents, rules) to .claude/ directory
+
+    This copies templates from templates/agents/claude/ to user project's .claude/ directory.
+
+    Directory structure created:
+        project-root/
+        ├── CLAUDE.md          # Agent configuration (copied to project root)
+        └── .claude/
+            ├── commands/          # Slash Command templates (no .md extension)
+            │   ├── constitution
+            │   ├── specify
+            │   ├── design
+            │   ├── plan
+            │   ├── tasks
+            │   ├── sync
+            │   └── implement
+            ├── skills/            # Skill templates (English)
+            │   ├── constitution-knowledge/
+            │   │   └── SKILL.md
+            │   ├── specify-knowledge/
+            │   │   └── SKILL.md
+            │   ├── design-creator/
+            │   │   └── SKILL.md
+            │   ├── plan-knowledge/
+            │   │   └── SKILL.md
+            │   ├── tasks-knowledge/
+            │   │   └── SKILL.md
+            │   ├── sync-knowledge/
+            │   │   └── SKILL.md
+            │   ├── implement-knowledge/
+            │   │   └── SKILL.md
+            │   └── load-project-context/
+            │       └── SKILL.md
+            ├── agents/            # Subagent templates
+            │   └── executor.md
+            └── rules/             # Claude Code rules
+                └── constitution.md
+
+    Args:
+        project_dir: Project root directory
+    """
+    templates_root = get_templates_root()
+    claude_templates = templates_root / "agents" / "claude"
+
+    if not claude_templates.exists():
+        console.print(f"[yellow]Warning:[/yellow] Claude Code templates not found at {claude_templates}")
+        return
+
+    claude_dir = project_dir / ".claude"
+    claude_dir.mkdir(parents=True, exist_ok=True)
+
+    # 1. Copy CLAUDE.md to project root, Subagents and Rules
+    agents_count, rules_count = copy_claude_assets(claude_templates, project_dir)
+
+    # 2. Copy Slash Commands (remove .md extension for Claude Code compatibility)
+    # Commands are shared across all agents in templates/agents/commands/
+    commands_src = templates_root / "agents" / "commands"
+    commands_dest = claude_dir / "commands"
+    if commands_src.exists():
+        # Remove .md extension: "constitution.md" → "constitution"
+        materialize([FileJob(commands_dest)] + [
+            copy_job(cmd_file, commands_dest / cmd_file.stem)
+            for cmd_file in commands_src.iterdir()
+            if cmd_file.is_file() and cmd_file.suffix == ".md"
+        ])
+
+    console.print(f"[green]✓[/green] Claude Code templates installed to {claude_dir}")
+    console.print(f"[dim]  - CLAUDE.md: copied to project root[/dim]")
+    console.print(f"[dim]  - Commands: {len(list((commands_dest).iterdir()) if commands_dest.exists() else [])} files[/dim]")
+    console.print(f"[dim]  - Agents: {agents_count} files[/dim]")
+    console.print(f"[dim]  - Rules: {rules_count} files[/dim]")
+
+def _discard_archive(archive: "Future[Tuple[Path, dict]]") -> None:
+    if archive.cancelled() or archive.exception() is not None:
+        return
+    zip_path, meta = archive.result()
+    if not meta.get("cached"):
+        zip_path.unlink(missing_ok=True)
+
+def ensure_agent_installed(agent: str, project_dir: Path, *, client: "httpx.Client" = None, archive: "Future[Tuple[Path, dict]]" = None, script_type: str = None, existing_dir: Path = None) -> bool:
+    """
+    Ensure agent configuration is installed in project.
+    Auto-download if not present.
+
+    Only the agent's own files are extracted; the project's `.grove/`
+    directory is left as it is.
+
+    Args:
+        agent: Agent name (claude, codex, etc.)
+        project_dir: Project directory path
+        client: HTTP client to download with (default: the shared session's)
+        archive: Template download already started by `start_template_downloads`
+        script_type: Script type of the template to download (default: the OS default)
+        existing_dir: Also skip the agent if this directory already has its
+            folder (`grove init` installs into a staging directory but checks
+            the real project)
+
+    Returns:
+        True if the agent was installed, False if it already was
+    """
+    if agent not in AGENT_CONFIG:
+        console.print(f"[red]Error:[/red] Unknown agent '{agent}'")
+        console.print(f"[dim]Available agents: {', '.join(AGENT_CONFIG.keys())}[/dim]")
+        raise typer.Exit(1)
+
+    agent_config = AGENT_CONFIG[agent]
+    agent_folder = project_dir / agent_config["folder"]
+
+    if agent_folder.exists() or (existing_dir is not None and (existing_dir / agent_config["folder"]).exists()):
+        # Already installed; drop a prefetched archive unless the cache owns it
+        if archive is not None:
+            archive.add_done_callback(_discard_archive)
+        return False
+
+    console.print(f"[cyan]Installing {agent_config['name']} configuration...[/cyan]")
+
+    # Download agent-specific template from GitHub
+    # Use the existing download_and_extract_template function
+    try:
+        # Determine script type based on OS
+        script_type = script_type or ("ps" if os.name == "nt" else "sh")
+
+        download_and_extract_template(
+            project_path=project_dir,
+            ai_assistant=agent,
+            script_type=script_type,
+            is_current_dir=True,  # Install into current directory
+            verbose=False,
+            tracker=None,
+            client=client or get_http_client(),
+            debug=False,
+            github_token=None,
+            archive=archive,
+            selection=TemplateSelection(get_project_language(project_dir), script_type, [agent], base=not (project_dir / ".grove").is_dir()),
+        )
+
+        console.print(f"[green]✓[/green] {agent_config['name']} configuration installed")
+    except Exception as e:
+        console.print(f"[red]Error installing {agent_config['name']}:[/red] {e}")
+        raise typer.Exit(1)
+    return True
+
+# =============================================================================
+# Template Extraction
+# =============================================================================
+
+def handle_vscode_settings(sub_item, dest_file, rel_path, verbose=False, tracker=None) -> None:
+    """Handle merging or copying of .vscode/settings.json files."""
+    if dest_file.exists():
+        merge_vscode_settings(Path(sub_item).read_bytes(), dest_file, rel_path, verbose, tracker)
+        return
+    shutil.copy2(sub_item, dest_file)
+    if verbose and not tracker:
+        console.print(f"[blue]Copied (no existing settings.json):[/] {rel_path}")
+
+def merge_vscode_settings(content: bytes, dest_file: Path, rel_path, verbose=False, tracker=None) -> None:
+    """Merge template `.vscode/settings.json` bytes into an existing `dest_file`."""
+    def log(message, color="green"):
+        if verbose and not tracker:
+            console.print(f"[{color}]{message}[/] {rel_path}")
+
+    try:
+        merged = merge_json_files(dest_file, json.loads(content), verbose=verbose and not tracker)
+        with open(dest_file, 'w', encoding='utf-8') as f:
+            json.dump(merged, f, indent=4)
+            f.write('\n')
+        log("Merged:", "green")
+    except Exception as e:
+        log(f"Warning: Could not merge, copying instead: {e}", "yellow")
+        dest_file.write_bytes(content)
+
+def merge_json_files(existing_path: Path, new_content: dict, verbose: bool = False) -> dict:
+    """Merge new JSON content into existing JSON file.
+
+    Performs a deep merge where:
+    - New keys are added
+    - Existing keys are preserved unless overwritten by new content
+    - Nested dictionaries are merged recursively
+    - Lists and other values are replaced (not merged)
+
+    Args:
+        existing_path: Path to existing JSON file
+        new_content: New JSON content to merge in
+        verbose: Whether to print merge details
+
+    Returns:
+        Merged JSON content as dict
+    """
+    try:
+        with open(existing_path, 'r', encoding='utf-8') as f:
+            existing_content = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        # If file doesn't exist or is invalid, just use new content
+        return new_content
+
+    def deep_merge(base: dict, update: dict) -> dict:
+        """Recursively merge update dict into base dict."""
+        result = base.copy()
+        for key, value in update.items():
+            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+                # Recursively merge nested dictionaries
+                result[key] = deep_merge(result[key], value)
+            else:
+                # Add new key or replace existing value
+                result[key] = value
+        return result
+
+    merged = deep_merge(existing_content, new_content)
+
+    if verbose:
+        console.print(f"[cyan]Merged JSON file:[/cyan] {existing_path.name}")
+
+    return merged
+
+def _archive_root(zip_ref: zipfile.ZipFile) -> str:
+    """Return "<dir>/" if every member lives under one top-level directory, else ""."""
+    tops = {name.split("/", 1)[0] for name in zip_ref.namelist() if name.strip("/")}
+    if len(tops) != 1:
+        return ""
+    top = tops.pop()
+    if any(name.startswith(f"{top}/") for name in zip_ref.namelist()):
+        return f"{top}/"
+    return ""
+
+def _member_target(dest: Path, name: str, strip: str) -> Path | None:
+    """Map an archive member to its path under `dest`, dropping unsafe components like `zipfile` does."""
+    if strip and name.startswith(strip):
+        name = name[len(strip):]
+    parts = [part for part in name.replace("\\", "/").split("/") if part not in ("", ".", "..")]
+    if not parts or ":" in parts[0]:
+        return None
+    return dest.joinpath(*parts)
+
+def _member_mode(info: zipfile.ZipInfo) -> Optional[int]:
+    """Return the Unix permission bits recorded for an archive member, or None if it has none."""
+    return (info.external_attr >> 16) & 0o777 or None
+
+# Script variant directory under .grove/scripts/ for each script type
+SCRIPT_VARIANT_DIRS = {"sh": "bash", "ps": "powershell"}
+
+
+class TemplateSelection(NamedTuple):
+    """Which template files a project gets; None keeps everything for that axis."""
+
+    language: Optional[str] = None       # keep only this language's templates, moved up to .grove/templates/
+    script_type: Optional[str] = None    # keep only this .grove/scripts/ variant
+    agents: Optional[List[str]] = None   # keep only these agents' folders
+    base: bool = True                    # include .grove/ (False when adding an agent to an existing project)
+
+
+def select_template_path(relative: str, selection: TemplateSelection) -> Optional[str]:
+    """Map a template path (POSIX, relative to the project) to where the project keeps it.
+
+    Returns None for paths the selection leaves out. With a language, the
+    language's files in `.grove/templates/{lang}/` map to `.grove/templates/`,
+    which is where `cleanup_language_templates` used to move them after
+    extraction; other languages and `.grove/templates/agents/` are dropped.
+    """
+    parts = relative.split("/")
+    if parts[0] == ".grove":
+        if not selection.base:
+            return None
+        if len(parts) > 2 and parts[1] == "templates" and selection.language is not None:
+            if parts[2] == "agents":
+                return None
+            if parts[2] in SUPPORTED_LANGUAGES:
+                if parts[2] == selection.language and len(parts) == 4 and parts[3] in LANGUAGE_TEMPLATE_FILES:
+                    return f".grove/templates/{parts[3]}"
+                return None
+        if len(parts) > 2 and parts[1] == "scripts" and selection.script_type is not None:
+            variant = SCRIPT_VARIANT_DIRS.get(selection.script_type)
+            if parts[2] in SCRIPT_VARIANT_DIRS.values() and parts[2] != variant:
+                return None
+        return relative
+    if selection.agents is not None:
+        # .github/ is not exclusive to an agent, so it is never filtered
+        folder = f"{parts[0]}/"
+        owners = [agent for agent, config in AGENT_CONFIG.items() if config["folder"] == folder and folder != ".github/"]
+        if owners and not any(agent in selection.agents for agent in owners):
+            return None
+    return relative
+
+
+class ExtractResult(NamedTuple):
+    """What `extract_template_archive` did."""
+
+    written: int
+    merged: int     # .vscode/settings.json files merged into existing ones
+    skipped: int    # existing files that already matched (merge only)
+    filtered: int   # members left out by the selection
+
+
+def extract_template_archive(zip_ref: zipfile.ZipFile, dest: Path, *, strip: str = "", merge: bool = False, verbose: bool = False, tracker: StepTracker | None = None, selection: TemplateSelection | None = None) -> ExtractResult:
+    """Write archive members straight to their final paths under `dest`.
+
+    Members are streamed from the archive without an intermediate extraction
+    directory, several at a time (see `materialize`). With `merge` (used for
+    `--here`), existing files are overwritten except `.vscode/settings.json`,
+    which is merged, and files whose size and CRC-32 already match the member
+    are skipped without being written. Files get the permission bits recorded
+    in the archive (scripts are executable as soon as they are written). With
+    `selection`, members the project does not need are never written (see
+    `select_template_path`).
+
+    Args:
+        zip_ref: Open template archive
+        dest: Destination directory (created if missing)
+        strip: Leading directory to remove from member names (see `_archive_root`)
+        merge: Merge into an existing directory instead of filling a new one
+        selection: Language, script type and agents to extract (default: everything)
+
+    Returns:
+        Counts of files written, settings files merged, unchanged files skipped
+        and members filtered out
+    """
+    def write_member(info: zipfile.ZipInfo, target: Path) -> bool:
+        mode = _member_mode(info) if os.name != "nt" else None
+        if merge and file_matches_crc(target, info.file_size, info.CRC):
+            if mode is not None and target.stat().st_mode & 0o777 != mode:
+                os.chmod(target, mode)
+            return False
+        unlink_shared(target)
+        # ZipFile supports concurrent reads of different members
+        with zip_ref.open(info) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+            if mode is not None:
+                os.fchmod(dst.fileno(), mode)
+        return True
+
+    jobs = [FileJob(dest)]
+    # Localized templates replace a same-named generic one, whatever the member order
+    localized = []
+    merged = filtered = 0
+    for info in zip_ref.infolist():
+        target = _member_target(dest, info.filename, strip)
+        if target is None:
+            continue
+        if selection is not None:
+            relative = target.relative_to(dest).as_posix()
+            selected = select_template_path(relative, selection)
+            if selected is None:
+                filtered += not info.is_dir()
+                continue
+            if selected != relative:
+                target = dest / selected
+                localized.append(FileJob(target, partial(write_member, info)))
+                continue
+        if info.is_dir():
+            jobs.append(FileJob(target))
+            continue
+        if merge and target.name == "settings.json" and target.parent.name == ".vscode" and target.exists():
+            merge_vscode_settings(zip_ref.read(info), target, target.relative_to(dest), verbose, tracker)
+            merged += 1
+            continue
+        jobs.append(FileJob(target, partial(write_member, info)))
+    result = materialize(jobs + localized)
+    return ExtractResult(result.written, merged, result.skipped, filtered)
+
+def _merge_summary(copied: int, skipped: int, merged: int = 0, filtered: int = 0) -> str:
+    """Describe a (possibly merging) install for the StepTracker, e.g. "3 copied, 40 unchanged (skipped), 1 merged"."""
+    parts = [f"{copied} copied" if skipped or merged else f"{copied} files written"]
+    if skipped:
+        parts.append(f"{skipped} unchanged (skipped)")
+    if merged:
+        parts.append(f"{merged} merged")
+    if filtered:
+        parts.append(f"{filtered} not needed")
+    return ", ".join(parts)
+
+def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: "httpx.Client" = None, debug: bool = False, github_token: str = None, archive: "Future[Tuple[Path, dict]]" = None, selection: TemplateSelection | None = None) -> Path:
+    """Download the latest release and extract it to create a new project.
+    Returns project_path. Uses tracker if provided (with keys: fetch, download, extract, cleanup)
+    If `archive` is given (from `start_template_downloads`), its result is used instead of downloading.
+    With `selection`, only the files it keeps are extracted (see `select_template_path`).
+    """
+    current_dir = Path.cwd()
+
+    if tracker:
+        tracker.start("fetch", "contacting GitHub API")
+    try:
+        zip_path, meta = archive.result() if archive is not None else download_template_from_github(
+            ai_assistant,
+            current_dir,
+            script_type=script_type,
+            verbose=verbose and tracker is None,
+            show_progress=(tracker is None),
+            client=client,
+            debug=debug,
+            github_token=github_token
+        )
+        if tracker:
+            stale = ", stale metadata" if meta.get("release_source") == "stale" else ""
+            tracker.complete("fetch", f"release {meta['release']} ({meta['size']:,} bytes{stale})")
+            tracker.add("download", "Download template")
+            tracker.complete("download", f"{meta['filename']} (cached)" if meta.get("cache_hit") else meta['filename'])
+    except Exception as e:
+        if tracker:
+            tracker.error("fetch", str(e))
+        else:
+            if verbose:
+                console.print(f"[red]Error downloading template:[/red] {e}")
+        raise
+
+    if tracker:
+        tracker.add("extract", "Extract template")
+        tracker.start("extract")
+    elif verbose:
+        console.print("Extracting template...")
+
+    try:
+        if not is_current_dir:
+            project_path.mkdir(parents=True)
+
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            zip_contents = zip_ref.namelist()
+            if tracker:
+                tracker.start("zip-list")
+                tracker.complete("zip-list", f"{len(zip_contents)} entries")
+            elif verbose:
+                console.print(f"[cyan]ZIP contains {len(zip_contents)} items[/cyan]")
+
+            prefix = _archive_root(zip_ref)
+            result = extract_template_archive(zip_ref, project_path, strip=prefix, merge=is_current_dir, verbose=verbose and not tracker, tracker=tracker, selection=selection)
+            summary = _merge_summary(result.written, result.skipped, result.merged, result.filtered)
+            if tracker:
+                tracker.start("extracted-summary")
+                tracker.complete("extracted-summary", summary)
+            elif verbose:
+                console.print(f"[cyan]Extracted to {project_path}: {summary}[/cyan]")
+            if prefix:
+                if tracker:
+                    tracker.add("flatten", "Flatten nested directory")
+                    tracker.complete("flatten")
+                elif verbose:
+                    console.print(f"[cyan]Flattened nested directory structure[/cyan]")
+            if is_current_dir and verbose and not tracker:
+                console.print(f"[cyan]Template files merged into current directory[/cyan]")
+
+    except Exception as e:
+        if tracker:
+            tracker.error("extract", str(e))
+        else:
+            if verbose:
+                console.print(f"[red]Error extracting template:[/red] {e}")
+                if debug:
+                    console.print(Panel(str(e), title="Extraction Error", border_style="red"))
+
+        if not is_current_dir and project_path.exists():
+            shutil.rmtree(project_path)
+        raise typer.Exit(1)
+    else:
+        if tracker:
+            tracker.complete("extract")
+    finally:
+        if tracker:
+            tracker.add("cleanup", "Remove temporary archive")
+
+        if meta.get("cached"):
+            # The archive lives in the asset cache for the next init
+            if tracker:
+                tracker.complete("cleanup", "kept in cache")
+        elif zip_path.exists():
+            zip_path.unlink()
+            if tracker:
+                tracker.complete("cleanup")
+            elif verbose:
+                console.print(f"Cleaned up: {zip_path.name}")
+
+    return project_path
+
+# =============================================================================
+# Offline Templates
+# =============================================================================
+
+# Where each agent's slash commands go (under its AGENT_CONFIG folder) and how
+# they are named, matching .github/workflows/scripts/create-release-packages.sh
+OFFLINE_COMMAND_LAYOUT = {
+    "claude": ("commands", "grove.{name}.md"),
+    "codex": ("prompts", "{name}.md"),
+}
+
+# Bare memory/, scripts/ and templates/ references become .grove/ paths;
+# references that already point into .grove/ are left alone
+_SHARE_PATH_RE = re.compile(r"(?<!\.grove)(?<!\.grove/)/?(memory|scripts|templates)/")
+
+def _frontmatter_script(lines: List[str], script_type: str, section: str) -> Optional[str]:
+    prefix = re.compile(rf"^\s*{re.escape(script_type)}:\s*")
+    in_section = False
+    for line in lines:
+        if line == f"{section}:":
+            in_section = True
+            continue
+        if in_section and re.match(r"^[a-zA-Z]", line):
+            in_section = False
+        if in_section and prefix.match(line):
+            return prefix.sub("", line, count=1)
+    return None
+
+def render_agent_command(content: str, agent: str, script_type: str) -> str:
+    """Render a templates/agents/commands/*.md file the way release packaging does
+
+    Substitutes {SCRIPT}, {AGENT_SCRIPT}, {ARGS} and __AGENT__, drops the
+    `scripts:`/`agent_scripts:` frontmatter blocks and rewrites repository
+    paths to their .grove/ locations.
+
+    Args:
+        content: Command template text
+        agent: Agent name (claude, codex)
+        script_type: Script type (sh or ps)
+
+    Returns:
+        Command file contents for the agent
+    """
+    lines = content.replace("\r", "").split("\n")
+    script_command = _frontmatter_script(lines, script_type, "scripts") or f"(Missing script command for {script_type})"
+    agent_script = _frontmatter_script(lines, script_type, "agent_scripts")
+
+    rendered = []
+    dashes = 0
+    in_frontmatter = skipping = False
+    for line in lines:
+        if line == "---":
+            dashes += 1
+            in_frontmatter = dashes == 1
+            rendered.append(line)
+            continue
+        if in_frontmatter:
+            if line in ("scripts:", "agent_scripts:"):
+                skipping = True
+                continue
+            if skipping and re.match(r"^[a-zA-Z].*:", line):
+                skipping = False
+            if skipping and re.match(r"^\s", line):
+                continue
+        line = line.replace("{SCRIPT}", script_command)
+        if agent_script:
+            line = line.replace("{AGENT_SCRIPT}", agent_script)
+        line = line.replace("{ARGS}", "$ARGUMENTS").replace("__AGENT__", agent)
+        rendered.append(_SHARE_PATH_RE.sub(r".grove/\1/", line))
+    return "\n".join(rendered)
+
+def offline_template_root() -> Optional[Path]:
+    """Return the share directory to build projects from offline, or None if it is incomplete."""
+    try:
+        share_root = get_share_root()
+    except RuntimeError:
+        return None
+    required = [share_root / "templates" / "agents" / "commands", share_root / "scripts"]
+    return share_root if all(path.is_dir() for path in required) else None
+
+def install_offline_template(project_path: Path, agents: List[str], script_type: str, is_current_dir: bool = False, *, tracker: StepTracker | None = None, reason: str = "offline", language: str = None) -> Path:
+    """Build the release template layout for `agents` from the installed share directory.
+
+    Produces what extracting each agent's release archive would: `.grove/`
+    (memory, the `script_type` scripts and templates) plus every agent's
+    command folder and extra files, without touching the network. With
+    `language`, only that language's templates are installed, directly in
+    `.grove/templates/` (as `select_template_path` maps them).
+    Returns project_path. Uses tracker if provided (with keys: fetch, download, extract, cleanup)
+
+    Raises:
+        RuntimeError: If the share directory is incomplete or an agent has no offline layout
+    """
+    share_root = offline_template_root()
+    if share_root is None:
+        raise RuntimeError("Installed templates not found; reinstall grove-cli or run init online")
+    unsupported = [agent for agent in agents if agent not in OFFLINE_COMMAND_LAYOUT]
+    if unsupported:
+        raise RuntimeError(f"No offline template layout for: {', '.join(unsupported)}")
+
+    if tracker:
+        tracker.skip("fetch", reason)
+        tracker.add("download", "Download template")
+        tracker.skip("download", "using installed templates")
+        tracker.add("extract", "Extract template")
+        tracker.start("extract", str(share_root))
+
+    templates_root = share_root / "templates"
+    grove_dir = project_path / ".grove"
+    try:
+        if not is_current_dir:
+            project_path.mkdir(parents=True)
+
+        # .grove/memory and .grove/templates (commands are rendered per agent below)
+        jobs = tree_jobs(share_root / "memory", grove_dir / "memory")
+        generated = {Path("vscode-settings.json"), Path("agents") / "commands"}
+        if language is not None:
+            generated |= {Path("agents")} | {Path(code) for code in SUPPORTED_LANGUAGES}
+            for name in LANGUAGE_TEMPLATE_FILES:
+                if (templates_root / language / name).is_file():
+                    jobs.append(copy_job(templates_root / language / name, grove_dir / "templates" / name))
+        jobs += tree_jobs(templates_root, grove_dir / "templates", exclude=generated.__contains__)
+
+        # .grove/scripts: the selected variant plus any top-level script files
+        scripts_root = share_root / "scripts"
+        variant = "bash" if script_type == "sh" else "powershell"
+        jobs += tree_jobs(scripts_root / variant, grove_dir / "scripts" / variant, link=True)
+        jobs += dir_files_jobs(scripts_root, grove_dir / "scripts", link=True)
+
+        commands = sorted(p for p in (templates_root / "agents" / "commands").glob("*.md") if p.is_file())
+        for agent in agents:
+            subdir, pattern = OFFLINE_COMMAND_LAYOUT[agent]
+            commands_dest = project_path / AGENT_CONFIG[agent]["folder"] / subdir
+            for command in commands:
+                text = render_agent_command(command.read_text(encoding="utf-8"), agent, script_type)
+                jobs.append(FileJob(commands_dest / pattern.format(name=command.stem), partial(write_if_changed, (text + "\n").encode("utf-8"))))
+
+            agents_md = templates_root / "agents" / "AGENTS.md"
+            if agents_md.exists():
+                jobs.append(copy_job(agents_md, project_path / "AGENTS.md"))
+            if agent == "claude":
+                jobs += claude_asset_jobs(templates_root / "agents" / "claude", project_path)
+        result = materialize(jobs)
+    except Exception as e:
+        if tracker:
+            tracker.error("extract", str(e))
+        if not is_current_dir and project_path.exists():
+            shutil.rmtree(project_path)
+        raise
+
+    if tracker:
+        tracker.complete("extract", "from installed templates")
+        tracker.skip("zip-list", "no archive")
+        tracker.complete("extracted-summary", _merge_summary(result.written, result.skipped))
+        tracker.add("cleanup", "Remove temporary archive")
+        tracker.skip("cleanup", "no archive")
+    return project_path
+
+# Set to 1 to re-check script permissions after init and upgrade
+VERIFY_SCRIPTS_ENV = "GROVE_VERIFY_SCRIPTS"
+
+def verify_scripts_enabled() -> bool:
+    """Whether `ensure_executable_scripts` should run after installing ($GROVE_VERIFY_SCRIPTS)."""
+    return os.getenv(VERIFY_SCRIPTS_ENV, "").strip().lower() in ("1", "true", "yes")
+
+def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None = None) -> None:
+    """Ensure POSIX .sh scripts under .grove/scripts (recursively) have execute bits (no-op on Windows).
+
+    Install paths already give scripts their modes as they write them (from
+    the archive's recorded permissions, or copied from the installed
+    templates), so this scan only verifies and repairs; init and upgrade run
+    it when `verify_scripts_enabled()`.
+    """
+    if os.name == "nt":
+        return  # Windows: skip silently
+    scripts_root = project_path / ".grove" / "scripts"
+    if not scripts_root.is_dir():
+        return
+    from .walk import walk
+
+    failures: list[str] = []
+    updated = 0
+    scripts = (Path(entry.path) for listing in walk(scripts_root) for entry in listing.entries
+               if entry.name.endswith(".sh") and entry.is_file(follow_symlinks=False))
+    for script in scripts:
+        try:
+            try:
+                with script.open("rb") as f:
+                    if f.read(2) != b"#!":
+                        continue
+            except Exception:
+                continue
+            st = script.stat(); mode = st.st_mode
+            if mode & 0o111:
+                continue
+            new_mode = mode
+            if mode & 0o400: new_mode |= 0o100
+            if mode & 0o040: new_mode |= 0o010
+            if mode & 0o004: new_mode |= 0o001
+            if not (new_mode & 0o100):
+                new_mode |= 0o100
+            os.chmod(script, new_mode)
+            updated += 1
+        except Exception as e:
+            failures.append(f"{script.relative_to(scripts_root)}: {e}")
+    if tracker:
+        detail = f"{updated} updated" + (f", {len(failures)} failed" if failures else "")
+        tracker.add("chmod", "Set script permissions recursively")
+        (tracker.error if failures else tracker.complete)("chmod", detail)
+    else:
+        if updated:
+            console.print(f"[cyan]Updated execute permissions on {updated} script(s) recursively[/cyan]")
+        if failures:
+            console.print("[yellow]Some scripts could not be updated:[/yellow]")
+            for f in failures:
+                console.print(f"  - {f}")
+
+def cleanup_language_templates(project_dir: Path, lang: str, tracker: StepTracker = None) -> None:
+    """Clean up language-specific template directories and files.
+
+    After extracting the template ZIP, this function:
+    1. Moves selected language files from .grove/templates/{lang}/ to .grove/templates/
+    2. Removes language subdirectories (.grove/templates/en/, .grove/templates/ja/)
+    3. Removes any duplicate template files in .grove/templates/
+
+    Args:
+        project_dir: Project directory path
+        lang: Selected language code (ja or en)
+        tracker: Optional StepTracker for progress display
+    """
+    if tracker:
+        tracker.add("cleanup-lang", "Organizing language-specific templates")
+        tracker.start("cleanup-lang")
+
+    templates_dir = project_dir / ".grove" / "templates"
+
+    if not templates_dir.exists():
+        if tracker:
+            tracker.skip("cleanup-lang", "templates directory not found")
+        return
+
+    lang_dir = templates_dir / lang
+
+    # Move selected language files to templates root
+    if lang_dir.exists():
+        for template_file in LANGUAGE_TEMPLATE_FILES:
+            source_file = lang_dir / template_file
+            dest_file = templates_dir / template_file
+
+            if source_file.exists():
+                # Keep an identical existing file untouched (re-init with --here)
+                if same_file(source_file, dest_file):
+                    source_file.unlink()
+                    continue
+
+                # Remove existing file if it exists (avoid duplicates)
+                if dest_file.exists():
+                    dest_file.unlink()
+
+                # Move file from language subdirectory to templates root
+                shutil.move(str(source_file), str(dest_file))
+
+    # Remove all language subdirectories
+    for lang_code in SUPPORTED_LANGUAGES:
+        lang_subdir = templates_dir / lang_code
+        if lang_subdir.exists() and lang_subdir.is_dir():
+            shutil.rmtree(lang_subdir)
+
+    # Also remove 'agents' subdirectory if it exists (already copied to appropriate location)
+    agents_dir = templates_dir / "agents"
+    if agents_dir.exists() and agents_dir.is_dir():
+        shutil.rmtree(agents_dir)
+
+    if tracker:
+        tracker.complete("cleanup-lang", f"organized {lang} templates")
+
+def install_common_templates(project_dir: Path, lang: str, script_type: str, tracker: StepTracker = None) -> None:
+    """Install language-specific templates to project.
+
+    Args:
+        project_dir: Project directory path
+        lang: Language code (ja or en)
+        script_type: Script type (sh or ps)
+        tracker: Optional StepTracker for progress display
+
+    Processing flow:
+        1. Read from grove_cli/templates/{lang}/
+        2. Copy to project's .grove/templates/
+        3. Copy scripts based on script_type
+        4. Copy memory directory
+        5. Fallback: Use English if specified language doesn't exist
+
+    Target templates:
+        - constitution-template.md
+        - spec-template.md
+        - plan-template.md (for reference, AI generates dynamically)
+        - tasks-template.md (for reference, AI generates dynamically)
+        - checklist-template.md (for reference, AI generates dynamically)
+    """
+    if tracker:
+        tracker.add("install-templates", "Installing language-specific templates")
+        tracker.start("install-templates")
+
+    # Get template directory (installed location, or the source checkout)
+    try:
+        templates_root = get_templates_root()
+    except RuntimeError:
+        if tracker:
+            tracker.skip("install-templates", "no templates found in package directory")
+        return
+    share_root = templates_root.parent
+
+    templates_source = templates_root / lang
+    fallback_note = ""
+
+    # Fallback to English if language doesn't exist
+    if not templates_source.exists():
+        fallback_note = f", '{lang}' not found, using English"
+        templates_source = templates_root / "en"
+
+    if not templates_source.exists():
+        if tracker:
+            tracker.skip("install-templates", "no templates found for selected language")
+        return
+
+    templates_dest = project_dir / ".grove" / "templates"
+    jobs = [FileJob(templates_dest)]
+
+    # Common template files (from templates/ root, language-independent)
+    common_files = [
+        "plan-template.md",
+        "tasks-template.md",
+        "checklist-template.md",
+        "agent-file-template.md",
+        "verification-template.md",
+    ]
+
+    # Copy language-specific templates
+    for template_file in LANGUAGE_TEMPLATE_FILES:
+        source_file = templates_source / template_file
+        if source_file.exists():
+            jobs.append(copy_job(source_file, templates_dest / template_file))
+
+    # Copy common templates (language-independent)
+    for template_file in common_files:
+        source_file = templates_root / template_file
+        if source_file.exists():
+            jobs.append(copy_job(source_file, templates_dest / template_file))
+
+    # Copy scripts directory structure (based on script_type)
+    scripts_root = share_root / "scripts"
+
+    if scripts_root.exists():
+        scripts_dest = project_dir / ".grove" / "scripts"
+        jobs.append(FileJob(scripts_dest))
+
+        # Copy scripts maintaining bash/powershell subdirectory structure
+        if script_type == "sh":
+            bash_src = scripts_root / "bash"
+            if bash_src.exists():
+                bash_dest = scripts_dest / "bash"
+                jobs.append(FileJob(bash_dest))
+                jobs += [copy_job(script_file, bash_dest / script_file.name, link=True) for script_file in bash_src.glob("*.sh")]
+        elif script_type == "ps":
+            ps_src = scripts_root / "powershell"
+            if ps_src.exists():
+                ps_dest = scripts_dest / "powershell"
+                jobs.append(FileJob(ps_dest))
+                jobs += [copy_job(script_file, ps_dest / script_file.name, link=True) for script_file in ps_src.glob("*.ps1")]
+
+    # Copy memory directory structure; merged rather than replaced, so files
+    # the project added there survive a re-init
+    jobs += tree_jobs(share_root / "memory", project_dir / ".grove" / "memory")
+
+    try:
+        result = materialize(jobs)
+    except MaterializeError as e:
+        if tracker:
+            tracker.error("install-templates", str(e).splitlines()[0])
+        raise
+
+    if tracker and result.total > 0:
+        unchanged = f", {result.skipped} unchanged" if result.skipped else ""
+        tracker.complete("install-templates", f"Installed {result.written} template(s) ({lang}{fallback_note}{unchanged})")
@@ -0,0 +1,371 @@
+"""Parallel file materialisation shared by every template install path.
+
+Installing a template writes many small files. On network filesystems and
+container overlay mounts each one costs a round trip, so files are written
+from a bounded thread pool instead of one at a time:
+
+    jobs = tree_jobs(share_root / "scripts" / "bash", grove_dir / "scripts" / "bash")
+    jobs.append(FileJob(project / "AGENTS.md", partial(copy_if_changed, agents_md)))
+    result = materialize(jobs)          # directories first, then the files
+    result.written, result.skipped
+
+The worker count comes from `$GROVE_INSTALL_WORKERS` (1 writes sequentially).
+Every job runs even if another fails; failures are raised together as one
+`MaterializeError`.
+
+Copies use the cheapest method the filesystem supports (`clone_file`): a
+reflink (`FICLONE`) on copy-on-write filesystems such as btrfs and XFS, then
+an in-kernel `copy_file_range`, then a plain copy. `$GROVE_COPY_MODE=hardlink`
+additionally hard-links read-only artifacts (scripts) to the installed
+copies, and `$GROVE_COPY_MODE=copy` always makes plain copies.
+"""
+
+import errno
+import filecmp
+import os
+import shutil
+import threading
+import zlib
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+from .walk import scan_dir, walk
+
+WORKERS_ENV = "GROVE_INSTALL_WORKERS"
+
+# Upper bound on the default worker count; the work is I/O bound
+MAX_DEFAULT_WORKERS = 16
+
+# Fewer files than this are written sequentially (a pool would cost more than it saves)
+PARALLEL_MIN_FILES = 8
+
+def default_workers() -> int:
+    """Return the install worker count ($GROVE_INSTALL_WORKERS, default min(16, CPUs + 4))."""
+    try:
+        workers = int(os.getenv(WORKERS_ENV, "0"))
+    except ValueError:
+        workers = 0
+    return workers if workers > 0 else min(MAX_DEFAULT_WORKERS, (os.cpu_count() or 1) + 4)
+
+# =============================================================================
+# Copy strategies
+# =============================================================================
+
+COPY_MODE_ENV = "GROVE_COPY_MODE"
+COPY_MODES = ("auto", "hardlink", "copy")
+
+# ioctl request number of FICLONE (_IOW(0x94, 9, int) in linux/fs.h)
+_FICLONE = 0x40049409
+
+# errno values meaning "this method does not work here", not a real I/O error
+_UNSUPPORTED_ERRNOS = {errno.EOPNOTSUPP, errno.ENOTSUP, errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.ENOTTY}
+
+# os.link() also refuses with EMLINK (too many links to the source) and with
+# EPERM where links to other users' files are protected; the copy it falls
+# back to then reports any real permission problem with the destination
+_LINK_UNSUPPORTED_ERRNOS = _UNSUPPORTED_ERRNOS | {errno.EMLINK, errno.EPERM}
+
+# (method, source device, destination device) combinations that failed once
+_unsupported: set = set()
+_unsupported_lock = threading.Lock()
+
+def copy_mode() -> str:
+    """Return the copy mode from $GROVE_COPY_MODE: "auto" (default), "hardlink" or "copy"."""
+    mode = os.getenv(COPY_MODE_ENV, "auto").strip().lower()
+    return mode if mode in COPY_MODES else "auto"
+
+def _supported(method: str, src_dev: int, dest_dev: int) -> bool:
+    with _unsupported_lock:
+        return (method, src_dev, dest_dev) not in _unsupported
+
+def _mark_unsupported(method: str, src_dev: int, dest_dev: int) -> None:
+    with _unsupported_lock:
+        _unsupported.add((method, src_dev, dest_dev))
+
+def _hardlink(src: Path, dest: Path) -> bool:
+    src_dev, dest_dev = os.stat(src).st_dev, os.stat(dest.parent).st_dev
+    if src_dev != dest_dev or not _supported("hardlink", src_dev, dest_dev):
+        return False
+    tmp = dest.with_name(f".{dest.name}.grove-link")
+    try:
+        tmp.unlink(missing_ok=True)
+        os.link(src, tmp)
+    except OSError as e:
+        if e.errno not in _LINK_UNSUPPORTED_ERRNOS:
+            raise
+        _mark_unsupported("hardlink", src_dev, dest_dev)
+        return False
+    os.replace(tmp, dest)
+    return True
+
+def _clone_data(fsrc, fdst, size: int) -> str:
+    """Copy the open file `fsrc` into the empty `fdst`, trying reflink and copy_file_range first."""
+    src_fd, dest_fd = fsrc.fileno(), fdst.fileno()
+    src_dev, dest_dev = os.fstat(src_fd).st_dev, os.fstat(dest_fd).st_dev
+
+    if size and _supported("reflink", src_dev, dest_dev):
+        try:
+            import fcntl
+
+            fcntl.ioctl(dest_fd, _FICLONE, src_fd)
+            return "reflink"
+        except ImportError:
+            _mark_unsupported("reflink", src_dev, dest_dev)
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            _mark_unsupported("reflink", src_dev, dest_dev)
+
+    if size and hasattr(os, "copy_file_range") and _supported("copy_file_range", src_dev, dest_dev):
+        copied = 0
+        try:
+            while copied < size:
+                sent = os.copy_file_range(src_fd, dest_fd, size - copied, copied, copied)
+                if sent == 0:
+                    break
+                copied += sent
+            if copied == size:
+                return "copy_file_range"
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            _mark_unsupported("copy_file_range", src_dev, dest_dev)
+        fdst.truncate(0)
+
+    fsrc.seek(0)
+    fdst.seek(0)
+    shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+    return "copy"
+
+def unlink_shared(path: Path) -> None:
+    """Remove `path` if it is a symlink or a hard link, so writing a new file there cannot change another one."""
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if os.path.islink(path) or st.st_nlink > 1:
+        os.unlink(path)
+
+def clone_file(src: Path, dest: Path, *, link: bool = False) -> str:
+    """Copy `src` to `dest` like `shutil.copy2`, by the cheapest method that works here.
+
+    Unsupported methods fall back to the next one and are not tried again
+    for the same pair of devices.
+
+    Args:
+        src: Source file
+        dest: Destination file (replaced if it exists)
+        link: `src` is a read-only artifact that may be hard-linked
+            (only with $GROVE_COPY_MODE=hardlink)
+
+    Returns:
+        The method used: "hardlink", "reflink", "copy_file_range" or "copy"
+    """
+    mode = copy_mode()
+    if link and mode == "hardlink" and _hardlink(Path(src), Path(dest)):
+        return "hardlink"
+    # Never write through a link left by an earlier hardlink install
+    unlink_shared(dest)
+    if mode == "copy":
+        shutil.copy2(src, dest)
+        return "copy"
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+        method = _clone_data(fsrc, fdst, os.fstat(fsrc.fileno()).st_size)
+    shutil.copystat(src, dest)
+    return method
+
+# =============================================================================
+# Single-file writes
+# =============================================================================
+
+def file_matches_crc(path: Path, size: int, crc: int) -> bool:
+    """Whether `path` is a regular file of `size` bytes whose CRC-32 is `crc` (as recorded in a zip)."""
+    try:
+        if path.stat().st_size != size:
+            return False
+        value = 0
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                value = zlib.crc32(block, value)
+        return value == crc
+    except OSError:
+        return False
+
+def same_file(src: Path, dest: Path) -> bool:
+    """Whether `dest` already has the same size and bytes as `src`."""
+    try:
+        src_stat, dest_stat = src.stat(), dest.stat()
+        if (src_stat.st_dev, src_stat.st_ino) == (dest_stat.st_dev, dest_stat.st_ino):
+            return True  # hard-linked
+        return dest_stat.st_size == src_stat.st_size and filecmp.cmp(src, dest, shallow=False)
+    except OSError:
+        return False
+
+def copy_if_changed(src: Path, dest: Path, *, link: bool = False) -> bool:
+    """Copy `src` to `dest` (see `clone_file`) unless `dest` is already byte-identical.
+
+    Identical files are left untouched (mtime included), so re-initialising
+    does not churn editors and file watchers; only their permission bits are
+    brought in line with `src`.
+
+    Returns:
+        True if the file was copied
+    """
+    src, dest = Path(src), Path(dest)
+    if same_file(src, dest):
+        mode = src.stat().st_mode & 0o777
+        if dest.stat().st_mode & 0o777 != mode:
+            os.chmod(dest, mode)
+        return False
+    clone_file(src, dest, link=link)
+    return True
+
+def write_if_changed(data: bytes, path: Path) -> bool:
+    """Write `data` to `path` unless it already holds exactly that; returns True if written."""
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    unlink_shared(path)
+    path.write_bytes(data)
+    return True
+
+# =============================================================================
+# Jobs
+# =============================================================================
+
+
+class FileJob(NamedTuple):
+    """One path to materialise.
+
+    `write(dest)` produces the file and returns False if it left an
+    up-to-date file alone. A job without `write` only creates the directory
+    `dest`.
+    """
+
+    dest: Path
+    write: Optional[Callable[[Path], bool]] = None
+
+
+class MaterializeResult(NamedTuple):
+    """What `materialize` did."""
+
+    written: int
+    skipped: int
+
+    @property
+    def total(self) -> int:
+        return self.written + self.skipped
+
+
+class MaterializeError(RuntimeError):
+    """One or more files could not be written; `failures` lists (path, exception)."""
+
+    def __init__(self, failures: List[Tuple[Path, BaseException]]):
+        self.failures = failures
+        lines = [f"{len(failures)} file(s) could not be written:"]
+        lines += [f"  {path}: {error}" for path, error in failures[:10]]
+        if len(failures) > 10:
+            lines.append(f"  ... and {len(failures) - 10} more")
+        super().__init__("\n".join(lines))
+
+
+def copy_job(src: Path, dest: Path, *, link: bool = False) -> FileJob:
+    """Job copying `src` to `dest` (skipped when already identical; `link` allows a hard link)."""
+    return FileJob(dest, partial(copy_if_changed, src, link=link))
+
+def tree_jobs(src: Path, dest: Path, *, exclude: Callable[[Path], bool] = None, link: bool = False) -> List[FileJob]:
+    """Jobs copying the tree under `src` to `dest`, like `shutil.copytree(..., dirs_exist_ok=True)`.
+
+    Args:
+        src: Source directory (no jobs if it does not exist)
+        dest: Destination directory
+        exclude: Called with each path relative to `src` (files and directories);
+            True leaves it (and everything below a directory) out
+        link: The files are read-only artifacts that may be hard-linked
+    """
+    jobs: List[FileJob] = []
+    if not src.is_dir():
+        return jobs
+    jobs.append(FileJob(dest))
+    for listing in walk(src):
+        relative_root = Path(listing.relative)
+        if exclude is not None:
+            listing.dirs[:] = [d for d in listing.dirs if not exclude(relative_root / d.name)]
+        for entry in listing.dirs:
+            jobs.append(FileJob(dest / relative_root / entry.name))
+        for entry in listing.files:
+            if exclude is None or not exclude(relative_root / entry.name):
+                jobs.append(copy_job(Path(entry.path), dest / relative_root / entry.name, link=link))
+    return jobs
+
+def dir_files_jobs(src: Path, dest: Path, *, link: bool = False) -> List[FileJob]:
+    """Jobs copying the regular files directly under `src` into `dest`."""
+    if not src.is_dir():
+        return []
+    return [FileJob(dest)] + [copy_job(Path(entry.path), dest / entry.name, link=link) for entry in scan_dir(src).files]
+
+# =============================================================================
+# Engine
+# =============================================================================
+
+def _run(job: FileJob) -> bool:
+    return job.write(job.dest)
+
+def materialize(jobs: Iterable[FileJob], *, workers: Optional[int] = None) -> MaterializeResult:
+    """Create every directory the jobs need, then run the file writes on a thread pool.
+
+    Args:
+        jobs: Paths to produce; a later job for the same path replaces an earlier one
+        workers: Thread count (default: `default_workers()`); 1 runs sequentially
+
+    Returns:
+        Counts of files written and of up-to-date files left alone
+
+    Raises:
+        MaterializeError: If any file could not be written (after all jobs ran)
+    """
+    by_dest = {}
+    directories = set()
+    for job in jobs:
+        if job.write is None:
+            directories.add(job.dest)
+        else:
+            by_dest[job.dest] = job
+            directories.add(job.dest.parent)
+    for directory in sorted(directories, key=lambda path: len(path.parts)):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    files = list(by_dest.values())
+    workers = default_workers() if workers is None else max(1, workers)
+    failures: List[Tuple[Path, BaseException]] = []
+    written = skipped = 0
+    if workers == 1 or len(files) < PARALLEL_MIN_FILES:
+        outcomes = []
+        for job in files:
+            try:
+                outcomes.append(_run(job))
+            except Exception as e:
+                failures.append((job.dest, e))
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(files)), thread_name_prefix="grove-install") as pool:
+            futures = [(job, pool.submit(_run, job)) for job in files]
+        outcomes = []
+        for job, future in futures:
+            error = future.exception()
+            if error is not None:
+                failures.append((job.dest, error))
+            else:
+                outcomes.append(future.result())
+    for outcome in outcomes:
+        if outcome:
+            written += 1
+        else:
+            skipped += 1
+    if failures:
+        raise MaterializeError(failures)
+    return MaterializeResult(written, skipped)
@@ -0,0 +1,232 @@
+"""`grove mirror serve`: share one template asset cache with a fleet over HTTP.
+
+The server speaks the subset of the GitHub releases layout that grove reads:
+
+    GET /releases/latest                      release JSON; asset URLs point back here
+    GET /releases/download/<tag>/<asset>      cached asset (Range requests supported)
+
+Clients use it with `GROVE_RELEASE_SOURCE=http://<host>:<port>`. Release
+metadata comes from the mirror's own release source (cached as usual), and
+assets that are not cached yet are downloaded once, on first request, into
+the mirror's asset cache. With `offline` only what is already cached is
+served.
+"""
+
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote, unquote, urlparse
+
+from .cache import AssetCache, ReleaseCache
+
+# Bytes per write when streaming an asset
+_SEND_CHUNK = 1024 * 1024
+
+
+class MirrorServer(ThreadingHTTPServer):
+    """HTTP server holding the mirror's caches and settings."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], *, offline: bool = False, github_token: Optional[str] = None, log=None):
+        """
+        Args:
+            address: (host, port) to listen on
+            offline: Serve cached release metadata and assets only
+            github_token: Token for the mirror's own GitHub requests
+            log: Callable receiving one line per request (default: silent)
+        """
+        self.cache = AssetCache()
+        self.offline = offline
+        self.github_token = github_token
+        self.log = log
+        self._download_locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        super().__init__(address, _MirrorHandler)
+
+    def latest_release(self) -> dict:
+        """Return the release JSON to serve.
+
+        Raises:
+            LookupError: If no release information is available
+        """
+        from .github import fetch_latest_release, get_release_source
+
+        if not self.offline:
+            try:
+                return fetch_latest_release(github_token=self.github_token)[0]
+            except RuntimeError as e:
+                raise LookupError(str(e))
+        cached = ReleaseCache().get(get_release_source().latest_url)
+        if cached is None:
+            raise LookupError("No cached release information; run `grove cache warm` or serve without --offline")
+        return cached.data
+
+    def asset_file(self, tag: str, name: str) -> Optional[Path]:
+        """Return the cached file for `tag`/`name`, downloading it first unless offline."""
+        path = self.cache.lookup(tag, name)
+        if path is not None or self.offline:
+            return path
+
+        key = f"{tag}/{name}"
+        with self._locks_guard:
+            lock = self._download_locks.setdefault(key, threading.Lock())
+        with lock:
+            # Another request may have fetched it while this one waited
+            path = self.cache.lookup(tag, name)
+            if path is not None:
+                return path
+            release = self.latest_release()
+            asset = next((a for a in release.get("assets", []) if a.get("name") == name), None)
+            if release.get("tag_name") != tag or asset is None:
+                return None
+            return self._download(tag, asset)
+
+    def _download(self, tag: str, asset: dict) -> Path:
+        from .github import _asset_sha256, _auth_headers_for, _download_resumable, get_http_client, get_release_source
+
+        local = get_release_source().local_asset(tag, asset)
+        if local is not None:
+            return local
+        url = asset["browser_download_url"]
+        expected = _asset_sha256(asset)
+        with self.cache.partial_download(f"{tag}/{asset['name']}") as partial:
+            # Another request or process may have downloaded it while we waited
+            cached = self.cache.lookup(tag, asset["name"], expected)
+            if cached is not None:
+                return cached
+            sha256 = _download_resumable(
+                get_http_client(),
+                url,
+                partial,
+                total_size=asset.get("size") or 0,
+                headers=_auth_headers_for(url, self.github_token),
+                show_progress=False,
+            )
+            if expected and sha256 != expected:
+                partial.unlink(missing_ok=True)
+                raise RuntimeError(f"Checksum mismatch for {asset['name']}: expected sha256 {expected}, got {sha256}")
+            return self.cache.store(tag, asset["name"], partial, sha256)
+
+    def release_for(self, base_url: str) -> dict:
+        """Return the release JSON with asset URLs (and digests of cached assets) pointing at `base_url`."""
+        release = dict(self.latest_release())
+        tag = release.get("tag_name", "")
+        cached = {e.name: e for e in self.cache.entries() if e.tag == tag}
+        assets = []
+        for asset in release.get("assets", []):
+            name = asset.get("name", "")
+            entry = cached.get(name)
+            if entry is None and self.offline:
+                continue
+            asset = dict(asset, browser_download_url=f"{base_url}/releases/download/{quote(tag)}/{quote(name)}")
+            if entry is not None:
+                asset.update(size=entry.size, digest=f"sha256:{entry.sha256}")
+            assets.append(asset)
+        release["assets"] = assets
+        return release
+
+
+class _MirrorHandler(BaseHTTPRequestHandler):
+    server: MirrorServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._handle(send_body=True)
+
+    def do_HEAD(self):
+        self._handle(send_body=False)
+
+    def _handle(self, send_body: bool) -> None:
+        path = urlparse(self.path).path.rstrip("/")
+        try:
+            if path == "/releases/latest":
+                self._send_release(send_body)
+                return
+            parts = path.split("/")
+            if len(parts) == 5 and parts[1:3] == ["releases", "download"]:
+                self._send_asset(unquote(parts[3]), unquote(parts[4]), send_body)
+                return
+            self._send_error(404, f"Not found: {path}")
+        except LookupError as e:
+            self._send_error(503, str(e))
+        except Exception as e:
+            self._send_error(502, f"{type(e).__name__}: {e}")
+
+    def _send_release(self, send_body: bool) -> None:
+        host = self.headers.get("Host") or "%s:%s" % self.server.server_address[:2]
+        body = json.dumps(self.server.release_for(f"http://{host}")).encode("utf-8")
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _send_asset(self, tag: str, name: str, send_body: bool) -> None:
+        path = self.server.asset_file(tag, name)
+        if path is None:
+            self._send_error(404, f"Asset not available: {tag}/{name}")
+            return
+        size = path.stat().st_size
+        start, end = 0, size - 1
+        status = 200
+        range_header = self.headers.get("Range", "")
+        if range_header.startswith("bytes="):
+            first, _, last = range_header[len("bytes="):].partition("-")
+            try:
+                start = int(first)
+                end = min(int(last), size - 1) if last else size - 1
+            except ValueError:
+                start, end = 0, size - 1
+            else:
+                if start >= size or start > end:
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{size}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                status = 206
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        if not send_body:
+            return
+        remaining = end - start + 1
+        with open(path, "rb") as f:
+            f.seek(start)
+            while remaining:
+                chunk = f.read(min(_SEND_CHUNK, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+    def _send_error(self, status: int, message: str) -> None:
+        body = json.dumps({"message": message}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.log:
+            self.server.log(f"{self.address_string()} {format % args}")
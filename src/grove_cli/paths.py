@@ -0,0 +1,76 @@
+"""Feature path resolution, mirroring `get_feature_paths` in `scripts/bash/common.sh`."""
+
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Dict, Optional
+
+_FEATURE_PREFIX = re.compile(r"^([0-9]{3})-")
+
+def _git(args: list[str], cwd: Path) -> Optional[str]:
+    try:
+        result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError, NotADirectoryError):
+        return None
+    return result.stdout.strip()
+
+def get_repo_root(start: Path) -> Path:
+    """Return the git top-level directory containing `start`, or `start` itself outside git."""
+    top = _git(["rev-parse", "--show-toplevel"], start)
+    return Path(top) if top else start
+
+def get_current_branch(repo_root: Path) -> str:
+    """Return the active feature name: $SPECIFY_FEATURE, the git branch, the highest-numbered spec, or "main"."""
+    feature = os.getenv("SPECIFY_FEATURE")
+    if feature:
+        return feature
+
+    branch = _git(["rev-parse", "--abbrev-ref", "HEAD"], repo_root)
+    if branch:
+        return branch
+
+    specs_dir = repo_root / "specs"
+    latest, highest = None, 0
+    if specs_dir.is_dir():
+        with os.scandir(specs_dir) as entries:
+            for entry in entries:
+                match = _FEATURE_PREFIX.match(entry.name)
+                if match and entry.is_dir() and int(match.group(1)) > highest:
+                    highest, latest = int(match.group(1)), entry.name
+    return latest or "main"
+
+def find_feature_dir(repo_root: Path, branch: str) -> Path:
+    """Find `specs/NNN-*` by the branch's numeric prefix, falling back to `specs/<branch>`."""
+    specs_dir = repo_root / "specs"
+    match = _FEATURE_PREFIX.match(branch)
+    if not match or not specs_dir.is_dir():
+        return specs_dir / branch
+
+    prefix = f"{match.group(1)}-"
+    with os.scandir(specs_dir) as entries:
+        matches = [e.name for e in entries if e.name.startswith(prefix) and e.is_dir()]
+    if len(matches) == 1:
+        return specs_dir / matches[0]
+    return specs_dir / branch
+
+def get_feature_paths(start: Path) -> Dict[str, str]:
+    """Return the same variables `get_feature_paths` prints in the bash helpers."""
+    top = _git(["rev-parse", "--show-toplevel"], start)
+    repo_root = Path(top) if top else start
+    has_git = top is not None
+    branch = get_current_branch(repo_root)
+    feature_dir = find_feature_dir(repo_root, branch)
+    return {
+        "REPO_ROOT": str(repo_root),
+        "CURRENT_BRANCH": branch,
+        "HAS_GIT": "true" if has_git else "false",
+        "FEATURE_DIR": str(feature_dir),
+        "FEATURE_SPEC": str(feature_dir / "spec.md"),
+        "IMPL_PLAN": str(feature_dir / "plan.md"),
+        "TASKS": str(feature_dir / "tasks.md"),
+        "RESEARCH": str(feature_dir / "research.md"),
+        "DATA_MODEL": str(feature_dir / "data-model.md"),
+        "QUICKSTART": str(feature_dir / "quickstart.md"),
+        "CONTRACTS_DIR": str(feature_dir / "contracts"),
+    }
@@ -0,0 +1,236 @@
+"""Programmatic API for driving Grove projects in-process.
+
+    from grove_cli import GroveProject
+
+    project = GroveProject("path/to/project")
+    result = project.sync_docs(auto=True)
+    print(result.count, result.warnings)
+
+`GroveProject` methods return results instead of printing to the console or
+raising `typer.Exit`, and never change the process working directory, so an
+orchestrator can drive many projects from one interpreter. Config, parsed
+templates and the docs index are cached in a `GroveState` that is shared by
+all projects unless one is passed explicitly (the `grove serve` daemon keeps
+one for its whole lifetime).
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+# =============================================================================
+# Warm state
+# =============================================================================
+
+class GroveState:
+    """Caches shared by every request served by one process.
+
+    Entries are validated against file mtimes, so edits made outside the
+    daemon are picked up on the next request.
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._configs: Dict[Path, Tuple[int, dict]] = {}
+        self._templates: Dict[Path, Tuple[int, dict, str]] = {}
+        self._docs_index: Dict[Path, Dict[str, Path]] = {}
+        self._templates_root: Optional[Path] = None
+
+    def config(self, project_dir: Path) -> dict:
+        """Return `.grove/memory/config.json`, re-reading it only when it changed."""
+        from .config import load_project_config
+
+        config_file = project_dir / ".grove" / "memory" / "config.json"
+        try:
+            mtime = config_file.stat().st_mtime_ns
+        except OSError:
+            return load_project_config(project_dir)
+        with self._lock:
+            cached = self._configs.get(config_file)
+            if cached and cached[0] == mtime:
+                return cached[1]
+        config = load_project_config(project_dir)
+        with self._lock:
+            self._configs[config_file] = (mtime, config)
+        return config
+
+    def templates_root(self) -> Path:
+        if self._templates_root is None:
+            from .templates import get_templates_root
+
+            self._templates_root = get_templates_root()
+        return self._templates_root
+
+    def template(self, command: str, project_dir: Path) -> Optional[str]:
+        """Same contract as `load_template_if_enabled`, with parsed frontmatter cached."""
+        from .templates import parse_yaml_frontmatter
+
+        lang = self.config(project_dir).get("language", "en")
+        template_file = self.templates_root() / lang / f"{command}-template.md"
+        try:
+            mtime = template_file.stat().st_mtime_ns
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._templates.get(template_file)
+        if cached and cached[0] == mtime:
+            frontmatter, body = cached[1], cached[2]
+        else:
+            frontmatter, body = parse_yaml_frontmatter(template_file.read_text(encoding="utf-8"))
+            with self._lock:
+                self._templates[template_file] = (mtime, frontmatter, body)
+        return body if frontmatter.get("enabled", False) else None
+
+    def docs_index(self, project_dir: Path, refresh: bool = False) -> Dict[str, Path]:
+        """Map of `.grove/docs`-relative paths to documentation files."""
+        docs_dir = project_dir / ".grove" / "docs"
+        with self._lock:
+            index = None if refresh else self._docs_index.get(docs_dir)
+        if index is None:
+            from .walk import walk
+
+            index = {}
+            for listing in walk(docs_dir):
+                for entry in listing.files:
+                    if entry.name.startswith("."):
+                        continue  # e.g. the sync index
+                    relative = f"{listing.relative}/{entry.name}" if listing.relative else entry.name
+                    index[relative] = Path(entry.path)
+            with self._lock:
+                self._docs_index[docs_dir] = index
+        return index
+
+    def invalidate_docs(self, project_dir: Path) -> None:
+        with self._lock:
+            self._docs_index.pop(project_dir / ".grove" / "docs", None)
+
+# =============================================================================
+# Project API
+# =============================================================================
+
+class SyncResult(NamedTuple):
+    """Outcome of `GroveProject.sync_docs`."""
+
+    count: int
+    src_dir: Path
+    docs_dir: Path
+    warnings: List[str]
+
+_shared_state: Optional[GroveState] = None
+_shared_state_lock = threading.Lock()
+
+def shared_state() -> GroveState:
+    """Return the process-wide `GroveState` used when none is passed explicitly."""
+    global _shared_state
+    with _shared_state_lock:
+        if _shared_state is None:
+            _shared_state = GroveState()
+        return _shared_state
+
+class GroveProject:
+    """One Grove project, addressed by its root directory."""
+
+    def __init__(self, root: Union[str, Path], state: Optional[GroveState] = None):
+        """
+        Args:
+            root: Project root directory
+            state: Cache to use (default: the process-wide shared cache)
+        """
+        self.root = Path(root).resolve()
+        self.state = state or shared_state()
+
+    def __repr__(self) -> str:
+        return f"GroveProject({str(self.root)!r})"
+
+    @property
+    def config(self) -> dict:
+        """Project configuration from `.grove/memory/config.json` (cached)."""
+        return self.state.config(self.root)
+
+    @property
+    def language(self) -> str:
+        return self.config.get("language", "en")
+
+    @property
+    def docs_dir(self) -> Path:
+        return self.root / ".grove" / "docs"
+
+    def template(self, command: str) -> Optional[str]:
+        """Template body for `command` if its frontmatter enables it, else None."""
+        return self.state.template(command, self.root)
+
+    def feature_paths(self) -> Dict[str, str]:
+        """Feature paths as printed by `get_feature_paths` in the bash helpers."""
+        from .paths import get_feature_paths
+
+        return get_feature_paths(self.root)
+
+    def source_dir(self, src: Optional[str] = None) -> Path:
+        """Resolve the source directory to document.
+
+        Raises:
+            FileNotFoundError: If `src` does not exist or none can be auto-detected
+        """
+        from .docs import detect_source_directory
+
+        if src:
+            src_dir = self.root / src
+            if not src_dir.exists():
+                raise FileNotFoundError(f"Source directory '{src}' not found")
+            return src_dir
+        src_dir = detect_source_directory(self.root)
+        if src_dir is None:
+            raise FileNotFoundError("Could not auto-detect source directory")
+        return src_dir
+
+    def docs(self, refresh: bool = False) -> List[str]:
+        """Documentation files under `.grove/docs`, relative and sorted."""
+        return sorted(self.state.docs_index(self.root, refresh=refresh))
+
+    def sync_docs(self, src: Optional[str] = None, auto: bool = False, jobs: Optional[int] = None) -> SyncResult:
+        """Generate `.grove/docs/<src>` documentation (what `grove sync` does).
+
+        Raises:
+            FileNotFoundError: If the source directory cannot be resolved
+        """
+        from .completion import write_completion_index
+        from .docs import sync_directory_docs
+
+        src_dir = self.source_dir(src)
+        docs_dir = self.docs_dir / src_dir.name
+        warnings: List[str] = []
+        count = sync_directory_docs(src_dir, docs_dir, auto, on_warning=warnings.append, jobs=jobs)
+        self.state.invalidate_docs(self.root)
+        write_completion_index(self.root)
+        return SyncResult(count, src_dir, docs_dir, warnings)
+
+    def record_changes(self) -> int:
+        """Append change history for files changed since HEAD; returns docs updated."""
+        from .docs import record_implementation_changes
+
+        count = record_implementation_changes(self.root)
+        self.state.invalidate_docs(self.root)
+        return count
+
+    def run_agent(self, agent: str, command: str, prompt: str = "", use_template: bool = True):
+        """Run one slash command through an agent CLI without printing.
+
+        Args:
+            agent: Agent name (claude, codex, gemini)
+            command: Command name (constitution, specify, plan, ...)
+            prompt: Additional prompt text
+            use_template: Include the command's template if it is enabled
+
+        Returns:
+            `grove_cli.agents.AgentRun`
+
+        Raises:
+            ValueError: If the agent is unknown
+            RuntimeError: If the agent CLI is missing or fails
+        """
+        from .agents import AgentExecutor
+
+        template_content = self.template(command) if use_template else None
+        return AgentExecutor(agent, self.root).run(command, prompt, template_content)
@@ -0,0 +1,238 @@
+"""Proactive rate limiting for the shared GitHub session.
+
+GitHub reports each client's quota on every API response
+(`X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Reset`).
+`RateLimitedTransport` records those values per host and token, persists them
+in the cache (so parallel jobs sharing one token see each other's usage), and
+acts before a request would be refused:
+
+- While more than `RESERVE_FRACTION` of the quota is left, requests go out
+  unthrottled.
+- Inside that reserve, a token bucket spaces requests so the remaining quota
+  lasts until the reset.
+- With no quota left, a request waits for the reset if it comes within
+  `$GROVE_RATE_LIMIT_MAX_WAIT` seconds (default 60). Otherwise it is not sent
+  at all and a synthetic 429 is returned, which callers already treat as rate
+  limiting (`grove init` then falls back to cached release information).
+
+403 and 429 responses that carry `Retry-After` or report an exhausted quota
+are retried after the indicated delay, within the same bound.
+"""
+
+import hashlib
+import math
+import os
+import random
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Optional
+
+import httpx
+
+from .cache import RateLimitCache, RateLimitState
+
+MAX_WAIT_ENV = "GROVE_RATE_LIMIT_MAX_WAIT"
+DEFAULT_MAX_WAIT = 60.0
+
+# Share of the quota below which requests are paced
+RESERVE_FRACTION = 0.1
+
+# Retries of a 403/429 response that asked the client to wait
+MAX_RATE_LIMIT_RETRIES = 3
+
+# Set on the 429 returned for a request that was not sent
+THROTTLED_HEADER = "X-Grove-Throttled"
+
+_RATE_LIMIT_STATUSES = {403, 429}
+
+def default_max_wait() -> float:
+    """Return the longest total wait per request for rate limits ($GROVE_RATE_LIMIT_MAX_WAIT seconds)."""
+    try:
+        return max(0.0, float(os.getenv(MAX_WAIT_ENV, DEFAULT_MAX_WAIT)))
+    except ValueError:
+        return DEFAULT_MAX_WAIT
+
+def parse_retry_after(value: str, now: Optional[float] = None) -> Optional[float]:
+    """Return the delay a `Retry-After` value asks for (delta-seconds or HTTP-date), or None if unparsable."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - (time.time() if now is None else now))
+    except (TypeError, ValueError):
+        return None
+
+def state_from_headers(headers: "httpx.Headers", now: Optional[float] = None) -> Optional[RateLimitState]:
+    """Return the quota reported by `X-RateLimit-*` headers, if the response has them."""
+    try:
+        return RateLimitState(
+            int(headers["X-RateLimit-Limit"]),
+            int(headers["X-RateLimit-Remaining"]),
+            float(headers["X-RateLimit-Reset"]),
+            time.time() if now is None else now,
+        )
+    except (KeyError, ValueError):
+        return None
+
+def _bucket_key(request: "httpx.Request") -> str:
+    # Quotas are per token (or per IP address without one); never store the token itself
+    auth = request.headers.get("Authorization", "")
+    identity = hashlib.sha256(auth.encode("utf-8")).hexdigest()[:16] if auth else "anonymous"
+    return f"{request.url.host}|{identity}"
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second, holding at most `capacity` tokens."""
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """Take one token and return how long to wait until it is actually available (0 if it is)."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateLimiter:
+    """Quota bookkeeping shared by every request of the process."""
+
+    def __init__(self, cache: Optional[RateLimitCache] = None, max_wait: Optional[float] = None):
+        """
+        Args:
+            cache: Where quota observations are shared (default: the per-user cache)
+            max_wait: Longest total wait per request (default: $GROVE_RATE_LIMIT_MAX_WAIT)
+        """
+        self.cache = cache or RateLimitCache()
+        self.max_wait = default_max_wait() if max_wait is None else max_wait
+        self._states: Dict[str, RateLimitState] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def state(self, key: str) -> Optional[RateLimitState]:
+        """Return the most recent quota known for `key`, from this process or the cache."""
+        with self._lock:
+            return self._current(key)
+
+    def _current(self, key: str) -> Optional[RateLimitState]:
+        ours = self._states.get(key)
+        shared = self.cache.get(key)
+        if shared is not None and (ours is None or shared.updated > ours.updated):
+            self._states[key] = shared
+            return shared
+        return ours
+
+    def acquire(self, key: str) -> Optional[float]:
+        """Reserve quota for one request.
+
+        Returns:
+            Seconds to wait before sending, or None if the quota is exhausted
+            and does not reset within `max_wait`
+        """
+        with self._lock:
+            now = time.time()
+            state = self._current(key)
+            if state is None or state.reset <= now:
+                return 0.0
+            if state.remaining <= 0:
+                wait = state.reset - now
+                # Spread jobs that were waiting for the same reset
+                return wait + random.uniform(0, 1) if wait <= self.max_wait else None
+
+            self._states[key] = state._replace(remaining=state.remaining - 1, updated=now)
+            if state.remaining > max(1, int(state.limit * RESERVE_FRACTION)):
+                self._buckets.pop(key, None)
+                return 0.0
+            # Pace the reserve so it lasts until the reset
+            rate = state.remaining / max(state.reset - now, 1.0)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, 1, now)
+            bucket.rate = rate
+            return min(bucket.take(now), self.max_wait)
+
+    def record(self, key: str, headers: "httpx.Headers") -> None:
+        """Store the quota a response reported."""
+        state = state_from_headers(headers)
+        if state is None:
+            return
+        with self._lock:
+            self._states[key] = state
+        self.cache.put(key, state)
+
+@lru_cache(maxsize=None)
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter."""
+    return RateLimiter()
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """Transport wrapper applying `RateLimiter` to every request."""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: Optional[RateLimiter] = None):
+        self._transport = transport
+        self.limiter = limiter or get_rate_limiter()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = _bucket_key(request)
+        waited = 0.0
+        attempt = 0
+        while True:
+            wait = self.limiter.acquire(key)
+            if wait is None:
+                return self._throttled(request, key)
+            wait = min(wait, max(0.0, self.limiter.max_wait - waited))
+            if wait:
+                time.sleep(wait)
+                waited += wait
+
+            response = self._transport.handle_request(request)
+            self.limiter.record(key, response.headers)
+            if response.status_code not in _RATE_LIMIT_STATUSES or attempt == MAX_RATE_LIMIT_RETRIES:
+                return response
+            delay = self._retry_delay(response)
+            if delay is None or waited + delay > self.limiter.max_wait:
+                return response
+            response.close()
+            time.sleep(delay)
+            waited += delay
+            attempt += 1
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response) -> Optional[float]:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            return parse_retry_after(retry_after)
+        state = state_from_headers(response.headers)
+        if state is not None and state.remaining == 0:
+            return max(0.0, state.reset - time.time()) + random.uniform(0, 1)
+        # A 403 without rate-limit headers is a plain refusal
+        return None
+
+    def _throttled(self, request: httpx.Request, key: str) -> httpx.Response:
+        state = self.limiter.state(key)
+        headers = {THROTTLED_HEADER: "1", "Content-Type": "application/json"}
+        if state is not None:
+            headers.update({
+                "X-RateLimit-Limit": str(state.limit),
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(state.reset)),
+                "Retry-After": str(max(0, math.ceil(state.reset - time.time()))),
+            })
+        return httpx.Response(
+            429,
+            headers=headers,
+            content=b'{"message": "Request not sent: rate limit exhausted until the reset"}',
+            request=request,
+        )
+
+    def close(self) -> None:
+        self._transport.close()
@@ -0,0 +1,142 @@
+"""Lazy subcommand registry.
+
+Subcommands are described by an import path and loaded only when Click asks
+for them, so `grove sync` never imports the init/download/extraction code.
+Third-party packages can add commands through the `grove_cli.commands`
+entry point group; an entry point may name a Typer app, a Click command or a
+plain function:
+
+    [project.entry-points."grove_cli.commands"]
+    deploy = "grove_deploy.cli:deploy"
+"""
+
+import importlib
+from functools import lru_cache
+from importlib.metadata import entry_points
+from typing import Dict, NamedTuple, Optional
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+ENTRY_POINT_GROUP = "grove_cli.commands"
+
+
+class CommandSpec(NamedTuple):
+    """Where to find a subcommand and the one-line help shown in `grove --help`."""
+
+    target: str
+    short_help: str = ""
+
+
+# Built-in commands in display order
+BUILTIN_COMMANDS: Dict[str, CommandSpec] = {
+    "init": CommandSpec("grove_cli.commands.init:init", "Initialize a new Grove project from the latest template."),
+    "upgrade": CommandSpec("grove_cli.commands.upgrade:upgrade", "Upgrade the current project's template files to the latest release."),
+    "check": CommandSpec("grove_cli.commands.check:check", "Check that all required tools are installed."),
+    "version": CommandSpec("grove_cli.commands.version:version", "Display version and system information."),
+    "workflow": CommandSpec("grove_cli.commands.workflow:workflow", "Execute complete SDD workflow: constitution → specify → design → plan → tasks → implement"),
+    "sync": CommandSpec("grove_cli.commands.sync:sync", "Sync project documentation to .grove/docs/"),
+    "serve": CommandSpec("grove_cli.commands.serve:serve", "Run a long-lived daemon that keeps project state warm."),
+    "call": CommandSpec("grove_cli.commands.serve:call", "Send one request to `grove serve`, or run it in-process if no daemon is up."),
+    "cache": CommandSpec("grove_cli.commands.cache:cache", "Manage the per-user cache of release template archives."),
+    "mirror": CommandSpec("grove_cli.commands.mirror:mirror", "Serve cached release templates over HTTP so a fleet shares one cache."),
+    "completion": CommandSpec("grove_cli.commands.completion:completion", "Generate a static shell completion script."),
+}
+
+
+@lru_cache(maxsize=None)
+def plugin_commands() -> Dict[str, CommandSpec]:
+    """Return commands advertised by installed distributions (metadata only, nothing is imported)."""
+    found: Dict[str, CommandSpec] = {}
+    try:
+        eps = entry_points(group=ENTRY_POINT_GROUP)
+    except Exception:
+        return found
+    for ep in eps:
+        if ep.name in BUILTIN_COMMANDS or ep.name in found:
+            continue
+        dist = getattr(ep, "dist", None)
+        origin = f"(plugin: {dist.name})" if dist is not None else "(plugin)"
+        found[ep.name] = CommandSpec(ep.value, origin)
+    return found
+
+
+def resolve_spec(name: str) -> Optional[CommandSpec]:
+    """Look up a command by name, checking built-ins before plugins."""
+    return BUILTIN_COMMANDS.get(name) or plugin_commands().get(name)
+
+
+def _is_click_command(obj) -> bool:
+    # Duck-typed so that commands built with standalone Click and with the
+    # copy vendored by newer Typer releases are both accepted.
+    return hasattr(obj, "make_context") and hasattr(obj, "invoke")
+
+
+def load_command(name: str, spec: CommandSpec):
+    """Import the target of `spec` and turn it into a Click command named `name`."""
+    module_name, _, attr = spec.target.partition(":")
+    obj = importlib.import_module(module_name)
+    for part in filter(None, attr.split(".")):
+        obj = getattr(obj, part)
+
+    if _is_click_command(obj):
+        command = obj
+    elif isinstance(obj, typer.Typer):
+        command = typer.main.get_command(obj)
+    elif callable(obj):
+        single = typer.Typer(add_completion=False)
+        single.command(name=name)(obj)
+        command = typer.main.get_command(single)
+    else:
+        raise TypeError(f"Command '{name}' ({spec.target}) is not a Typer app, Click command or function")
+
+    command.name = name
+    return command
+
+
+class BannerGroup(TyperGroup):
+    """Custom group that shows banner before help."""
+
+    def format_help(self, ctx, formatter):
+        # Show banner before help
+        from .ui import show_banner
+
+        show_banner()
+        super().format_help(ctx, formatter)
+
+
+class LazyGroup(BannerGroup):
+    """Group that imports each subcommand's module on first use.
+
+    While rendering `--help` unloaded commands are represented by stubs that
+    carry only their name and short help, so listing commands imports nothing.
+    """
+
+    _listing = False
+
+    def list_commands(self, ctx):
+        names = list(super().list_commands(ctx))
+        for name in [*BUILTIN_COMMANDS, *plugin_commands()]:
+            if name not in names:
+                names.append(name)
+        return names
+
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        spec = resolve_spec(cmd_name)
+        if spec is None:
+            return None
+        if self._listing:
+            return TyperCommand(cmd_name, short_help=spec.short_help, help=spec.short_help)
+        command = load_command(cmd_name, spec)
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx, formatter):
+        self._listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
@@ -0,0 +1,148 @@
+"""Pooled HTTP session shared by every GitHub request.
+
+The release metadata call, the asset download and its redirect to
+`objects.githubusercontent.com` all go through one `httpx.Client` per TLS
+setting, so connections (and TLS sessions) are reused instead of being
+renegotiated for each step:
+
+    session = get_session()                    # verified TLS
+    session = get_session(verify=False)        # --skip-tls
+    session.client.get(url)
+    session.timings                            # per-request timing
+
+HTTP/2 is used when the optional `h2` package is installed
+(`pip install grove-cli[http2]`) unless `$GROVE_HTTP2=0`. Responses are
+transferred compressed whenever the server supports an encoding httpx can
+decode (gzip and deflate always; brotli and zstd when installed).
+
+Requests are throttled ahead of GitHub's rate limit, and 403/429 responses
+that ask the client to wait are retried (see grove_cli.ratelimit).
+"""
+
+import importlib.util
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    import ssl
+    import httpx
+
+HTTP2_ENV = "GROVE_HTTP2"
+
+# Hosts that receive the session token; redirects to other hosts never do
+GITHUB_HOSTS = {"github.com", "api.github.com"}
+
+# Idle connections are kept this long (seconds) for the next request
+KEEPALIVE_EXPIRY = 60.0
+
+@lru_cache(maxsize=None)
+def get_ssl_context() -> "ssl.SSLContext":
+    """Return the shared truststore SSL context, building it on first use."""
+    import ssl
+    import truststore
+    return truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+def http2_available() -> bool:
+    """Whether HTTP/2 is enabled: `h2` is installed and $GROVE_HTTP2 is not "0"."""
+    if os.getenv(HTTP2_ENV, "1").strip().lower() in ("0", "false", "no"):
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+
+class RequestTiming(NamedTuple):
+    """How long one request took to return response headers."""
+
+    method: str
+    url: str
+    status: int
+    http_version: str
+    seconds: float
+
+
+class GitHubSession:
+    """One pooled, keep-alive HTTP client plus the settings every request shares."""
+
+    def __init__(self, *, verify: bool = True, http2: Optional[bool] = None):
+        """
+        Args:
+            verify: Verify TLS certificates (False for --skip-tls)
+            http2: Negotiate HTTP/2 (default: when `h2` is installed)
+        """
+        self.verify = verify
+        self.http2 = http2_available() if http2 is None else http2
+        self.token: Optional[str] = None
+        self.timings: List[RequestTiming] = []
+        self._client: Optional["httpx.Client"] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> "httpx.Client":
+        """The underlying `httpx.Client`, built on first use."""
+        with self._lock:
+            if self._client is None:
+                self._client = self._build_client()
+            return self._client
+
+    def _build_client(self) -> "httpx.Client":
+        import httpx
+
+        from . import __version__
+        from .ratelimit import RateLimitedTransport
+
+        transport = httpx.HTTPTransport(
+            verify=get_ssl_context() if self.verify else False,
+            http2=self.http2,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=KEEPALIVE_EXPIRY),
+        )
+        return httpx.Client(
+            transport=RateLimitedTransport(transport),
+            headers={"User-Agent": f"grove-cli/{__version__}"},
+            event_hooks={"request": [self._on_request], "response": [self._on_response]},
+        )
+
+    def _on_request(self, request: "httpx.Request") -> None:
+        if self.token and request.url.host in GITHUB_HOSTS and "Authorization" not in request.headers:
+            request.headers["Authorization"] = f"Bearer {self.token}"
+        request.extensions["grove_started"] = time.perf_counter()
+
+    def _on_response(self, response: "httpx.Response") -> None:
+        request = response.request
+        started = request.extensions.get("grove_started")
+        if started is None:
+            return
+        self.timings.append(RequestTiming(
+            request.method,
+            str(request.url),
+            response.status_code,
+            response.http_version,
+            time.perf_counter() - started,
+        ))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+@lru_cache(maxsize=None)
+def _session(verify: bool) -> GitHubSession:
+    return GitHubSession(verify=verify)
+
+def get_session(*, verify: bool = True, github_token: Optional[str] = None) -> GitHubSession:
+    """Return the process-wide session for the given TLS setting.
+
+    Args:
+        verify: Verify TLS certificates (False for --skip-tls)
+        github_token: Token to send to GitHub hosts on requests that carry no
+            Authorization header of their own; kept for later calls
+
+    Returns:
+        The shared `GitHubSession`
+    """
+    session = _session(verify)
+    if github_token:
+        session.token = github_token.strip() or None
+    return session
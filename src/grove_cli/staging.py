@@ -0,0 +1,202 @@
+"""Staged, all-or-nothing project initialisation.
+
+`grove init` builds the whole project (template, language templates, agent
+configuration, config.json, install manifest) in a staging directory on the
+same filesystem as the target and only then commits it:
+
+- A new project is staged next to the target, in
+  `.<name>.grove-stage-XXXX/<name>`, and committed with a single `rename`.
+- `--here` stages in `.grove-stage-XXXX/tree` inside the project. Commit
+  moves each staged file whose content differs into place, recording every
+  step in `.grove-stage-XXXX/journal.json` first and keeping the replaced
+  file in `.grove-stage-XXXX/backup/`. A failed commit is undone from the
+  journal; so is one that was interrupted, by the next `grove init` in that
+  directory.
+
+Until the commit nothing in the target changes, so an interrupted or failed
+init leaves at most a staging directory behind, which the next init removes.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from .walk import walk
+
+STAGE_SUFFIX = ".grove-stage-"
+JOURNAL_NAME = "journal.json"
+
+# Existing files the staged tree starts from when merging (--here), because
+# init merges into them rather than replacing them
+SEEDED_FILES = [".vscode/settings.json"]
+
+
+class CommitResult(NamedTuple):
+    """What committing a staged project changed."""
+
+    written: int
+    unchanged: int  # staged files identical to the project's (--here only)
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        # os.kill(pid, 0) would terminate the process on Windows
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _owner(container: Path) -> Optional[int]:
+    try:
+        return int((container / "pid").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+def _rollback_journal(container: Path, project_dir: Path) -> None:
+    """Undo a (possibly partial) `--here` commit recorded in `container`'s journal."""
+    try:
+        journal = json.loads((container / JOURNAL_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return
+    tree, backup = container / "tree", container / "backup"
+    for relative, existed in reversed(journal["files"]):
+        target = project_dir / relative
+        if (backup / relative).exists():
+            os.replace(backup / relative, target)
+        elif not existed and not (tree / relative).exists():
+            # Moved into place: the project had no such file before
+            target.unlink(missing_ok=True)
+    for relative in sorted(journal["dirs"], key=lambda d: d.count("/"), reverse=True):
+        try:
+            (project_dir / relative).rmdir()
+        except OSError:
+            pass
+
+def recover_interrupted_init(target: Path, *, here: bool) -> int:
+    """Remove staging directories left by inits that no longer run, undoing partial commits.
+
+    Returns:
+        Number of staging directories removed
+    """
+    if here:
+        candidates = target.glob(f"{STAGE_SUFFIX}*")
+    else:
+        candidates = target.parent.glob(f".{target.name}{STAGE_SUFFIX}*")
+    removed = 0
+    for container in candidates:
+        pid = _owner(container)
+        if not container.is_dir() or (pid is not None and pid != os.getpid() and _pid_alive(pid)):
+            continue
+        if here:
+            _rollback_journal(container, target)
+        shutil.rmtree(container, ignore_errors=True)
+        removed += 1
+    return removed
+
+
+class ProjectStage:
+    """Staging area for one `grove init`.
+
+    Build the project under `path`, then call `commit()`. `discard()` (safe
+    to call at any time, and a no-op after a successful commit) throws the
+    staged tree away and undoes a partially applied commit.
+    """
+
+    def __init__(self, target: Path, *, here: bool = False):
+        self.target = target
+        self.here = here
+        self.committed = False
+        recover_interrupted_init(target, here=here)
+        if here:
+            self.container = Path(tempfile.mkdtemp(prefix=STAGE_SUFFIX, dir=target))
+            self.path = self.container / "tree"
+            self.path.mkdir()
+            self._seed()
+        else:
+            self.container = Path(tempfile.mkdtemp(prefix=f".{target.name}{STAGE_SUFFIX}", dir=target.parent))
+            # Created by the installer, so it gets normal permissions rather than mkdtemp's 0700
+            self.path = self.container / target.name
+        (self.container / "pid").write_text(str(os.getpid()), encoding="utf-8")
+
+    def _seed(self) -> None:
+        for relative in SEEDED_FILES:
+            src = self.target / relative
+            if src.is_file():
+                (self.path / relative).parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(src, self.path / relative)
+
+    def commit(self) -> CommitResult:
+        """Move the staged project into place.
+
+        Raises:
+            FileExistsError: If a new project's target appeared while staging
+            IsADirectoryError: If a staged file would replace a directory (`--here`; nothing is moved)
+            OSError: If moving files fails (a `--here` commit is undone first)
+        """
+        if not self.here:
+            if self.target.exists():
+                raise FileExistsError(f"{self.target} already exists")
+            written = sum(len(listing.entries) - len(listing.dirs) for listing in walk(self.path))
+            os.rename(self.path, self.target)
+            self.committed = True
+            shutil.rmtree(self.container, ignore_errors=True)
+            return CommitResult(written, 0)
+
+        from .materialize import same_file
+
+        files: List[List] = []
+        dirs: List[str] = []
+        unchanged = 0
+        for listing in walk(self.path):
+            for entry in listing.entries:
+                if entry.is_dir(follow_symlinks=False):
+                    continue
+                relative = f"{listing.relative}/{entry.name}" if listing.relative else entry.name
+                staged, target = Path(entry.path), self.target / relative
+                if same_file(staged, target) and staged.stat().st_mode & 0o777 == target.stat().st_mode & 0o777:
+                    unchanged += 1
+                    continue
+                if target.is_dir() and not target.is_symlink():
+                    raise IsADirectoryError(f"Cannot replace directory {target} with a file")
+                files.append([relative, target.exists() or target.is_symlink()])
+                parent = target.parent
+                while parent != self.target and not parent.exists() and parent.relative_to(self.target).as_posix() not in dirs:
+                    dirs.append(parent.relative_to(self.target).as_posix())
+                    parent = parent.parent
+
+        journal = self.container / JOURNAL_NAME
+        with open(journal, "w", encoding="utf-8") as f:
+            json.dump({"files": files, "dirs": dirs}, f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        backup = self.container / "backup"
+        try:
+            for relative, existed in files:
+                target = self.target / relative
+                if existed:
+                    (backup / relative).parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(target, backup / relative)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(self.path / relative, target)
+        except BaseException:
+            self.discard()
+            raise
+        self.committed = True
+        shutil.rmtree(self.container, ignore_errors=True)
+        return CommitResult(len(files), unchanged)
+
+    def discard(self) -> None:
+        """Throw the staged project away, undoing a partially applied `--here` commit."""
+        if self.committed or not self.container.exists():
+            return
+        if self.here:
+            _rollback_journal(self.container, self.target)
+        shutil.rmtree(self.container, ignore_errors=True)
@@ -0,0 +1,91 @@
+"""Template discovery and loading (installed share directory or source checkout)."""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+from .config import get_project_language
+
+def parse_yaml_frontmatter(content: str) -> tuple[dict, str]:
+    """Parse YAML frontmatter from markdown content
+
+    Args:
+        content: Markdown file content
+
+    Returns:
+        Tuple of (frontmatter_dict, markdown_body)
+    """
+    if not content.startswith("---"):
+        return {}, content
+
+    import yaml
+
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        return {}, content
+
+    frontmatter = yaml.safe_load(parts[1])
+    body = parts[2].strip()
+    return frontmatter or {}, body
+
+def get_templates_root() -> Path:
+    """Get templates root directory (dev or installed)
+
+    Returns:
+        Path to templates root directory
+
+    Raises:
+        RuntimeError: If templates directory not found
+    """
+    # Try installed location
+    installed_path = Path(sys.prefix) / "share" / "grove-cli" / "templates"
+    if installed_path.exists():
+        return installed_path
+
+    # Try development location
+    dev_path = Path(__file__).parent.parent.parent / "templates"
+    if dev_path.exists():
+        return dev_path
+
+    raise RuntimeError("Templates directory not found")
+
+def get_share_root() -> Path:
+    """Get the directory holding templates/, scripts/ and memory/ (dev or installed)
+
+    Returns:
+        Parent directory of the templates root
+
+    Raises:
+        RuntimeError: If templates directory not found
+    """
+    return get_templates_root().parent
+
+def load_template_if_enabled(command: str, project_dir: Path) -> Optional[str]:
+    """Load template if enabled flag is true
+
+    Args:
+        command: Command name (constitution, specify, plan, tasks)
+        project_dir: Project root directory
+
+    Returns:
+        Template content (without frontmatter) if enabled, None otherwise
+    """
+    # Get language setting
+    lang = get_project_language(project_dir)
+
+    # Find template file
+    templates_root = get_templates_root()
+    template_file = templates_root / lang / f"{command}-template.md"
+
+    if not template_file.exists():
+        return None
+
+    # Parse frontmatter
+    content = template_file.read_text(encoding="utf-8")
+    frontmatter, body = parse_yaml_frontmatter(content)
+
+    # Check enabled flag
+    if frontmatter.get("enabled", False):
+        return body
+
+    return None
@@ -0,0 +1,244 @@
+"""Manifest-based template upgrades for existing projects.
+
+`grove init` records what the template installed in
+`.grove/memory/install-manifest.json`:
+
+    {"version": 1, "release": "v0.2.0", "agents": ["claude"], "script_type": "sh",
+     "language": "en", "files": {".grove/scripts/bash/common.sh": {"sha256": "...", "mode": 493}}}
+
+`grove upgrade` builds the same manifest for the latest release straight
+from its template archives and compares the two. Files whose hash did not
+change upstream are never read or written, so the cost grows with the number
+of changed files rather than with the size of the project. A changed file is
+written only if the project copy still matches the recorded hash; otherwise
+it is reported as a conflict and left alone.
+"""
+
+import hashlib
+import json
+import os
+import zipfile
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .install import TemplateSelection, _archive_root, _member_mode, _member_target, select_template_path
+from .materialize import FileJob, materialize
+
+MANIFEST_NAME = "install-manifest.json"
+
+
+class TemplateFile(NamedTuple):
+    """One file a template installs."""
+
+    sha256: str
+    mode: Optional[int]  # permission bits from the archive, if recorded
+
+
+class InstallManifest(NamedTuple):
+    """What the template installed into a project, keyed by project-relative POSIX path."""
+
+    release: str
+    agents: List[str]
+    script_type: str
+    language: str
+    files: Dict[str, TemplateFile]
+
+
+def manifest_path(project_dir: Path) -> Path:
+    return project_dir / ".grove" / "memory" / MANIFEST_NAME
+
+def load_install_manifest(project_dir: Path) -> Optional[InstallManifest]:
+    """Return the recorded install manifest, or None if the project has none."""
+    try:
+        data = json.loads(manifest_path(project_dir).read_text(encoding="utf-8"))
+        files = {path: TemplateFile(entry["sha256"], entry.get("mode")) for path, entry in data["files"].items()}
+        return InstallManifest(data["release"], list(data["agents"]), data["script_type"], data["language"], files)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+def save_install_manifest(project_dir: Path, manifest: InstallManifest) -> None:
+    from .cache import write_atomic
+
+    data = {"version": 1, **manifest._asdict()}
+    data["files"] = {name: entry._asdict() for name, entry in sorted(manifest.files.items())}
+    write_atomic(manifest_path(project_dir), json.dumps(data, indent=2) + "\n")
+
+def _file_sha256(path: Path) -> Optional[str]:
+    from .cache import sha256_file
+
+    try:
+        return sha256_file(path)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+
+# =============================================================================
+# Release manifests
+# =============================================================================
+
+def init_selections(agents: List[str], script_type: str, language: str) -> List[TemplateSelection]:
+    """Return the selection `grove init` extracts each agent's archive with, in `agents` order.
+
+    The first agent's archive is the base template (it also provides
+    `.grove/`); the others only add their agent's own files.
+    """
+    return [
+        TemplateSelection(language, script_type, list(agents), base=True) if i == 0 else TemplateSelection(language, script_type, [agent], base=False)
+        for i, agent in enumerate(agents)
+    ]
+
+def archive_members(zip_ref: zipfile.ZipFile, selection: TemplateSelection) -> Dict[str, zipfile.ZipInfo]:
+    """Map each project path the archive installs under `selection` to its member."""
+    root = Path("/")
+    strip = _archive_root(zip_ref)
+    members: Dict[str, zipfile.ZipInfo] = {}
+    localized: Dict[str, zipfile.ZipInfo] = {}
+    for info in zip_ref.infolist():
+        if info.is_dir():
+            continue
+        target = _member_target(root, info.filename, strip)
+        if target is None:
+            continue
+        relative = target.relative_to(root).as_posix()
+        path = select_template_path(relative, selection)
+        if path is not None:
+            (members if path == relative else localized)[path] = info
+    # The selected language's copy replaces a same-named generic template
+    members.update(localized)
+    return members
+
+def release_manifest(archives: Iterable[Tuple[Path, TemplateSelection]]) -> Tuple[Dict[str, TemplateFile], Dict[str, Tuple[Path, zipfile.ZipInfo]]]:
+    """Hash every file the given template archives install, each under its selection.
+
+    Later archives win where several install the same path (as when init
+    extracts one agent's template after another).
+
+    Returns:
+        Tuple of (path -> TemplateFile, path -> (archive, member))
+    """
+    files: Dict[str, TemplateFile] = {}
+    sources: Dict[str, Tuple[Path, zipfile.ZipInfo]] = {}
+    for archive, selection in archives:
+        with zipfile.ZipFile(archive) as zip_ref:
+            for path, info in archive_members(zip_ref, selection).items():
+                digest = hashlib.sha256()
+                with zip_ref.open(info) as f:
+                    for block in iter(lambda: f.read(1024 * 1024), b""):
+                        digest.update(block)
+                files[path] = TemplateFile(digest.hexdigest(), _member_mode(info))
+                sources[path] = (archive, info)
+    return files, sources
+
+def record_install(project_dir: Path, archives: Iterable[Tuple[Path, TemplateSelection]], *, release: str, agents: List[str], script_type: str, language: str) -> InstallManifest:
+    """Record what `grove init` wrote from `archives`, each extracted with its selection.
+
+    The manifest holds the archive's hashes, not those of the files on disk:
+    it is the base `grove upgrade` compares both sides with, so a file init
+    replaced afterwards (for example with the installed language templates)
+    counts as a local modification, not as the release's version.
+
+    Args:
+        archives: (archive, selection) for each archive init extracted, in
+            order; agents that were already installed are left out
+    """
+    files, _ = release_manifest(archives)
+    manifest = InstallManifest(release, list(agents), script_type, language, files)
+    save_install_manifest(project_dir, manifest)
+    return manifest
+
+# =============================================================================
+# Planning and applying an upgrade
+# =============================================================================
+
+
+class UpgradePlan(NamedTuple):
+    """How each template file is affected by an upgrade."""
+
+    add: List[str]        # new upstream, absent locally
+    update: List[str]     # changed upstream, unmodified locally
+    remove: List[str]     # dropped upstream, unmodified locally
+    current: List[str]    # changed upstream, local copy already matches
+    conflicts: List[str]  # changed upstream and modified locally
+    kept: List[str]       # dropped upstream but modified locally (left in place)
+    unchanged: int        # same hash upstream; not touched
+
+
+def plan_upgrade(project_dir: Path, recorded: Dict[str, TemplateFile], upstream: Dict[str, TemplateFile]) -> UpgradePlan:
+    """Three-way compare recorded install, new release and project files.
+
+    Only files whose upstream hash changed (or that appear or disappear
+    upstream) are hashed on disk.
+    """
+    plan = UpgradePlan([], [], [], [], [], [], 0)
+    unchanged = 0
+    for path, new in sorted(upstream.items()):
+        old = recorded.get(path)
+        if old is not None and old.sha256 == new.sha256:
+            unchanged += 1
+            continue
+        local = _file_sha256(project_dir / path)
+        if local == new.sha256:
+            plan.current.append(path)
+        elif local is None:
+            plan.add.append(path)
+        elif old is not None and local == old.sha256:
+            plan.update.append(path)
+        else:
+            plan.conflicts.append(path)
+    for path, old in sorted(recorded.items()):
+        if path in upstream:
+            continue
+        local = _file_sha256(project_dir / path)
+        if local == old.sha256:
+            plan.remove.append(path)
+        elif local is not None:
+            plan.kept.append(path)
+    return plan._replace(unchanged=unchanged)
+
+def apply_upgrade(project_dir: Path, plan: UpgradePlan, sources: Dict[str, Tuple[Path, zipfile.ZipInfo]], *, force: bool = False) -> List[str]:
+    """Write added and updated files (and conflicts with `force`) and delete removed ones.
+
+    Returns:
+        Paths written
+    """
+    to_write = plan.add + plan.update + (plan.conflicts if force else [])
+    archives = {archive: zipfile.ZipFile(archive) for archive in {sources[path][0] for path in to_write}}
+
+    def write(path: str, target: Path) -> bool:
+        archive, info = sources[path]
+        tmp = target.with_name(f".{target.name}.grove-upgrade")
+        with archives[archive].open(info) as src, open(tmp, "wb") as dst:
+            for block in iter(lambda: src.read(1024 * 1024), b""):
+                dst.write(block)
+        mode = _member_mode(info)
+        if mode:
+            os.chmod(tmp, mode)
+        elif target.exists():
+            os.chmod(tmp, target.stat().st_mode & 0o777)
+        os.replace(tmp, target)
+        return True
+
+    try:
+        materialize([FileJob(project_dir / path, partial(write, path)) for path in to_write])
+    finally:
+        for zip_ref in archives.values():
+            zip_ref.close()
+
+    for path in plan.remove:
+        (project_dir / path).unlink(missing_ok=True)
+    return to_write
+
+def upgraded_manifest(recorded: InstallManifest, upstream: Dict[str, TemplateFile], plan: UpgradePlan, *, release: str, force: bool = False) -> InstallManifest:
+    """Return the manifest to record after applying `plan`.
+
+    Unresolved conflicts keep their old entry, so the next upgrade still
+    sees the local modification.
+    """
+    files = dict(upstream)
+    if not force:
+        for path in plan.conflicts:
+            if path in recorded.files:
+                files[path] = recorded.files[path]
+            else:
+                del files[path]
+    return recorded._replace(release=release, files=files)
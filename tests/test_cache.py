@@ -0,0 +1,130 @@
+"""AssetCache: content-addressed index, LRU eviction and concurrent updates."""
+
+import hashlib
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from grove_cli.cache import AssetCache, ReleaseCache
+
+
+def make_file(path, data: bytes):
+    path.write_bytes(data)
+    return path
+
+@pytest.fixture
+def cache(tmp_path):
+    return AssetCache(tmp_path / "assets", max_bytes=10_000)
+
+
+def test_store_and_lookup(cache, tmp_path):
+    data = b"template" * 10
+    blob = cache.store("v1", "a.zip", make_file(tmp_path / "a.zip", data))
+
+    assert blob.name == hashlib.sha256(data).hexdigest()
+    assert not (tmp_path / "a.zip").exists()
+    assert cache.lookup("v1", "a.zip") == blob
+    assert cache.lookup("v1", "a.zip", sha256=blob.name) == blob
+    assert cache.lookup("v1", "a.zip", sha256="0" * 64) is None
+    assert cache.lookup("v2", "a.zip") is None
+
+def test_lookup_misses_truncated_blob(cache, tmp_path):
+    blob = cache.store("v1", "a.zip", make_file(tmp_path / "a.zip", b"0123456789"))
+    blob.write_bytes(b"01234")
+
+    assert cache.lookup("v1", "a.zip") is None
+
+def test_identical_assets_share_one_blob(cache, tmp_path):
+    first = cache.store("v1", "a.zip", make_file(tmp_path / "a.zip", b"same"))
+    second = cache.store("v2", "a.zip", make_file(tmp_path / "b.zip", b"same"))
+
+    assert first == second
+    assert {e.key for e in cache.entries()} == {"v1/a.zip", "v2/a.zip"}
+    assert cache.total_size() == 4
+
+def test_store_evicts_least_recently_used(cache, tmp_path):
+    for i in range(3):
+        cache.store("v1", f"{i}.zip", make_file(tmp_path / f"{i}.zip", bytes([i]) * 4000))
+        time.sleep(0.01)
+    # 12 000 bytes > 10 000: the oldest entry goes, with its blob
+    assert {e.name for e in cache.entries()} == {"1.zip", "2.zip"}
+    assert len(os.listdir(cache.blobs_dir)) == 2
+
+def test_lookup_refreshes_recency(cache, tmp_path):
+    cache.store("v1", "old.zip", make_file(tmp_path / "old.zip", b"o" * 4000))
+    time.sleep(0.01)
+    cache.store("v1", "new.zip", make_file(tmp_path / "new.zip", b"n" * 4000))
+    time.sleep(0.01)
+    assert cache.lookup("v1", "old.zip") is not None
+
+    cache.store("v1", "third.zip", make_file(tmp_path / "third.zip", b"t" * 4000))
+    assert {e.name for e in cache.entries()} == {"old.zip", "third.zip"}
+
+def test_prune_removes_orphans_and_everything(cache, tmp_path):
+    cache.store("v1", "a.zip", make_file(tmp_path / "a.zip", b"a"))
+    make_file(cache.blobs_dir / ("f" * 64), b"orphan")
+
+    assert cache.prune() == []
+    assert os.listdir(cache.blobs_dir) == [hashlib.sha256(b"a").hexdigest()]
+    assert [e.name for e in cache.prune(everything=True)] == ["a.zip"]
+    assert cache.entries() == []
+    assert os.listdir(cache.blobs_dir) == []
+
+def test_concurrent_stores_keep_every_entry(tmp_path):
+    root = tmp_path / "assets"
+
+    def store(i):
+        # One instance per thread, as parallel downloads create them
+        AssetCache(root, max_bytes=10**9).store("v1", f"{i}.zip", make_file(tmp_path / f"{i}.src", os.urandom(64)))
+
+    for run in range(10):
+        threads = [threading.Thread(target=store, args=(run * 8 + i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert len(AssetCache(root).entries()) == 80
+
+def _store_many(root, worker):
+    from pathlib import Path
+
+    for i in range(10):
+        source = Path(root) / f"{worker}-{i}.src"
+        source.write_bytes(os.urandom(64))
+        AssetCache(Path(root) / "assets", max_bytes=10**9).store("v1", f"{worker}-{i}.zip", source)
+
+@pytest.mark.skipif(os.name == "nt", reason="fork-based multiprocessing")
+def test_concurrent_processes_keep_every_entry(tmp_path):
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_store_many, args=(str(tmp_path), w)) for w in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert [w.exitcode for w in workers] == [0] * 4
+    assert len(AssetCache(tmp_path / "assets").entries()) == 40
+
+
+def _put_releases(path, worker):
+    from pathlib import Path
+
+    cache = ReleaseCache(Path(path))
+    for i in range(20):
+        cache.put(f"https://api.github.com/repos/r{worker}-{i}/releases/latest", {"tag_name": "v1"}, None)
+
+@pytest.mark.skipif(os.name == "nt", reason="fork-based multiprocessing")
+def test_concurrent_processes_keep_every_release(tmp_path):
+    path = tmp_path / "releases.json"
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_put_releases, args=(str(path), w)) for w in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert [w.exitcode for w in workers] == [0] * 4
+    cache = ReleaseCache(path)
+    assert all(cache.get(f"https://api.github.com/repos/r{w}-{i}/releases/latest") for w in range(4) for i in range(20))
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
@@ -0,0 +1,114 @@
+"""Static shell completion: generated scripts and the per-project completion index."""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+from typer.testing import CliRunner
+
+from grove_cli import app
+from grove_cli.completion import COMPLETION_INDEX, SUPPORTED_SHELLS, collect_commands, render_completion, write_completion_index
+from grove_cli.config import SUPPORTED_AI_AGENTS
+from grove_cli.registry import BUILTIN_COMMANDS
+
+
+@pytest.fixture(scope="module")
+def bash_script():
+    return render_completion("bash", "0.0.0")
+
+@pytest.fixture
+def project(tmp_path):
+    for name in ["src", "lib", "node_modules", ".git", ".grove"]:
+        (tmp_path / name).mkdir()
+    (tmp_path / "README.md").write_text("")
+    return tmp_path
+
+def complete(script, cwd, *words):
+    """Run the bash completion function for `grove <words>` and return its candidates."""
+    probe = f'{script}\nCOMP_WORDS=(grove {" ".join(words)}); COMP_CWORD={len(words)}; _grove; printf "%s\\n" "${{COMPREPLY[@]}}"'
+    result = subprocess.run(["bash", "-c", probe], cwd=cwd, capture_output=True, text=True, check=True)
+    return sorted(filter(None, result.stdout.splitlines()))
+
+
+def test_every_builtin_command_is_described():
+    commands = {command.name: command for command in collect_commands()}
+
+    assert set(BUILTIN_COMMANDS) <= set(commands)
+    init_options = {opt: option for option in commands["init"].options for opt in option.opts}
+    assert init_options["--ai"].choices == SUPPORTED_AI_AGENTS
+    assert init_options["--ai"].multiple
+    assert not init_options["--here"].takes_value
+
+@pytest.mark.parametrize("shell", SUPPORTED_SHELLS)
+def test_scripts_never_start_grove(shell):
+    script = render_completion(shell, "1.2.3")
+
+    assert "generated by grove 1.2.3" in script
+    assert "python" not in script
+    assert "grove_cli" not in script
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="needs bash")
+def test_bash_completes_commands_and_values(bash_script, project):
+    assert "init" in complete(bash_script, project, "")
+    assert complete(bash_script, project, "init", "--ai", "") == sorted(SUPPORTED_AI_AGENTS)
+    assert complete(bash_script, project, "init", "--h") == ["--help", "--here"]
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="needs bash")
+def test_bash_reads_src_from_the_completion_index(bash_script, project):
+    write_completion_index(project)
+
+    assert complete(bash_script, project, "sync", "--src", "") == ["lib", "src"]
+    # Found from subdirectories too
+    assert complete(bash_script, project / "src", "sync", "--src", "l") == ["lib"]
+
+@pytest.mark.parametrize("shell", ["zsh", "fish"])
+def test_script_syntax(shell, tmp_path):
+    if shutil.which(shell) is None:
+        pytest.skip(f"needs {shell}")
+    script = tmp_path / "grove-completion"
+    script.write_text(render_completion(shell, "0.0.0"))
+    subprocess.run([shell, "-n", str(script)], check=True)
+
+
+def test_completion_index_lists_source_candidates(project):
+    path = write_completion_index(project)
+
+    assert path == project / COMPLETION_INDEX
+    assert path.read_text() == "src\tlib\nsrc\tsrc\n"
+
+def test_completion_index_is_rewritten_only_when_it_changes(project):
+    path = write_completion_index(project)
+    os.utime(path, ns=(0, 0))
+
+    write_completion_index(project)
+    assert path.stat().st_mtime_ns == 0
+
+    (project / "app").mkdir()
+    write_completion_index(project)
+    assert "src\tapp\n" in path.read_text()
+
+def test_no_completion_index_outside_grove_projects(tmp_path):
+    (tmp_path / "src").mkdir()
+
+    assert write_completion_index(tmp_path) is None
+    assert not (tmp_path / ".grove").exists()
+
+
+def test_completion_command_installs_the_script(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(app, ["completion", "bash", "--install"])
+
+    assert result.exit_code == 0, result.output
+    assert "complete -o default -F _grove grove" in (tmp_path / "data" / "bash-completion" / "completions" / "grove").read_text()
+
+def test_completion_command_rejects_unknown_shells(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("SHELL", "/bin/tcsh")
+
+    assert CliRunner().invoke(app, ["completion"]).exit_code == 1
+    result = CliRunner().invoke(app, ["completion", "tcsh"])
+    assert result.exit_code == 1
+    assert "Unsupported or undetected shell 'tcsh'" in result.output
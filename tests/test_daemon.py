@@ -0,0 +1,128 @@
+"""`grove serve` operations and the `grove call` client."""
+
+import json
+import os
+import socket
+import threading
+
+import pytest
+from typer.testing import CliRunner
+
+from grove_cli import app
+from grove_cli.commands.serve import _parse_value
+from grove_cli.daemon import dispatch, request, serve
+from grove_cli.project import GroveState
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "main.py").write_text("print('hi')\n")
+    (tmp_path / "src" / "pkg" / "util.py").write_text("X = 1\n")
+    # Never reach a daemon the developer may have running
+    monkeypatch.setenv("GROVE_SOCKET", str(tmp_path / "no-daemon.sock"))
+    return tmp_path
+
+def call(*args: str):
+    return CliRunner().invoke(app, ["call", *args])
+
+
+@pytest.mark.parametrize("jobs", ["1", "4", 4])
+def test_sync_accepts_jobs(project, jobs):
+    response = dispatch(GroveState(), "sync", {"project_dir": str(project), "src": "src", "jobs": jobs})
+
+    assert response["ok"], response
+    assert response["result"]["count"] == 6
+    assert (project / ".grove" / "docs" / "src" / "pkg" / "util.md").exists()
+
+@pytest.mark.parametrize("jobs", ["four", "0", True])
+def test_sync_rejects_bad_jobs(project, jobs):
+    response = dispatch(GroveState(), "sync", {"project_dir": str(project), "src": "src", "jobs": jobs})
+
+    assert not response["ok"]
+    assert response["error"].startswith("ValueError: jobs must be a positive integer")
+    assert not (project / ".grove" / "docs").exists()
+
+def test_grove_call_sync_with_jobs(project):
+    result = call("sync", "src=src", "jobs=4", f"project_dir={project}")
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["count"] == 6
+
+
+def test_unknown_operation():
+    response = dispatch(GroveState(), "nonesuch")
+
+    assert not response["ok"]
+    assert "Available: ping" in response["error"]
+
+def test_config_and_paths(project, monkeypatch):
+    monkeypatch.delenv("SPECIFY_FEATURE", raising=False)
+    (project / ".grove" / "memory").mkdir(parents=True)
+    (project / ".grove" / "memory" / "config.json").write_text('{"language": "ja"}')
+    (project / "specs" / "001-first").mkdir(parents=True)
+    (project / "specs" / "002-second").mkdir()
+    state = GroveState()
+
+    assert dispatch(state, "config", {"project_dir": str(project)})["result"] == {"language": "ja"}
+    paths = dispatch(state, "paths", {"project_dir": str(project)})["result"]
+    assert paths["CURRENT_BRANCH"] == "002-second"
+    assert paths["FEATURE_SPEC"] == str(project / "specs" / "002-second" / "spec.md")
+
+def test_docs_index_is_refreshed_by_sync(project):
+    state = GroveState()
+    params = {"project_dir": str(project)}
+    assert dispatch(state, "docs", params)["result"] == []
+
+    dispatch(state, "sync", {**params, "src": "src"})
+
+    assert "src/pkg/util.md" in dispatch(state, "docs", params)["result"]
+    assert ".sync-index" not in dispatch(state, "docs", params)["result"]
+
+def test_missing_source_directory_is_an_error(project):
+    response = dispatch(GroveState(), "sync", {"project_dir": str(project), "src": "lib"})
+
+    assert response == {"ok": False, "error": "FileNotFoundError: Source directory 'lib' not found"}
+
+
+@pytest.mark.parametrize("value, parsed", [("true", True), ("FALSE", False), ("4", "4"), ("", "")])
+def test_parse_value(value, parsed):
+    assert _parse_value(value) == parsed
+
+def test_grove_call_rejects_params_without_value(project):
+    result = call("sync", "src")
+
+    assert result.exit_code == 2
+    assert "Expected key=value" in result.output
+
+def test_grove_call_env_format(project):
+    result = call("paths", "--format", "env", f"project_dir={project}")
+
+    assert result.exit_code == 0, result.output
+    assert f"REPO_ROOT='{project}'" in result.output.splitlines()
+
+def test_grove_call_without_daemon_or_fallback(project):
+    result = call("ping", "--no-fallback")
+
+    assert result.exit_code == 1
+    assert "No grove daemon is listening" in result.output
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+def test_requests_are_served_by_the_daemon(project):
+    socket_path = project / "grove.sock"
+    ready = threading.Event()
+    server = threading.Thread(target=serve, args=(socket_path,), kwargs={"on_ready": lambda path: ready.set()}, daemon=True)
+    server.start()
+    assert ready.wait(10)
+
+    ping = request("ping", socket_path=socket_path, fallback=False)
+    sync = request("sync", {"project_dir": str(project), "src": "src"}, socket_path=socket_path, fallback=False)
+    assert request("shutdown", socket_path=socket_path, fallback=False)["ok"]
+    server.join(10)
+
+    assert ping["served_by"] == "daemon"
+    assert ping["result"]["pid"] == os.getpid()
+    assert sync["ok"] and sync["result"]["count"] == 6
+    assert not server.is_alive()
+    assert not socket_path.exists()
@@ -0,0 +1,135 @@
+"""Incremental `grove sync`: the sync index and what each run rewrites."""
+
+import os
+
+import pytest
+
+from grove_cli import docs
+from grove_cli.docs import load_sync_index, sync_directory_docs
+
+
+@pytest.fixture(autouse=True)
+def no_racy_window(monkeypatch):
+    # Files written by a test are seconds old at most; treat them as settled
+    monkeypatch.setattr(docs, "_RACY_NS", -10**12)
+
+@pytest.fixture
+def tree(tmp_path):
+    src = tmp_path / "src"
+    (src / "pkg").mkdir(parents=True)
+    (src / "main.py").write_text("print('hi')\n")
+    (src / "pkg" / "util.py").write_text("X = 1\n")
+    (src / "node_modules").mkdir()
+    (src / "node_modules" / "dep.js").write_text("")
+    return src, tmp_path / ".grove" / "docs" / "src"
+
+def sync(src, docs_dir, **kwargs):
+    warnings = []
+    count = sync_directory_docs(src, docs_dir, on_warning=warnings.append, **kwargs)
+    return count, warnings
+
+def bump(path, text):
+    """Rewrite `path` so its mtime visibly changes."""
+    path.write_text(text)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_first_sync_generates_docs_and_index(tree):
+    src, docs_dir = tree
+    count, warnings = sync(src, docs_dir)
+
+    assert warnings == []
+    assert count == 6  # index.md + README.md in src and pkg, main.md, util.md
+    assert (docs_dir / "main.md").exists()
+    assert (docs_dir / "pkg" / "util.md").exists()
+    assert not (docs_dir / "node_modules").exists()
+    index = load_sync_index(docs_dir.parent / ".sync-index")
+    assert set(index["trees"]["src"]["dirs"]) == {"", "pkg"}
+
+def test_second_sync_writes_nothing(tree):
+    src, docs_dir = tree
+    sync(src, docs_dir, auto=True)
+    index_before = (docs_dir.parent / ".sync-index").read_bytes()
+
+    assert sync(src, docs_dir, auto=True) == (0, [])
+    assert sync(src, docs_dir) == (0, [])
+    assert (docs_dir.parent / ".sync-index").read_bytes() == index_before
+
+def test_without_auto_existing_docs_are_kept(tree):
+    src, docs_dir = tree
+    sync(src, docs_dir)
+    (docs_dir / "main.md").write_text("hand written\n")
+    (src / "new.py").write_text("")
+
+    assert sync(src, docs_dir)[0] == 1
+    assert (docs_dir / "new.md").exists()
+    assert (docs_dir / "main.md").read_text() == "hand written\n"
+
+def test_auto_regenerates_docs_of_changed_files_only(tree):
+    src, docs_dir = tree
+    sync(src, docs_dir, auto=True)
+    util_doc = docs_dir / "pkg" / "util.md"
+    bump(src / "pkg" / "util.py", "X = 2\n")
+    util_doc.unlink()
+
+    count, _ = sync(src, docs_dir, auto=True)
+    assert count == 1
+    assert util_doc.exists()
+
+@pytest.mark.parametrize("doc", ["index.md", "README.md", "main.md", "pkg/util.md"])
+def test_auto_overwrites_edited_docs_in_unchanged_directories(tree, doc):
+    src, docs_dir = tree
+    sync(src, docs_dir, auto=True)
+    generated = (docs_dir / doc).read_text()
+    bump(docs_dir / doc, "edited by hand\n")
+
+    assert sync(src, docs_dir)[0] == 0  # without --auto, edits are kept
+    assert (docs_dir / doc).read_text() == "edited by hand\n"
+    assert sync(src, docs_dir, auto=True)[0] == 1
+    assert (docs_dir / doc).read_text() == generated
+    assert sync(src, docs_dir, auto=True)[0] == 0
+
+def test_new_and_removed_directories(tree):
+    src, docs_dir = tree
+    sync(src, docs_dir, auto=True)
+    (src / "extra").mkdir()
+    (src / "extra" / "a.py").write_text("")
+
+    # extra/index.md, extra/README.md, extra/a.md and the root index.md listing extra
+    assert sync(src, docs_dir, auto=True)[0] == 4
+    assert (docs_dir / "extra" / "a.md").exists()
+
+    (src / "extra" / "a.py").unlink()
+    (src / "extra").rmdir()
+    sync(src, docs_dir, auto=True)
+    index = load_sync_index(docs_dir.parent / ".sync-index")
+    assert "extra" not in index["trees"]["src"]["dirs"]
+
+def test_recent_changes_are_rechecked(tree, monkeypatch):
+    monkeypatch.setattr(docs, "_RACY_NS", 60 * 10**9)
+    src, docs_dir = tree
+    sync(src, docs_dir, auto=True)
+    index = load_sync_index(docs_dir.parent / ".sync-index")
+    # Changed within the racy window: no mtime is trusted yet
+    assert index["trees"]["src"]["dirs"][""]["mtime"] is None
+
+    # Same size, same mtime tick: only found because the directory is listed again
+    (src / "main.py").write_text("print('ho')\n")
+    (docs_dir / "main.md").write_text("x")
+    assert sync(src, docs_dir, auto=True)[0] == 1
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_output_does_not_depend_on_jobs(tmp_path, jobs):
+    src = tmp_path / "src"
+    for d in range(5):
+        for f in range(5):
+            path = src / f"d{d}" / f"sub{f}" / f"f{f}.py"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(str(d * f))
+    docs_dir = tmp_path / f"docs-{jobs}" / "src"
+    count, _ = sync(src, docs_dir, auto=True, jobs=jobs)
+
+    assert count == 2 * (1 + 5 + 25) + 25
+    listing = sorted(str(p.relative_to(docs_dir)) for p in docs_dir.rglob("*"))
+    assert len(listing) == count + 30  # plus the 30 directories
@@ -0,0 +1,150 @@
+"""Resumable template downloads and the resume-file lock."""
+
+import hashlib
+import os
+import threading
+import time
+
+import httpx
+import pytest
+
+from grove_cli import github
+from grove_cli.cache import AssetCache
+
+DATA = bytes(range(256)) * 1024  # 256 KB
+
+
+def serve(drop_after=None, honour_range=True):
+    """Mock transport serving DATA; the first response drops the connection after `drop_after` bytes."""
+    requests = []
+
+    def handler(request):
+        requests.append(request.headers.get("Range"))
+        start = 0
+        headers = {}
+        status = 200
+        if honour_range and request.headers.get("Range"):
+            start = int(request.headers["Range"].split("=")[1].rstrip("-"))
+            status = 206
+            headers["Content-Range"] = f"bytes {start}-{len(DATA) - 1}/{len(DATA)}"
+        body = DATA[start:]
+
+        def stream():
+            if drop_after is not None and len(requests) == 1:
+                yield body[:drop_after]
+                raise httpx.ReadError("connection reset")
+            yield body
+
+        return httpx.Response(status, headers=headers, content=stream())
+
+    return httpx.Client(transport=httpx.MockTransport(handler)), requests
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(github, "DOWNLOAD_RETRY_DELAYS", (0, 0, 0, 0))
+
+
+def test_resumes_after_dropped_connection(tmp_path):
+    client, requests = serve(drop_after=100_000)
+    path = tmp_path / "a.zip"
+
+    sha256 = github._download_resumable(client, "https://example.test/a.zip", path, total_size=len(DATA), show_progress=False)
+
+    assert sha256 == hashlib.sha256(DATA).hexdigest()
+    assert path.read_bytes() == DATA
+    assert requests == [None, "bytes=100000-"]
+
+def test_resumes_from_existing_partial_file(tmp_path):
+    client, requests = serve()
+    path = tmp_path / "a.zip"
+    path.write_bytes(DATA[:50_000])
+
+    sha256 = github._download_resumable(client, "https://example.test/a.zip", path, total_size=len(DATA), show_progress=False)
+
+    assert sha256 == hashlib.sha256(DATA).hexdigest()
+    assert requests == ["bytes=50000-"]
+
+def test_restarts_when_server_ignores_range(tmp_path):
+    client, _ = serve(honour_range=False)
+    path = tmp_path / "a.zip"
+    path.write_bytes(b"stale bytes")
+
+    github._download_resumable(client, "https://example.test/a.zip", path, total_size=len(DATA), show_progress=False)
+
+    assert path.read_bytes() == DATA
+
+
+def test_partial_download_is_exclusive(tmp_path):
+    cache = AssetCache(tmp_path / "assets")
+    with cache.partial_download("v1/a.zip") as partial:
+        assert partial == cache.partial_path("v1/a.zip")
+        with cache.partial_download("v1/a.zip", wait=False) as other:
+            assert other is None
+        with cache.partial_download("v1/b.zip", wait=False) as other:
+            assert other is not None
+
+def test_partial_download_waits_for_holder(tmp_path):
+    cache = AssetCache(tmp_path / "assets")
+    order = []
+    holding = threading.Event()
+
+    def download():
+        with cache.partial_download("v1/a.zip") as partial:
+            holding.set()
+            time.sleep(0.2)
+            partial.write_bytes(DATA)
+            cache.store("v1", "a.zip", partial)
+            order.append("stored")
+
+    thread = threading.Thread(target=download)
+    thread.start()
+    holding.wait()
+    with cache.partial_download("v1/a.zip") as partial:
+        order.append("waited")
+        assert cache.lookup("v1", "a.zip") is not None
+        assert not partial.exists()
+    thread.join()
+    assert order == ["stored", "waited"]
+
+def test_prune_keeps_recent_and_locked_partials(tmp_path):
+    cache = AssetCache(tmp_path / "assets")
+    with cache.partial_download("v1/a.zip") as stale:
+        stale.write_bytes(b"half")
+        os.utime(stale, (0, 0))  # stale, but in use
+        cache.prune()
+        assert stale.exists()
+    with cache.partial_download("v1/b.zip") as recent:
+        recent.write_bytes(b"half")
+    cache.prune()
+    assert not stale.exists()
+    assert recent.exists()
+
+def test_concurrent_downloads_of_one_asset_share_it(tmp_path, monkeypatch):
+    monkeypatch.setenv("GROVE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(github, "_manifest_sha256", lambda *args, **kwargs: None)
+    requests = []
+
+    def handler(request):
+        requests.append(request.url)
+        time.sleep(0.2)
+        return httpx.Response(200, content=DATA)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    asset = {"name": "grove-template-claude-sh-v1.zip", "browser_download_url": "https://example.test/a.zip", "size": len(DATA)}
+    release = ({"tag_name": "v1", "assets": [asset]}, "https://example.test")
+    results = []
+
+    def download():
+        path, _ = github.download_template_from_github(
+            "claude", tmp_path, verbose=False, show_progress=False, client=client, release=release
+        )
+        results.append(path.read_bytes())
+
+    threads = [threading.Thread(target=download) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [DATA] * 4
+    assert len(requests) == 1
@@ -0,0 +1,194 @@
+"""Template archive extraction: members are written straight to their destination."""
+
+import json
+import os
+import zipfile
+from concurrent.futures import Future
+
+import pytest
+import typer
+
+from grove_cli.install import (
+    ExtractResult,
+    _archive_root,
+    download_and_extract_template,
+    ensure_executable_scripts,
+    extract_template_archive,
+    verify_scripts_enabled,
+)
+from grove_cli.materialize import copy_if_changed
+
+
+def make_zip(path, members, *, root="grove-template/"):
+    """Write a template archive; `members` maps names to bytes (or (bytes, mode))."""
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, content in members.items():
+            data, mode = content if isinstance(content, tuple) else (content, 0o644)
+            info = zipfile.ZipInfo(root + name)
+            info.external_attr = (0o100000 | mode) << 16
+            zf.writestr(info, data)
+    return path
+
+def extract(archive, dest, **kwargs):
+    with zipfile.ZipFile(archive) as zf:
+        return extract_template_archive(zf, dest, strip=_archive_root(zf), **kwargs)
+
+def files(root):
+    return sorted(p.relative_to(root).as_posix() for p in root.rglob("*") if p.is_file())
+
+MEMBERS = {
+    ".grove/memory/constitution.md": b"# Constitution\n",
+    ".grove/scripts/bash/common.sh": (b"#!/bin/sh\n", 0o755),
+    ".claude/commands/grove.plan.md": b"plan\n",
+}
+
+
+def test_members_are_written_under_the_destination(tmp_path):
+    archive = make_zip(tmp_path / "t.zip", MEMBERS)
+
+    result = extract(archive, tmp_path / "project")
+
+    assert result == ExtractResult(written=3, merged=0, skipped=0, filtered=0)
+    assert files(tmp_path / "project") == sorted(MEMBERS)
+    assert (tmp_path / "project" / ".claude/commands/grove.plan.md").read_bytes() == b"plan\n"
+    # Nothing is staged next to the project
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["project", "t.zip"]
+
+def test_archive_without_a_single_root_is_not_stripped(tmp_path):
+    archive = make_zip(tmp_path / "t.zip", {"README.md": b"r", ".grove/a.md": b"a"}, root="")
+
+    extract(archive, tmp_path / "project")
+
+    assert files(tmp_path / "project") == [".grove/a.md", "README.md"]
+
+def test_unsafe_member_names_stay_inside_the_destination(tmp_path):
+    archive = make_zip(tmp_path / "t.zip", {"../escape.md": b"x", "/abs.md": b"y", "ok.md": b"z"}, root="")
+
+    extract(archive, tmp_path / "project")
+
+    assert not (tmp_path / "escape.md").exists()
+    assert files(tmp_path / "project") == ["abs.md", "escape.md", "ok.md"]
+
+def test_download_and_extract_uses_the_downloaded_archive(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    archive = make_zip(tmp_path / "t.zip", MEMBERS)
+    download = Future()
+    download.set_result((archive, {"release": "v1.0.0", "size": archive.stat().st_size, "filename": archive.name, "cached": True}))
+
+    download_and_extract_template(tmp_path / "project", "claude", "sh", verbose=False, archive=download)
+
+    assert files(tmp_path / "project") == sorted(MEMBERS)
+    assert archive.exists()  # cached archives are kept
+
+def test_failed_extraction_removes_the_new_project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    archive = tmp_path / "t.zip"
+    archive.write_bytes(b"not a zip archive")
+    download = Future()
+    download.set_result((archive, {"release": "v1.0.0", "size": 17, "filename": archive.name, "cached": True}))
+
+    with pytest.raises(typer.Exit):
+        download_and_extract_template(tmp_path / "project", "claude", "sh", verbose=False, archive=download)
+    assert not (tmp_path / "project").exists()
+
+
+def test_merge_skips_identical_files(tmp_path):
+    archive = make_zip(tmp_path / "t.zip", MEMBERS)
+    project = tmp_path / "project"
+    extract(archive, project)
+    unchanged = project / ".grove/memory/constitution.md"
+    edited = project / ".claude/commands/grove.plan.md"
+    os.utime(unchanged, ns=(0, 0))
+    edited.write_bytes(b"edited\n")
+
+    result = extract(archive, project, merge=True)
+
+    assert (result.written, result.skipped) == (1, 2)
+    assert unchanged.stat().st_mtime_ns == 0
+    assert edited.read_bytes() == b"plan\n"
+
+def test_merge_keeps_files_the_archive_does_not_have(tmp_path):
+    archive = make_zip(tmp_path / "t.zip", MEMBERS)
+    project = tmp_path / "project"
+    (project / ".grove" / "memory").mkdir(parents=True)
+    (project / ".grove" / "memory" / "notes.md").write_text("mine")
+
+    extract(archive, project, merge=True)
+
+    assert (project / ".grove" / "memory" / "notes.md").read_text() == "mine"
+
+def test_merge_merges_vscode_settings(tmp_path):
+    archive = make_zip(tmp_path / "t.zip", {".vscode/settings.json": b'{"a": 1, "nested": {"x": 1}}'})
+    project = tmp_path / "project"
+    (project / ".vscode").mkdir(parents=True)
+    (project / ".vscode" / "settings.json").write_text('{"b": 2, "nested": {"y": 2}}')
+
+    result = extract(archive, project, merge=True)
+
+    assert result.merged == 1
+    assert json.loads((project / ".vscode" / "settings.json").read_text()) == {"a": 1, "b": 2, "nested": {"x": 1, "y": 2}}
+
+
+posix_only = pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+
+def mode(path):
+    return path.stat().st_mode & 0o777
+
+@posix_only
+def test_members_get_their_archive_modes(tmp_path):
+    archive = make_zip(tmp_path / "t.zip", {**MEMBERS, "run.sh": (b"#!/bin/sh\n", 0o700)})
+
+    extract(archive, tmp_path / "project")
+
+    assert mode(tmp_path / "project" / ".grove/scripts/bash/common.sh") == 0o755
+    assert mode(tmp_path / "project" / "run.sh") == 0o700
+    assert mode(tmp_path / "project" / ".claude/commands/grove.plan.md") == 0o644
+
+@posix_only
+def test_merge_repairs_the_mode_of_unchanged_files(tmp_path):
+    archive = make_zip(tmp_path / "t.zip", MEMBERS)
+    project = tmp_path / "project"
+    extract(archive, project)
+    script = project / ".grove/scripts/bash/common.sh"
+    script.chmod(0o644)
+    os.utime(script, ns=(0, 0))
+
+    result = extract(archive, project, merge=True)
+
+    assert result.written == 0
+    assert mode(script) == 0o755
+    assert script.stat().st_mtime_ns == 0
+
+@posix_only
+def test_copies_keep_the_source_mode(tmp_path):
+    src = tmp_path / "common.sh"
+    src.write_text("#!/bin/sh\n")
+    src.chmod(0o755)
+    dest = tmp_path / "copy.sh"
+    dest.write_text("#!/bin/sh\n")
+    dest.chmod(0o644)
+
+    assert copy_if_changed(src, dest) is False
+    assert mode(dest) == 0o755
+    assert copy_if_changed(src, tmp_path / "new.sh") is True
+    assert mode(tmp_path / "new.sh") == 0o755
+
+@pytest.mark.parametrize("value, enabled", [("", False), ("0", False), ("1", True), ("yes", True)])
+def test_script_scan_is_opt_in(monkeypatch, value, enabled):
+    monkeypatch.setenv("GROVE_VERIFY_SCRIPTS", value)
+
+    assert verify_scripts_enabled() is enabled
+
+@posix_only
+def test_script_scan_repairs_execute_bits(tmp_path):
+    scripts = tmp_path / ".grove" / "scripts" / "bash"
+    scripts.mkdir(parents=True)
+    (scripts / "common.sh").write_text("#!/bin/sh\n")
+    (scripts / "common.sh").chmod(0o640)
+    (scripts / "data.sh").write_text("no shebang\n")
+    (scripts / "data.sh").chmod(0o644)
+
+    ensure_executable_scripts(tmp_path)
+
+    assert mode(scripts / "common.sh") == 0o750
+    assert mode(scripts / "data.sh") == 0o644
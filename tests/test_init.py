@@ -0,0 +1,91 @@
+"""`grove init`: what it does before and instead of downloading templates."""
+
+from concurrent.futures import Future
+
+import httpx
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from grove_cli import app
+from grove_cli.commands import init as init_command
+
+
+@pytest.fixture
+def prefetches(monkeypatch):
+    started = []
+    monkeypatch.setattr(init_command, "TemplatePrefetch", lambda *args, **kwargs: started.append(args))
+    return started
+
+def init(*args: str):
+    return CliRunner().invoke(app, ["init", "--lang", "en", "--no-git", *args])
+
+
+@pytest.mark.parametrize("args", [
+    ["project", "--ai", "nonesuch"],
+    ["project", "--script", "fish"],
+    ["project", "--here", "--ai", "claude"],
+])
+def test_invalid_options_do_not_prefetch(tmp_path, monkeypatch, prefetches, args):
+    monkeypatch.chdir(tmp_path)
+    result = init(*args)
+
+    assert result.exit_code == 1
+    assert prefetches == []
+    assert not (tmp_path / "project").exists()
+
+def test_existing_directory_does_not_prefetch(tmp_path, monkeypatch, prefetches):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "project").mkdir()
+
+    result = init("project", "--ai", "claude", "--script", "sh")
+
+    assert result.exit_code == 1
+    assert "already exists" in result.output
+    assert prefetches == []
+
+
+def failed(exc: BaseException):
+    future = Future()
+    future.set_exception(exc)
+    return future
+
+@pytest.fixture
+def base_download(monkeypatch, prefetches):
+    """Make init's template download finish with whatever the test puts in `outcome`."""
+    outcome = {}
+    monkeypatch.setattr(init_command, "start_template_downloads", lambda agents, *args, **kwargs: {agent: outcome["future"] for agent in agents})
+    return outcome
+
+@pytest.mark.parametrize("error", [typer.Exit(1), httpx.ConnectError("no route to host")])
+def test_failed_download_falls_back_to_installed_templates(tmp_path, monkeypatch, base_download, error):
+    monkeypatch.chdir(tmp_path)
+    base_download["future"] = failed(error)
+
+    result = init("project", "--ai", "claude", "--script", "sh")
+
+    assert result.exit_code == 0, result.output
+    assert "GitHub unreachable" in result.output
+    assert (tmp_path / "project" / ".grove" / "memory" / "config.json").exists()
+    assert (tmp_path / "project" / ".claude" / "commands").is_dir()
+
+def test_failed_download_without_installed_templates_fails(tmp_path, monkeypatch, base_download):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(init_command, "offline_template_root", lambda: None)
+    base_download["future"] = failed(typer.Exit(1))
+
+    assert init("project", "--ai", "claude", "--script", "sh").exit_code == 1
+    assert not (tmp_path / "project").exists()
+
+def test_extraction_error_does_not_fall_back(tmp_path, monkeypatch, base_download):
+    monkeypatch.chdir(tmp_path)
+    archive = tmp_path / "template.zip"
+    archive.write_bytes(b"not a zip archive")
+    base_download["future"] = Future()
+    base_download["future"].set_result((archive, {"release": "v1.0.0", "size": 17, "filename": archive.name, "cached": True}))
+
+    result = init("project", "--ai", "claude", "--script", "sh")
+
+    assert result.exit_code == 1
+    assert "GitHub unreachable" not in result.output
+    assert not (tmp_path / "project").exists()
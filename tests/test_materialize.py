@@ -0,0 +1,65 @@
+"""clone_file / copy_if_changed: copy strategies never write through links."""
+
+import errno
+import os
+
+import pytest
+
+from grove_cli import materialize
+from grove_cli.materialize import clone_file, copy_if_changed
+
+
+@pytest.fixture
+def shared(tmp_path):
+    """A source file and a destination hard-linked to it, as a hardlink install leaves them."""
+    src = tmp_path / "share" / "script.sh"
+    src.parent.mkdir()
+    src.write_text("original\n")
+    dest = tmp_path / "project" / "script.sh"
+    dest.parent.mkdir()
+    os.link(src, dest)
+    return src, dest
+
+@pytest.mark.parametrize("mode", ["auto", "hardlink", "copy"])
+def test_clone_breaks_existing_hardlink(shared, tmp_path, monkeypatch, mode):
+    monkeypatch.setenv(materialize.COPY_MODE_ENV, mode)
+    src, dest = shared
+    update = tmp_path / "update.sh"
+    update.write_text("updated\n")
+
+    clone_file(update, dest)
+
+    assert dest.read_text() == "updated\n"
+    assert src.read_text() == "original\n"
+    assert os.stat(src).st_nlink == 1
+
+def test_copy_if_changed_keeps_identical_files(tmp_path):
+    src, dest = tmp_path / "a", tmp_path / "b"
+    src.write_text("same")
+    dest.write_text("same")
+    os.chmod(src, 0o755)
+    os.utime(dest, (1, 1))
+
+    assert copy_if_changed(src, dest) is False
+    assert dest.stat().st_mtime == 1
+    assert dest.stat().st_mode & 0o777 == 0o755
+
+def test_hardlink_mode_links_read_only_artifacts(tmp_path, monkeypatch):
+    monkeypatch.setenv(materialize.COPY_MODE_ENV, "hardlink")
+    src, dest = tmp_path / "a", tmp_path / "b"
+    src.write_text("script")
+
+    assert clone_file(src, dest, link=True) == "hardlink"
+    assert os.path.samefile(src, dest)
+
+def test_real_errors_are_not_treated_as_unsupported(tmp_path, monkeypatch):
+    def denied(*args):
+        raise OSError(errno.EACCES, "Permission denied")
+
+    monkeypatch.setattr(materialize.os, "copy_file_range", denied, raising=False)
+    monkeypatch.setattr(materialize, "_supported", lambda method, *devs: method == "copy_file_range")
+    src, dest = tmp_path / "a", tmp_path / "b"
+    src.write_text("data")
+
+    with pytest.raises(PermissionError):
+        clone_file(src, dest)
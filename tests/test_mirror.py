@@ -0,0 +1,131 @@
+"""`grove mirror serve`: release JSON rewriting, asset caching and Range requests."""
+
+import hashlib
+import threading
+
+import httpx
+import pytest
+
+from grove_cli import github
+from grove_cli.cache import AssetCache
+from grove_cli.mirror import MirrorServer
+
+UPSTREAM = "https://upstream.test/repos/o/r"
+TAG = "v1.0.0"
+ASSET = "grove-template-claude-sh-v1.0.0.zip"
+DATA = bytes(range(256)) * 400
+
+
+@pytest.fixture
+def upstream(tmp_path, monkeypatch):
+    """A GitHub-compatible release source behind a mock transport; records asset requests."""
+    monkeypatch.setenv("GROVE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("GROVE_RELEASE_SOURCE", UPSTREAM)
+    downloads = []
+    release = {
+        "tag_name": TAG,
+        "assets": [
+            {"name": ASSET, "size": len(DATA), "browser_download_url": f"https://upstream.test/download/{ASSET}"},
+            {"name": "other.zip", "size": 1, "browser_download_url": "https://upstream.test/download/other.zip"},
+        ],
+    }
+
+    def handler(request):
+        if request.url.path.endswith("/releases/latest"):
+            return httpx.Response(200, json=release)
+        downloads.append(request.url.path)
+        return httpx.Response(200, content=DATA)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(github, "get_http_client", lambda: client)
+    return downloads
+
+def start(offline=False):
+    server = MirrorServer(("127.0.0.1", 0), offline=offline)
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+@pytest.fixture
+def mirror(upstream):
+    server, url = start()
+    yield url
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def client():
+    with httpx.Client(trust_env=False, timeout=10) as client:
+        yield client
+
+
+def test_release_assets_point_at_the_mirror(mirror, client):
+    response = client.get(f"{mirror}/releases/latest")
+
+    assert response.status_code == 200
+    assets = {a["name"]: a for a in response.json()["assets"]}
+    assert assets[ASSET]["browser_download_url"] == f"{mirror}/releases/download/{TAG}/{ASSET}"
+    assert "digest" not in assets[ASSET]  # not cached yet
+
+    assert client.get(f"{mirror}/releases/latest", headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+
+def test_asset_is_downloaded_once_then_served_from_cache(mirror, upstream, client):
+    url = f"{mirror}/releases/download/{TAG}/{ASSET}"
+    bodies = []
+    threads = [threading.Thread(target=lambda: bodies.append(client.get(url).content)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert bodies == [DATA] * 4
+    assert upstream == [f"/download/{ASSET}"]
+    assert AssetCache().lookup(TAG, ASSET) is not None
+    asset = next(a for a in client.get(f"{mirror}/releases/latest").json()["assets"] if a["name"] == ASSET)
+    assert asset["digest"] == f"sha256:{hashlib.sha256(DATA).hexdigest()}"
+
+def test_range_requests(mirror, client):
+    url = f"{mirror}/releases/download/{TAG}/{ASSET}"
+
+    partial = client.get(url, headers={"Range": "bytes=1000-"})
+    assert partial.status_code == 206
+    assert partial.headers["Content-Range"] == f"bytes 1000-{len(DATA) - 1}/{len(DATA)}"
+    assert partial.content == DATA[1000:]
+
+    assert client.get(url, headers={"Range": "bytes=10-19"}).content == DATA[10:20]
+    assert client.get(url, headers={"Range": f"bytes={len(DATA)}-"}).status_code == 416
+
+def test_unknown_paths_and_assets(mirror, upstream, client):
+    assert client.get(f"{mirror}/nonesuch").status_code == 404
+    assert client.get(f"{mirror}/releases/download/{TAG}/missing.zip").status_code == 404
+    assert client.get(f"{mirror}/releases/download/v0.9.0/{ASSET}").status_code == 404
+    assert upstream == []
+
+def test_resumable_download_through_the_mirror(mirror, upstream, client, tmp_path):
+    url = next(a for a in client.get(f"{mirror}/releases/latest").json()["assets"] if a["name"] == ASSET)["browser_download_url"]
+    partial = tmp_path / ASSET
+    partial.write_bytes(DATA[:5000])  # an interrupted earlier attempt
+
+    sha256 = github._download_resumable(client, url, partial, total_size=len(DATA), show_progress=False)
+
+    assert sha256 == hashlib.sha256(DATA).hexdigest()
+    assert partial.read_bytes() == DATA
+    assert upstream == [f"/download/{ASSET}"]
+
+
+def test_offline_mirror_serves_only_the_cache(upstream, client, tmp_path):
+    server, url = start(offline=True)
+    try:
+        assert client.get(f"{url}/releases/latest").status_code == 503
+        assert client.get(f"{url}/releases/download/{TAG}/{ASSET}").status_code == 404
+
+        github.fetch_latest_release()  # caches the release information
+        source = tmp_path / ASSET
+        source.write_bytes(DATA)
+        AssetCache().store(TAG, ASSET, source)
+
+        assert [a["name"] for a in client.get(f"{url}/releases/latest").json()["assets"]] == [ASSET]
+        assert client.get(f"{url}/releases/download/{TAG}/{ASSET}").content == DATA
+        assert upstream == []
+    finally:
+        server.shutdown()
+        server.server_close()
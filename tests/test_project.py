@@ -0,0 +1,100 @@
+"""`GroveProject`: the in-process API and the warm state behind it."""
+
+import json
+import os
+import stat
+
+import pytest
+
+from grove_cli import GroveProject
+from grove_cli import templates as templates_module
+from grove_cli.project import GroveState
+
+
+@pytest.fixture
+def templates(tmp_path, monkeypatch):
+    root = tmp_path / "templates"
+    (root / "en").mkdir(parents=True)
+    monkeypatch.setattr(templates_module, "get_templates_root", lambda: root)
+    return root / "en"
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    (root / ".grove" / "memory").mkdir(parents=True)
+    (root / "src").mkdir()
+    (root / "src" / "main.py").write_text("print('hi')\n")
+    return GroveProject(root, GroveState())
+
+def write(path, text):
+    """Write `path` so that its mtime visibly changes."""
+    path.write_text(text)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_config_is_reread_only_when_it_changes(project):
+    config_file = project.root / ".grove" / "memory" / "config.json"
+    assert project.language == "en"  # default without a config file
+
+    write(config_file, json.dumps({"language": "ja"}))
+    assert project.config is project.config
+    assert project.language == "ja"
+
+    write(config_file, json.dumps({"language": "en"}))
+    assert project.language == "en"
+
+def test_template_follows_its_enabled_flag(project, templates):
+    template = templates / "spec-template.md"
+    write(template, "---\nenabled: true\n---\nSpec body\n")
+    assert project.template("spec").strip() == "Spec body"
+
+    write(template, "---\nenabled: false\n---\nSpec body\n")
+    assert project.template("spec") is None
+    assert project.template("nonesuch") is None
+
+def test_state_is_shared_between_projects(project, tmp_path):
+    other = GroveProject(tmp_path / "other", project.state)
+
+    assert other.state is project.state
+    assert GroveProject(project.root).state is GroveProject(tmp_path / "other").state
+
+def test_sync_docs_reports_instead_of_printing(project, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    assert project.docs() == []
+
+    result = project.sync_docs("src")
+
+    assert result.count > 0
+    assert result.docs_dir == project.root / ".grove" / "docs" / "src"
+    assert "src/main.md" in project.docs()
+    assert (project.root / ".grove" / "completion-index").read_text() == "src\tsrc\n"
+    assert os.getcwd() == str(tmp_path)
+    assert capsys.readouterr().out == ""
+
+def test_sync_docs_without_source_directory(project):
+    with pytest.raises(FileNotFoundError):
+        project.sync_docs("lib")
+
+
+def test_run_agent_rejects_unknown_agents(project):
+    with pytest.raises(ValueError):
+        project.run_agent("nonesuch", "spec")
+
+@pytest.mark.skipif(os.name == "nt", reason="shell script stands in for the agent CLI")
+def test_run_agent_runs_in_the_project(project, templates, tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    fake = bin_dir / "claude"
+    fake.write_text('#!/bin/sh\npwd\nprintf "%s\\n" "$@"\n')
+    fake.chmod(fake.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr("grove_cli.tools.CLAUDE_LOCAL_PATH", tmp_path / "no-local-claude")
+    write(templates / "plan-template.md", "---\nenabled: true\n---\nPlan body\n")
+
+    run = project.run_agent("claude", "plan", "extra context")
+
+    cwd, *argv = run.stdout.splitlines()
+    assert os.path.samefile(cwd, project.root)
+    assert argv[0] == "--print"
+    assert "/grove.plan" in argv and "Plan body" in argv and "extra context" in argv
@@ -0,0 +1,126 @@
+"""RateLimiter and RateLimitedTransport: pacing ahead of the GitHub quota."""
+
+import multiprocessing
+import os
+import time
+
+import httpx
+import pytest
+
+from grove_cli import ratelimit
+from grove_cli.cache import RateLimitCache, RateLimitState
+from grove_cli.ratelimit import THROTTLED_HEADER, RateLimitedTransport, RateLimiter, parse_retry_after
+
+KEY = "api.github.com|anonymous"
+
+
+@pytest.fixture
+def limiter(tmp_path):
+    return RateLimiter(RateLimitCache(tmp_path / "ratelimits.json"), max_wait=60)
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    slept = []
+    monkeypatch.setattr(ratelimit.time, "sleep", slept.append)
+    return slept
+
+def quota_headers(limit, remaining, reset):
+    return {"X-RateLimit-Limit": str(limit), "X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(reset)}
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("30") == 30
+    assert parse_retry_after("-5") == 0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412470) == 10
+    assert parse_retry_after("soon") is None
+
+def test_unknown_or_plentiful_quota_is_not_paced(limiter):
+    assert limiter.acquire(KEY) == 0
+    limiter.record(KEY, httpx.Headers(quota_headers(5000, 4000, time.time() + 3600)))
+    assert limiter.acquire(KEY) == 0
+    assert limiter.state(KEY).remaining == 3999
+
+def test_reserve_is_paced_until_reset(limiter):
+    limiter.record(KEY, httpx.Headers(quota_headers(5000, 100, time.time() + 1000)))
+    waits = [limiter.acquire(KEY) for _ in range(3)]
+    # ~0.1 requests per second: the first goes now, the next ones are spaced out
+    assert waits[0] == 0
+    assert 5 < waits[1] < 15
+    assert waits[2] > waits[1]
+
+def test_exhausted_quota(limiter):
+    limiter.record(KEY, httpx.Headers(quota_headers(60, 0, time.time() + 30)))
+    assert 29 < limiter.acquire(KEY) <= 31
+    limiter.record(KEY, httpx.Headers(quota_headers(60, 0, time.time() + 600)))
+    assert limiter.acquire(KEY) is None
+
+def test_quota_is_shared_through_the_cache(tmp_path):
+    cache_path = tmp_path / "ratelimits.json"
+    first = RateLimiter(RateLimitCache(cache_path))
+    second = RateLimiter(RateLimitCache(cache_path))
+
+    first.record(KEY, httpx.Headers(quota_headers(60, 0, time.time() + 3600)))
+    assert second.acquire(KEY) is None
+
+def test_older_observation_does_not_replace_newer(tmp_path):
+    cache = RateLimitCache(tmp_path / "ratelimits.json")
+    cache.put(KEY, RateLimitState(60, 10, time.time() + 60, updated=200.0))
+    cache.put(KEY, RateLimitState(60, 50, time.time() + 60, updated=100.0))
+    assert cache.get(KEY).remaining == 10
+
+
+def test_transport_does_not_send_when_exhausted(limiter):
+    sent = []
+    transport = RateLimitedTransport(httpx.MockTransport(lambda request: sent.append(request) or httpx.Response(200)), limiter)
+    limiter.record(KEY, httpx.Headers(quota_headers(60, 0, time.time() + 3600)))
+
+    response = httpx.Client(transport=transport).get("https://api.github.com/repos/x/y/releases/latest")
+
+    assert response.status_code == 429
+    assert response.headers[THROTTLED_HEADER] == "1"
+    assert int(response.headers["Retry-After"]) > 3000
+    assert sent == []
+
+def test_transport_retries_after_retry_after(limiter, no_sleep):
+    responses = iter([httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200)])
+    transport = RateLimitedTransport(httpx.MockTransport(lambda request: next(responses)), limiter)
+
+    response = httpx.Client(transport=transport).get("https://api.github.com/x")
+
+    assert response.status_code == 200
+    assert no_sleep == [2]
+
+def test_transport_gives_up_beyond_max_wait(limiter, no_sleep):
+    transport = RateLimitedTransport(httpx.MockTransport(lambda request: httpx.Response(429, headers={"Retry-After": "600"})), limiter)
+
+    assert httpx.Client(transport=transport).get("https://api.github.com/x").status_code == 429
+    assert no_sleep == []
+
+def test_plain_403_is_not_retried(limiter, no_sleep):
+    calls = []
+    transport = RateLimitedTransport(httpx.MockTransport(lambda request: calls.append(1) or httpx.Response(403)), limiter)
+
+    assert httpx.Client(transport=transport).get("https://api.github.com/x").status_code == 403
+    assert len(calls) == 1
+
+def _put_many(path, worker):
+    from pathlib import Path
+
+    cache = RateLimitCache(Path(path))
+    for i in range(50):
+        # Interleaved observation times: worker w saw i * 4 + w
+        cache.put(KEY, RateLimitState(60, 59 - worker, time.time() + 3600, updated=float(i * 4 + worker)))
+
+@pytest.mark.skipif(os.name == "nt", reason="fork-based multiprocessing")
+def test_concurrent_processes_keep_the_newest_observation(tmp_path):
+    path = tmp_path / "ratelimits.json"
+    context = multiprocessing.get_context("fork")
+    for run in range(5):
+        path.unlink(missing_ok=True)
+        workers = [context.Process(target=_put_many, args=(str(path), w)) for w in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert [w.exitcode for w in workers] == [0] * 4
+        assert RateLimitCache(path).get(KEY).updated == 49 * 4 + 3
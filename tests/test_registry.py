@@ -0,0 +1,100 @@
+"""Lazy subcommand registry: built-in commands load on first use, plugins come from entry points."""
+
+import json
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from grove_cli import app, registry
+from grove_cli.registry import BUILTIN_COMMANDS, CommandSpec, load_command
+
+PROBE = """
+import contextlib, io, json, sys
+sys.argv = ["grove"] + sys.argv[1:]
+from grove_cli import main
+out = io.StringIO()
+with contextlib.redirect_stdout(out):
+    try:
+        main()
+    except SystemExit:
+        pass
+print(json.dumps({"output": out.getvalue(), "commands": sorted(m for m in sys.modules if m.startswith("grove_cli.commands."))}))
+"""
+
+def run_cli(*args: str) -> dict:
+    result = subprocess.run([sys.executable, "-c", PROBE, *args], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+@pytest.fixture
+def plugins(monkeypatch):
+    """Install fake `grove_cli.commands` entry points."""
+    eps = []
+    monkeypatch.setattr(registry, "entry_points", lambda group: [ep for ep in eps if ep.group == group])
+    registry.plugin_commands.cache_clear()
+    yield eps
+    registry.plugin_commands.cache_clear()
+
+def plugin(name: str, value: str) -> EntryPoint:
+    return EntryPoint(name, value, registry.ENTRY_POINT_GROUP)
+
+
+def test_help_lists_every_command_without_importing_any():
+    result = run_cli("--help")
+
+    assert result["commands"] == []
+    for name in BUILTIN_COMMANDS:
+        assert name in result["output"]
+
+def test_only_the_invoked_command_is_imported():
+    assert run_cli("sync", "--help")["commands"] == ["grove_cli.commands.sync"]
+
+@pytest.mark.parametrize("name", list(BUILTIN_COMMANDS))
+def test_short_help_matches_the_command(name):
+    spec = BUILTIN_COMMANDS[name]
+    command = load_command(name, spec)
+
+    assert command.name == name
+    assert command.help.strip().splitlines()[0] == spec.short_help
+
+
+def test_load_command_accepts_apps_click_commands_and_functions():
+    assert registry._is_click_command(load_command("a", CommandSpec(f"{__name__}:TYPER_APP")))
+    assert load_command("b", CommandSpec(f"{__name__}:click_command")).name == "b"
+    assert load_command("c", CommandSpec(f"{__name__}:plain_function")).name == "c"
+    with pytest.raises(TypeError):
+        load_command("d", CommandSpec(f"{__name__}:NOT_A_COMMAND"))
+
+def test_plugins_are_listed_and_run(plugins):
+    plugins.append(plugin("greet", f"{__name__}:plain_function"))
+    plugins.append(plugin("init", f"{__name__}:plain_function"))  # built-ins win
+
+    assert registry.plugin_commands() == {"greet": CommandSpec(f"{__name__}:plain_function", "(plugin)")}
+    result = CliRunner().invoke(app, ["greet", "--who", "grove"])
+    assert result.exit_code == 0, result.output
+    assert "hello grove" in result.output
+
+def test_unknown_command(plugins):
+    result = CliRunner().invoke(app, ["nonesuch"])
+
+    assert result.exit_code == 2
+    assert "No such command" in result.output
+
+
+# Targets for load_command
+
+TYPER_APP = typer.Typer()
+
+@TYPER_APP.command()
+def _typer_command():
+    pass
+
+click_command = typer.main.get_command(TYPER_APP)
+
+def plain_function(who: str = typer.Option("world", "--who")):
+    typer.echo(f"hello {who}")
+
+NOT_A_COMMAND = 42
@@ -0,0 +1,94 @@
+"""`releases/latest` metadata: TTL, ETag revalidation and stale fallbacks."""
+
+import json
+
+import httpx
+import pytest
+
+from grove_cli import github
+from grove_cli.cache import ReleaseCache
+
+RELEASE = {"tag_name": "v1.0.0", "assets": []}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("GROVE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("GROVE_RELEASE_SOURCE", raising=False)
+    monkeypatch.delenv("GROVE_RELEASE_TTL", raising=False)
+
+def api(*responses):
+    """Client answering successive requests with `responses` (Response objects or exceptions); records request headers."""
+    seen = []
+    pending = list(responses)
+
+    def handler(request):
+        seen.append(request.headers)
+        response = pending.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return httpx.Client(transport=httpx.MockTransport(handler)), seen
+
+def expire(monkeypatch):
+    monkeypatch.setenv("GROVE_RELEASE_TTL", "0")
+
+
+def test_fresh_entry_is_used_without_a_request():
+    client, seen = api(httpx.Response(200, json=RELEASE, headers={"ETag": '"abc"'}))
+
+    assert github.fetch_latest_release(client) == (RELEASE, "network")
+    assert github.fetch_latest_release(client) == (RELEASE, "cache")
+    assert len(seen) == 1
+
+def test_expired_entry_is_revalidated_with_its_etag(monkeypatch):
+    client, seen = api(httpx.Response(200, json=RELEASE, headers={"ETag": '"abc"'}), httpx.Response(304))
+    github.fetch_latest_release(client)
+    expire(monkeypatch)
+
+    assert github.fetch_latest_release(client) == (RELEASE, "not-modified")
+    assert seen[1]["If-None-Match"] == '"abc"'
+
+def test_revalidation_restarts_the_ttl(monkeypatch):
+    client, _ = api(httpx.Response(200, json=RELEASE, headers={"ETag": '"abc"'}), httpx.Response(304))
+    github.fetch_latest_release(client)
+    url = github.get_release_source().latest_url
+    before = ReleaseCache().get(url).fetched_at
+    expire(monkeypatch)
+
+    github.fetch_latest_release(client)
+
+    assert ReleaseCache().get(url).fetched_at > before
+
+def test_changed_release_replaces_the_cache(monkeypatch):
+    newer = {"tag_name": "v1.1.0", "assets": []}
+    client, _ = api(httpx.Response(200, json=RELEASE, headers={"ETag": '"abc"'}), httpx.Response(200, json=newer, headers={"ETag": '"def"'}))
+    github.fetch_latest_release(client)
+    expire(monkeypatch)
+
+    assert github.fetch_latest_release(client) == (newer, "network")
+    assert ReleaseCache().get(github.get_release_source().latest_url).etag == '"def"'
+
+@pytest.mark.parametrize("failure", [httpx.ConnectError("offline"), httpx.Response(403, headers={"X-RateLimit-Remaining": "0"}), httpx.Response(502)])
+def test_stale_copy_when_the_api_fails(monkeypatch, failure):
+    client, _ = api(httpx.Response(200, json=RELEASE), failure)
+    github.fetch_latest_release(client)
+    expire(monkeypatch)
+
+    assert github.fetch_latest_release(client) == (RELEASE, "stale")
+
+def test_failure_without_cache_raises():
+    client, _ = api(httpx.ConnectError("offline"))
+
+    with pytest.raises(RuntimeError, match="Could not reach"):
+        github.fetch_latest_release(client)
+
+def test_local_directory_source_is_read_directly(tmp_path, monkeypatch):
+    source = tmp_path / "source"
+    (source / "releases").mkdir(parents=True)
+    (source / "releases" / "latest").write_text(json.dumps(RELEASE))
+    monkeypatch.setenv("GROVE_RELEASE_SOURCE", source.as_uri())
+
+    assert github.fetch_latest_release() == (RELEASE, "local")
+    assert not (tmp_path / "cache" / "releases.json").exists()
@@ -0,0 +1,76 @@
+"""The pooled GitHub session: one client per TLS setting, token scoping and timings."""
+
+import httpx
+import pytest
+
+from grove_cli import github, session as session_module
+from grove_cli.session import GitHubSession, get_session, http2_available
+
+
+@pytest.fixture
+def seen(tmp_path, monkeypatch):
+    """Route every session's requests to a mock server; collect (host, Authorization) per request."""
+    monkeypatch.setenv("GROVE_CACHE_DIR", str(tmp_path / "cache"))
+    requests = []
+
+    def handler(request):
+        requests.append((request.url.host, request.headers.get("Authorization")))
+        if request.url.path == "/redirect":
+            return httpx.Response(302, headers={"Location": "https://objects.githubusercontent.com/asset"})
+        return httpx.Response(200, text="ok")
+
+    monkeypatch.setattr(httpx, "HTTPTransport", lambda **kwargs: httpx.MockTransport(handler))
+    return requests
+
+
+def test_one_session_per_tls_setting():
+    assert get_session() is get_session()
+    assert get_session(verify=False) is not get_session()
+    assert get_session(verify=False).verify is False
+    assert github.get_http_client() is get_session().client
+
+def test_client_is_built_once(seen):
+    session = GitHubSession()
+
+    assert session.client is session.client
+    session.close()
+    assert session._client is None
+
+def test_token_goes_to_github_hosts_only(seen):
+    session = GitHubSession()
+    session.token = "secret"
+
+    session.client.get("https://api.github.com/redirect", follow_redirects=True)
+    session.client.get("https://mirror.example/releases/latest")
+    session.client.get("https://api.github.com/x", headers={"Authorization": "Bearer other"})
+
+    assert seen == [
+        ("api.github.com", "Bearer secret"),
+        ("objects.githubusercontent.com", None),
+        ("mirror.example", None),
+        ("api.github.com", "Bearer other"),
+    ]
+
+def test_get_session_keeps_the_token(monkeypatch):
+    session = GitHubSession()
+    monkeypatch.setattr(session_module, "_session", lambda verify: session)
+
+    get_session(github_token=" tok ")
+    get_session()
+
+    assert session.token == "tok"
+
+def test_requests_are_timed(seen):
+    session = GitHubSession()
+
+    session.client.get("https://api.github.com/x")
+
+    [timing] = session.timings
+    assert (timing.method, timing.url, timing.status) == ("GET", "https://api.github.com/x", 200)
+    assert timing.seconds >= 0
+
+def test_http2_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("GROVE_HTTP2", "0")
+
+    assert not http2_available()
+    assert GitHubSession().http2 is False
@@ -0,0 +1,142 @@
+"""ProjectStage: all-or-nothing init for new projects and --here merges."""
+
+import json
+import os
+
+import pytest
+
+from grove_cli import staging
+from grove_cli.staging import STAGE_SUFFIX, ProjectStage, recover_interrupted_init
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+def stage_dirs(directory):
+    return [p.name for p in directory.iterdir() if STAGE_SUFFIX in p.name]
+
+@pytest.fixture
+def project(tmp_path):
+    """An existing project for --here: one file init rewrites, one it keeps, one it never touches."""
+    root = tmp_path / "project"
+    write(root / "AGENTS.md", "old agents\n")
+    write(root / ".grove" / "config.json", "{}\n")
+    write(root / "src" / "main.py", "user code\n")
+    return root
+
+
+def test_new_project_commits_with_one_rename(tmp_path):
+    target = tmp_path / "new"
+    stage = ProjectStage(target)
+    write(stage.path / ".grove" / "config.json", "{}\n")
+    write(stage.path / "AGENTS.md", "agents\n")
+    assert not target.exists()
+
+    result = stage.commit()
+
+    assert result.written == 2
+    assert (target / "AGENTS.md").read_text() == "agents\n"
+    assert stage_dirs(tmp_path) == []
+
+def test_new_project_refuses_target_created_meanwhile(tmp_path):
+    target = tmp_path / "new"
+    stage = ProjectStage(target)
+    write(stage.path / "AGENTS.md", "agents\n")
+    write(target / "theirs.txt", "not ours\n")
+
+    with pytest.raises(FileExistsError):
+        stage.commit()
+    stage.discard()
+    assert os.listdir(target) == ["theirs.txt"]
+    assert stage_dirs(tmp_path) == []
+
+def test_discard_leaves_target_untouched(project):
+    stage = ProjectStage(project, here=True)
+    write(stage.path / "AGENTS.md", "new agents\n")
+    stage.discard()
+
+    assert (project / "AGENTS.md").read_text() == "old agents\n"
+    assert stage_dirs(project) == []
+
+def test_here_writes_only_changed_files(project):
+    stage = ProjectStage(project, here=True)
+    write(stage.path / "AGENTS.md", "new agents\n")
+    write(stage.path / ".grove" / "config.json", "{}\n")
+    write(stage.path / ".grove" / "scripts" / "setup.sh", "#!/bin/sh\n")
+
+    result = stage.commit()
+
+    assert (result.written, result.unchanged) == (2, 1)
+    assert (project / "AGENTS.md").read_text() == "new agents\n"
+    assert (project / ".grove" / "scripts" / "setup.sh").exists()
+    assert (project / "src" / "main.py").read_text() == "user code\n"
+    assert stage_dirs(project) == []
+
+def test_here_seeds_vscode_settings(project):
+    write(project / ".vscode" / "settings.json", '{"editor.tabSize": 2}\n')
+    stage = ProjectStage(project, here=True)
+    assert (stage.path / ".vscode" / "settings.json").read_text() == '{"editor.tabSize": 2}\n'
+    stage.discard()
+
+def test_failed_here_commit_is_rolled_back(project, monkeypatch):
+    stage = ProjectStage(project, here=True)
+    write(stage.path / "AGENTS.md", "new agents\n")
+    write(stage.path / ".grove" / "config.json", '{"language": "en"}\n')
+    write(stage.path / ".grove" / "templates" / "spec.md", "spec\n")
+
+    real_replace = os.replace
+    moves = []
+
+    def failing_replace(src, dst):
+        moves.append(dst)
+        if len(moves) == 4:  # moving the second file: the first is in place, both are backed up
+            raise OSError("disk full")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(staging.os, "replace", failing_replace)
+    with pytest.raises(OSError, match="disk full"):
+        stage.commit()
+    monkeypatch.setattr(staging.os, "replace", real_replace)
+
+    assert (project / "AGENTS.md").read_text() == "old agents\n"
+    assert (project / ".grove" / "config.json").read_text() == "{}\n"
+    assert not (project / ".grove" / "templates").exists()
+    assert stage_dirs(project) == []
+
+def test_directory_is_never_replaced_by_a_file(project):
+    stage = ProjectStage(project, here=True)
+    write(stage.path / "AGENTS.md", "new agents\n")
+    write(stage.path / "src", "a file where the project has a directory\n")
+
+    with pytest.raises(IsADirectoryError):
+        stage.commit()
+    stage.discard()
+    assert (project / "AGENTS.md").read_text() == "old agents\n"
+    assert (project / "src" / "main.py").exists()
+
+def test_interrupted_here_commit_is_undone_by_next_init(project):
+    stage = ProjectStage(project, here=True)
+    write(stage.path / "AGENTS.md", "new agents\n")
+    write(stage.path / ".grove" / "templates" / "spec.md", "spec\n")
+
+    # Simulate a crash halfway through commit(): journal written, one file moved
+    journal = {"files": [["AGENTS.md", True], [".grove/templates/spec.md", False]], "dirs": [".grove/templates"]}
+    (stage.container / staging.JOURNAL_NAME).write_text(json.dumps(journal))
+    write(stage.container / "backup" / "AGENTS.md", "old agents\n")
+    os.replace(stage.path / "AGENTS.md", project / "AGENTS.md")
+    (stage.container / "pid").write_text("999999999")  # owner no longer running
+
+    assert recover_interrupted_init(project, here=True) == 1
+    assert (project / "AGENTS.md").read_text() == "old agents\n"
+    assert not (project / ".grove" / "templates").exists()
+    assert stage_dirs(project) == []
+
+def test_running_init_stage_is_not_recovered(project):
+    stage = ProjectStage(project, here=True)
+    (stage.container / "pid").write_text(str(os.getppid()))  # another live process
+
+    assert recover_interrupted_init(project, here=True) == 0
+    assert stage.container.exists()
+    stage.discard()
@@ -0,0 +1,64 @@
+"""Cold-start budget: `grove sync --help` must not pay for the network stack or Rich widgets."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Imported on first use only (see grove_cli.__init__)
+DEFERRED_MODULES = ["httpx", "truststore", "yaml", "readchar", "rich.live", "rich.progress"]
+
+# Not needed to import grove_cli, but Typer renders --help with them
+HELP_MODULES = ["rich.table", "rich.tree"]
+
+# Seconds from the first import to the end of `grove sync --help`, best of
+# three runs; set $GROVE_STARTUP_BUDGET on slow machines
+STARTUP_BUDGET = float(os.getenv("GROVE_STARTUP_BUDGET", "0.6"))
+
+PROBE = """
+import contextlib, io, json, sys, time
+
+started = time.perf_counter()
+sys.argv = ["grove"] + sys.argv[1:]
+from grove_cli import main
+with contextlib.redirect_stdout(io.StringIO()):
+    try:
+        main()
+    except SystemExit:
+        pass
+elapsed = time.perf_counter() - started
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+def run_cli(*args: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+def loaded(modules, names) -> list:
+    return [name for name in names if name in modules]
+
+
+def test_import_defers_heavy_modules():
+    result = subprocess.run(
+        [sys.executable, "-c", "import json, sys, grove_cli; print(json.dumps(sorted(sys.modules)))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert loaded(json.loads(result.stdout), DEFERRED_MODULES + HELP_MODULES) == []
+
+@pytest.mark.parametrize("argv", [["--help"], ["sync", "--help"], ["version", "--help"]])
+def test_help_defers_heavy_modules(argv):
+    assert loaded(run_cli(*argv)["modules"], DEFERRED_MODULES) == []
+
+def test_sync_help_within_budget():
+    elapsed = min(run_cli("sync", "--help")["elapsed"] for _ in range(3))
+    assert elapsed < STARTUP_BUDGET, f"`grove sync --help` took {elapsed:.3f}s (budget {STARTUP_BUDGET}s)"
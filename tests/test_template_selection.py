@@ -0,0 +1,48 @@
+"""select_template_path: which archive members a project gets, and where."""
+
+import pytest
+
+from grove_cli.install import TemplateSelection, select_template_path
+
+SELECTION = TemplateSelection(language="ja", script_type="sh", agents=["claude"])
+
+
+@pytest.mark.parametrize("path, expected", [
+    # Language templates move up to .grove/templates/; other languages are dropped
+    (".grove/templates/ja/spec-template.md", ".grove/templates/spec-template.md"),
+    (".grove/templates/ja/constitution-template.md", ".grove/templates/constitution-template.md"),
+    (".grove/templates/en/spec-template.md", None),
+    (".grove/templates/ja/unknown.md", None),
+    (".grove/templates/ja/nested/spec-template.md", None),
+    (".grove/templates/agents/claude.md", None),
+    (".grove/templates/plan-template.md", ".grove/templates/plan-template.md"),
+    # Only the selected script variant
+    (".grove/scripts/bash/common.sh", ".grove/scripts/bash/common.sh"),
+    (".grove/scripts/powershell/common.ps1", None),
+    (".grove/scripts/README.md", ".grove/scripts/README.md"),
+    # Only the selected agents' folders; .github/ and root files are shared
+    (".claude/commands/grove.plan.md", ".claude/commands/grove.plan.md"),
+    (".codex/prompts/grove.plan.md", None),
+    (".github/prompts/grove.plan.md", ".github/prompts/grove.plan.md"),
+    ("AGENTS.md", "AGENTS.md"),
+    (".vscode/settings.json", ".vscode/settings.json"),
+])
+def test_selection(path, expected):
+    assert select_template_path(path, SELECTION) == expected
+
+def test_empty_selection_keeps_everything():
+    for path in [".grove/templates/en/spec-template.md", ".grove/scripts/powershell/a.ps1", ".codex/x.md"]:
+        assert select_template_path(path, TemplateSelection()) == path
+
+def test_non_base_selection_skips_grove_directory():
+    selection = TemplateSelection("en", "sh", ["codex"], base=False)
+
+    assert select_template_path(".grove/scripts/bash/common.sh", selection) is None
+    assert select_template_path(".codex/prompts/grove.plan.md", selection) == ".codex/prompts/grove.plan.md"
+
+@pytest.mark.parametrize("script_type, kept", [("sh", "bash"), ("ps", "powershell")])
+def test_script_variants(script_type, kept):
+    selection = TemplateSelection(script_type=script_type)
+    for variant in ("bash", "powershell"):
+        path = f".grove/scripts/{variant}/common"
+        assert (select_template_path(path, selection) == path) == (variant == kept)
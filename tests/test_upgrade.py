@@ -0,0 +1,144 @@
+"""grove upgrade: release manifests, the install record and the three-way planner."""
+
+import hashlib
+import zipfile
+
+import pytest
+
+from grove_cli.upgrade import (
+    InstallManifest,
+    TemplateFile,
+    apply_upgrade,
+    init_selections,
+    load_install_manifest,
+    plan_upgrade,
+    record_install,
+    release_manifest,
+    upgraded_manifest,
+)
+
+
+def sha(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+def make_archive(path, files):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, content in files.items():
+            info = zipfile.ZipInfo(f"grove-v1/{name}")
+            info.external_attr = (0o755 if name.endswith(".sh") else 0o644) << 16
+            zf.writestr(info, content)
+    return path
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+BASE = {
+    ".grove/scripts/bash/common.sh": "#!/bin/sh\n",
+    ".grove/scripts/powershell/common.ps1": "# ps\n",
+    ".grove/templates/en/spec-template.md": "spec en\n",
+    ".grove/templates/ja/spec-template.md": "spec ja\n",
+    ".grove/templates/agents/x.md": "agent template\n",
+    ".claude/commands/grove.specify.md": "specify\n",
+    "AGENTS.md": "agents\n",
+}
+
+
+def test_release_manifest_applies_each_archive_selection(tmp_path):
+    claude = make_archive(tmp_path / "claude.zip", BASE)
+    codex = make_archive(tmp_path / "codex.zip", {**BASE, ".claude/commands/grove.specify.md": "x", ".codex/prompts/grove.specify.md": "codex\n"})
+    selections = init_selections(["claude", "codex"], "sh", "ja")
+
+    files, sources = release_manifest([(claude, selections[0]), (codex, selections[1])])
+
+    assert sorted(files) == [
+        ".claude/commands/grove.specify.md",
+        ".codex/prompts/grove.specify.md",
+        ".grove/scripts/bash/common.sh",
+        ".grove/templates/spec-template.md",
+        "AGENTS.md",
+    ]
+    # Only the base archive provides .grove/; the language copy is moved up
+    assert files[".grove/templates/spec-template.md"].sha256 == sha("spec ja\n")
+    assert sources[".grove/templates/spec-template.md"][0] == claude
+    assert files[".grove/scripts/bash/common.sh"].mode == 0o755
+    # The codex archive's .claude/ is filtered out; its AGENTS.md wins as it is extracted last
+    assert files[".claude/commands/grove.specify.md"].sha256 == sha("specify\n")
+    assert sources["AGENTS.md"][0] == codex
+
+def test_record_install_records_archive_hashes(tmp_path):
+    """Files init replaced after extracting are recorded with the archive's hash, not their own."""
+    archive = make_archive(tmp_path / "claude.zip", BASE)
+    project = tmp_path / "project"
+    write(project / ".grove" / "templates" / "spec-template.md", "installed language template\n")
+    selection, = init_selections(["claude"], "sh", "en")
+
+    record_install(project, [(archive, selection)], release="v1", agents=["claude"], script_type="sh", language="en")
+
+    manifest = load_install_manifest(project)
+    assert manifest.release == "v1"
+    assert manifest.files[".grove/templates/spec-template.md"].sha256 == sha("spec en\n")
+    # Right after init, the release's own files are all unchanged upstream
+    assert plan_upgrade(project, manifest.files, release_manifest([(archive, selection)])[0]).unchanged == len(manifest.files)
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    for name, text in {"same": "s", "updated": "u1", "edited": "e1", "edited-too": "c1", "gone": "g", "gone-edited": "k1", "already": "a1"}.items():
+        write(root / name, text)
+    write(root / "edited", "local edit")
+    write(root / "edited-too", "local edit")
+    write(root / "gone-edited", "local edit")
+    write(root / "already", "a2")
+    return root
+
+RECORDED = {name: TemplateFile(sha(text), None) for name, text in {
+    "same": "s", "updated": "u1", "edited": "e1", "edited-too": "c1", "gone": "g", "gone-edited": "k1", "already": "a1", "deleted": "d1",
+}.items()}
+
+UPSTREAM = {name: TemplateFile(sha(text), None) for name, text in {
+    "same": "s", "updated": "u2", "edited": "e1", "edited-too": "c2", "already": "a2", "deleted": "d2", "new": "n",
+}.items()}
+
+def test_plan_upgrade_three_way(project):
+    plan = plan_upgrade(project, RECORDED, UPSTREAM)
+
+    assert plan.unchanged == 2          # same, and edited (unchanged upstream: the local edit stays)
+    assert plan.update == ["updated"]
+    assert plan.add == ["deleted", "new"]  # deleted locally, changed upstream: restored
+    assert plan.current == ["already"]
+    assert plan.conflicts == ["edited-too"]
+    assert plan.remove == ["gone"]
+    assert plan.kept == ["gone-edited"]
+
+def test_apply_upgrade_and_manifest(project, tmp_path):
+    archive = make_archive(tmp_path / "r.zip", {"updated": "u2", "edited-too": "c2", "deleted": "d2", "new": "n"})
+    selection = init_selections(["claude"], "sh", "en")[0]
+    _, sources = release_manifest([(archive, selection)])
+    plan = plan_upgrade(project, RECORDED, UPSTREAM)
+
+    written = apply_upgrade(project, plan, sources)
+
+    assert sorted(written) == ["deleted", "new", "updated"]
+    assert (project / "updated").read_text() == "u2"
+    assert (project / "edited-too").read_text() == "local edit"
+    assert not (project / "gone").exists()
+    assert (project / "gone-edited").exists()
+
+    recorded = InstallManifest("v1", ["claude"], "sh", "en", RECORDED)
+    after = upgraded_manifest(recorded, UPSTREAM, plan, release="v2")
+    assert after.release == "v2"
+    # The unresolved conflict keeps its old base, so it is reported again next time
+    assert after.files["edited-too"] == RECORDED["edited-too"]
+    assert after.files["updated"] == UPSTREAM["updated"]
+    assert "gone" not in after.files
+
+def test_force_overwrites_conflicts(project, tmp_path):
+    archive = make_archive(tmp_path / "r.zip", {"updated": "u2", "edited-too": "c2", "deleted": "d2", "new": "n"})
+    _, sources = release_manifest([(archive, init_selections(["claude"], "sh", "en")[0])])
+    plan = plan_upgrade(project, RECORDED, UPSTREAM)
+
+    apply_upgrade(project, plan, sources, force=True)
+
+    assert (project / "edited-too").read_text() == "c2"
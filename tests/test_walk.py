@@ -0,0 +1,74 @@
+"""The shared scandir walker."""
+
+import inspect
+import os
+import sys
+
+import pytest
+
+from grove_cli.docs import detect_source_directory
+from grove_cli.walk import scan_dir, walk
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for path in ["b/y.txt", "a/deep/z.txt", "a/x.txt", "top.txt", "node_modules/dep/index.js"]:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(path)
+    return tmp_path
+
+
+def test_parents_before_children_in_name_order(tree):
+    assert [listing.relative for listing in walk(tree)] == ["", "a", "a/deep", "b", "node_modules", "node_modules/dep"]
+
+def test_listing_contents(tree):
+    root = scan_dir(tree)
+
+    assert [entry.name for entry in root.entries] == ["a", "b", "node_modules", "top.txt"]
+    assert [entry.name for entry in root.dirs] == ["a", "b", "node_modules"]
+    assert [entry.name for entry in root.files] == ["top.txt"]
+    assert root.path == tree
+
+def test_pruning(tree):
+    visited = []
+    for listing in walk(tree):
+        visited.append(listing.relative)
+        listing.dirs[:] = [d for d in listing.dirs if d.name != "node_modules"]
+
+    assert visited == ["", "a", "a/deep", "b"]
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+def test_symlinked_directories_are_followed_only_on_request(tree):
+    os.symlink(tree / "a", tree / "link")
+
+    assert "link" not in [listing.relative for listing in walk(tree)]
+    assert "link/deep" in [listing.relative for listing in walk(tree, follow_symlinks=True)]
+
+def test_unlistable_directories_are_reported(tmp_path):
+    errors = []
+
+    assert list(walk(tmp_path / "missing", on_error=errors.append)) == []
+    assert isinstance(errors[0], FileNotFoundError)
+    assert list(walk(tmp_path / "missing")) == []
+
+def test_deep_trees_do_not_recurse(tmp_path):
+    depth = 200
+    (tmp_path / os.path.join(*["d"] * depth)).mkdir(parents=True)
+    limit = sys.getrecursionlimit()
+    # Far less headroom than the tree is deep
+    sys.setrecursionlimit(len(inspect.stack()) + 50)
+    try:
+        count = sum(1 for _ in walk(tmp_path))
+    finally:
+        sys.setrecursionlimit(limit)
+
+    assert count == depth + 1
+
+
+def test_detect_source_directory_by_priority(tmp_path):
+    assert detect_source_directory(tmp_path) is None
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "src").write_text("a file, not a directory")
+    assert detect_source_directory(tmp_path) == tmp_path / "lib"
+    (tmp_path / "app").mkdir()
+    assert detect_source_directory(tmp_path) == tmp_path / "app"